@@ -0,0 +1,86 @@
+"""
+tests.test_change_set
+~~~~~~~~~~~~~~~~~~~~~
+
+Tests for ``tlnetcard_python.login.ChangeSet``, against a card whose system configuration download
+and setter POSTs are mocked.
+"""
+
+# Standard library.
+import threading
+import unittest
+from unittest import mock
+# Required internal classes/functions.
+from tlnetcard_python import Login
+from tlnetcard_python.system.administration import Console, Web
+
+CONFIG = "[System]\nHTTP Port=80\nWeb Refresh=10\nSSH Port=22\n"
+
+class TestChangeSet(unittest.TestCase):
+    """ Tests for ``ChangeSet``. """
+    def setUp(self) -> None:
+        """ Creates a ``Login`` object whose downloads and POSTs are mocked. """
+        patcher = mock.patch("tlnetcard_python.login.BatchConfiguration")
+        self._batch = patcher.start()
+        self.addCleanup(patcher.stop)
+        self._batch.return_value.download_system_configuration.return_value = CONFIG
+        self._card = Login(user="admin", passwd="password", host="10.0.0.100", lazy=True)
+        self._session = mock.Mock()
+        self._card.get_session = mock.Mock(return_value=self._session)
+    def _posts(self) -> list:
+        """ Returns the endpoints and payloads POSTed so far, in order. """
+        return [(i[0][0].split("/")[-1], i[1]["data"]) for i in self._session.post.call_args_list]
+    def test_merged_payloads(self) -> None:
+        """ Payloads for the same endpoint are merged into one POST, in recorded order. """
+        with self._card.change_set() as change_set:
+            Web(self._card).set_http_port(8080)
+            Console(self._card).set_ssh_port(2222)
+            Web(self._card).set_web_refresh(30)
+            self.assertEqual(len(change_set.get_endpoints()), 2)
+            self.assertEqual(self._posts(), [])
+        posts = self._posts()
+        self.assertEqual([i[0] for i in posts], ["adm_web", "adm_console"])
+        self.assertEqual(posts[0][1]["WEB_PORT_HTTP"], "8080")
+        self.assertEqual(posts[0][1]["WEB_REFRESH"], "30")
+    def test_discarded_on_exception(self) -> None:
+        """ Nothing is sent, or held as changed, when the block raises an exception. """
+        with self.assertRaises(RuntimeError):
+            with self._card.change_set():
+                Web(self._card).set_http_port(8080)
+                raise RuntimeError()
+        self.assertEqual(self._posts(), [])
+        self.assertEqual(self._card.get_system_config()["HTTP Port"], "80")
+    def test_recording_thread_view(self) -> None:
+        """ Only the recording thread sees the recorded changes before they are sent. """
+        other = Login(user="admin", passwd="password", host="10.0.0.100", lazy=True,
+                      config_cache=self._card._config_cache) # pylint: disable=protected-access
+        seen = {}
+        with self._card.change_set():
+            Web(self._card).set_http_port(8080)
+            seen["recording"] = self._card.get_system_config()["HTTP Port"]
+            thread = threading.Thread(
+                target=lambda: seen.update(thread=self._card.get_system_config()["HTTP Port"])
+            )
+            thread.start()
+            thread.join()
+            seen["other"] = other.get_system_config()["HTTP Port"]
+        self.assertEqual(seen, {"recording": "8080", "thread": "80", "other": "80"})
+        self.assertEqual(other.get_system_config()["HTTP Port"], "8080")
+    def test_batch_threshold(self) -> None:
+        """ Enough changed endpoints are sent as a single system configuration upload. """
+        uploaded = []
+        self._batch.return_value.upload_system_configuration.side_effect = \
+            lambda path: uploaded.append(open(path, encoding="utf-8").read())
+        with self._card.change_set(batch_threshold=2):
+            Web(self._card).set_http_port(8080)
+            Console(self._card).set_ssh_port(2222)
+        self.assertEqual(self._posts(), [])
+        self.assertEqual(uploaded, ["[System]\nHTTP Port=8080\nWeb Refresh=10\nSSH Port=2222\n"])
+        # Below the threshold, the changes are POSTed.
+        with self._card.change_set(batch_threshold=2):
+            Web(self._card).set_web_refresh(30)
+        self.assertEqual([i[0] for i in self._posts()], ["adm_web"])
+        self.assertEqual(len(uploaded), 1)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+"""
+tests.test_config_cache
+~~~~~~~~~~~~~~~~~~~~~~~
+
+Tests for ``tlnetcard_python.config_cache``.
+"""
+
+# Standard library.
+import os
+from tempfile import TemporaryDirectory
+import unittest
+from unittest import mock
+# Required internal classes/functions.
+from tlnetcard_python.config_cache import ConfigCache, DiskConfigCache
+from tlnetcard_python.config_parser import parse_config
+
+CONFIG = parse_config("[System]\nHTTP Port=80\n")
+
+class TestConfigCache(unittest.TestCase):
+    """ Tests for ``ConfigCache``. """
+    def test_get_and_expiry(self) -> None:
+        """ Configurations are held for ``max_age`` seconds. """
+        cache = ConfigCache(max_age=10.0)
+        with mock.patch("tlnetcard_python.config_cache.time", return_value=100.0):
+            cache.set("system@card", CONFIG, 100.0)
+            self.assertEqual(cache.get("system@card"), (CONFIG, 100.0))
+            self.assertIsNone(cache.get("snmp@card"))
+        with mock.patch("tlnetcard_python.config_cache.time", return_value=110.0):
+            self.assertIsNone(cache.get("system@card"))
+    def test_no_expiry(self) -> None:
+        """ Configurations never expire when ``max_age`` is ``None``. """
+        cache = ConfigCache(max_age=None)
+        cache.set("system@card", CONFIG, 0.0)
+        self.assertEqual(cache.get("system@card"), (CONFIG, 0.0))
+    def test_invalidate(self) -> None:
+        """ Downloads which started before an invalidation are not held. """
+        cache = ConfigCache()
+        with mock.patch("tlnetcard_python.config_cache.time", return_value=100.0):
+            cache.set("system@card", CONFIG, 100.0)
+            cache.invalidate("system@card")
+            self.assertIsNone(cache.get("system@card"))
+            cache.set("system@card", CONFIG, 99.0)
+            self.assertIsNone(cache.get("system@card"))
+            cache.set("system@card", CONFIG, 100.0)
+            self.assertEqual(cache.get("system@card"), (CONFIG, 100.0))
+    def test_eviction(self) -> None:
+        """ The least recently used configuration is evicted first. """
+        cache = ConfigCache(max_age=None, max_entries=2)
+        cache.set("a", CONFIG, 0.0)
+        cache.set("b", CONFIG, 0.0)
+        cache.get("a")
+        cache.set("c", CONFIG, 0.0)
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("c"))
+        cache.clear()
+        self.assertIsNone(cache.get("a"))
+    def test_needs_refresh(self) -> None:
+        """ Configurations are refreshed ahead of their expiry only when asked to. """
+        with mock.patch("tlnetcard_python.config_cache.time", return_value=105.0):
+            self.assertTrue(ConfigCache(max_age=10.0, refresh_ahead=5.0).needs_refresh(100.0))
+            self.assertFalse(ConfigCache(max_age=10.0, refresh_ahead=4.0).needs_refresh(100.0))
+            self.assertFalse(ConfigCache(max_age=10.0).needs_refresh(90.0))
+    def test_get_lock(self) -> None:
+        """ The same key always gets the same lock. """
+        cache = ConfigCache()
+        self.assertIs(cache.get_lock("system@card"), cache.get_lock("system@card"))
+
+class TestDiskConfigCache(unittest.TestCase):
+    """ Tests for ``DiskConfigCache``. """
+    def test_shared_between_instances(self) -> None:
+        """ Configurations written by one instance are read by another using the directory. """
+        with TemporaryDirectory() as path:
+            DiskConfigCache(path, max_age=None).set("system@card", CONFIG, 100.0)
+            config, created = DiskConfigCache(path, max_age=None).get("system@card")
+            self.assertEqual(dict(config), dict(CONFIG))
+            self.assertEqual(created, 100.0)
+            names = os.listdir(path)
+            self.assertEqual(len(names), 1)
+            self.assertEqual(os.stat(os.path.join(path, names[0])).st_mode & 0o777, 0o600)
+    def test_unreadable_file(self) -> None:
+        """ A corrupt file holds no configuration. """
+        with TemporaryDirectory() as path:
+            cache = DiskConfigCache(path, max_age=None)
+            cache.set("system@card", CONFIG, 100.0)
+            with open(os.path.join(path, os.listdir(path)[0]), "w", encoding="utf-8") as file:
+                file.write("{")
+            self.assertIsNone(cache.get("system@card"))
+    def test_eviction(self) -> None:
+        """ At most ``max_entries`` files are kept. """
+        with TemporaryDirectory() as path:
+            cache = DiskConfigCache(path, max_age=None, max_entries=2)
+            for key in ("a", "b", "c"):
+                cache.set(key, CONFIG, 0.0)
+            self.assertEqual(len(os.listdir(path)), 2)
+            cache.clear()
+            self.assertEqual(os.listdir(path), [])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+"""
+tests.test_config_parser
+~~~~~~~~~~~~~~~~~~~~~~~~
+
+Tests for ``tlnetcard_python.config_parser``.
+"""
+
+# Standard library.
+import unittest
+# Required internal classes/functions.
+from tlnetcard_python.config_parser import check_config_values, parse_config, ParsedConfig
+
+CONFIG = ("; System configuration\n"
+          "Version=1.0\n"
+          "[System]\n"
+          "Name=TLNET\n"
+          "HTTP Port=80\n"
+          "# Comment\n"
+          "[Network]\n"
+          "IP = 10.0.0.100\n"
+          "Name=ups-01\n"
+          "not a setting\n")
+
+class TestParsedConfig(unittest.TestCase):
+    """ Tests for ``ParsedConfig`` and ``parse_config()``. """
+    def test_flat_view(self) -> None:
+        """ Keys map to their last value, and comments or lines without ``=`` are skipped. """
+        config = ParsedConfig(CONFIG)
+        self.assertEqual(config["HTTP Port"], "80")
+        self.assertEqual(config["IP"], "10.0.0.100")
+        self.assertEqual(config["Name"], "ups-01")
+        self.assertEqual(len(config), 4)
+        self.assertNotIn("not a setting", config)
+        self.assertEqual(config.get("Missing", "x"), "x")
+    def test_sections(self) -> None:
+        """ Sections are indexed in file order, and keys before any section belong to ``""``. """
+        config = ParsedConfig(CONFIG)
+        self.assertEqual(config.get_sections(), ["", "System", "Network"])
+        self.assertEqual(dict(config.get_section("")), {"Version": "1.0"})
+        self.assertEqual(config.get_section("System")["Name"], "TLNET")
+        self.assertEqual(dict(config.get_section("Missing")), {})
+        with self.assertRaises(TypeError):
+            config.get_section("System")["Name"] = "x"
+    def test_get_value(self) -> None:
+        """ Integers are returned as ``int``, other values as text. """
+        config = ParsedConfig(CONFIG)
+        self.assertEqual(config.get_value("HTTP Port"), 80)
+        self.assertEqual(config.get_value("Name"), "ups-01")
+        self.assertEqual(config.get_value("Name", section="System"), "TLNET")
+        self.assertEqual(config.get_value("Version"), "1.0")
+        self.assertIsNone(config.get_value("Missing"))
+        self.assertEqual(config.get_value("IP", section="System", default=0), 0)
+    def test_replace(self) -> None:
+        """ Values are changed on their own line or appended, leaving the original untouched. """
+        config = ParsedConfig(CONFIG)
+        changed = config.replace({"HTTP Port": "8080", "SSH Port": "22"})
+        self.assertEqual(changed["HTTP Port"], "8080")
+        self.assertEqual(changed.get_value("HTTP Port", section="System"), 8080)
+        self.assertEqual(changed["SSH Port"], "22")
+        self.assertEqual(changed.get_section("System")["Name"], "TLNET")
+        self.assertEqual(config["HTTP Port"], "80")
+        self.assertNotIn("SSH Port", config)
+    def test_replace_keeps_newlines(self) -> None:
+        """ Files with Windows line endings keep them. """
+        config = ParsedConfig("[System]\r\nHTTP Port=80\r\n")
+        self.assertEqual(config.replace({"HTTP Port": "81"}).get_text(),
+                         "[System]\r\nHTTP Port=81\r\n")
+    def test_replace_rejects_line_breaks(self) -> None:
+        """ Values with line breaks would add lines to the file, so they are refused. """
+        config = ParsedConfig(CONFIG)
+        with self.assertRaises(ValueError):
+            config.replace({"Location": "x\nIP=1.2.3.4"})
+        with self.assertRaises(ValueError):
+            check_config_values({"Location": "x\rIP=1.2.3.4"})
+        check_config_values({"Location": "x"})
+    def test_memoization(self) -> None:
+        """ A file parsed again unchanged returns the same object. """
+        self.assertIs(parse_config(CONFIG), parse_config(CONFIG))
+        self.assertIsNot(parse_config(CONFIG), parse_config(CONFIG + "Extra=1\n"))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+"""
+tests.test_desired_state
+~~~~~~~~~~~~~~~~~~~~~~~~
+
+Tests for ``tlnetcard_python.desired_state``, against a card whose system configuration download
+and setter POSTs are mocked.
+"""
+
+# Standard library.
+import unittest
+from unittest import mock
+# Required internal classes/functions.
+from tlnetcard_python import Login
+from tlnetcard_python.desired_state import DesiredState
+
+CONFIG = ("[System]\n"
+          "V6 IP=fe80::1/64\nV6 Gateway=::\nV6 DNS=::\n"
+          "HTTP Port=80\nHTTPS Port=443\nWeb Refresh=10\nSSH Port=22\n"
+          "Server1=10.0.0.2\nServer2=\n"
+          "SysLog Server=10.0.0.200\nSysLog Server2=\nSysLog Server3=\nSysLog Server4=\n"
+          "Administrator Account=admin\nAdministrator Password=password\n"
+          "Read Only Account=user\nRead Only Password=password\nRead Only Limit=1\n")
+STATE = {
+    "network": {"ipv6": {"prefix_len": 64}},
+    "web": {"http_port": 80, "https_port": 443},
+    "console": {"ssh_port": 22},
+    "time_server": {"primary_server": "10.0.0.2"},
+    "syslog": {"servers": ["10.0.0.200"]},
+    "users": {"Read Only User": {"username": "user", "wan_access": True}}
+}
+
+class TestDesiredState(unittest.TestCase):
+    """ Tests for ``DesiredState``. """
+    def setUp(self) -> None:
+        """ Creates a ``Login`` object whose downloads and POSTs are mocked. """
+        patcher = mock.patch("tlnetcard_python.login.BatchConfiguration")
+        self._batch = patcher.start()
+        self.addCleanup(patcher.stop)
+        self._batch.return_value.download_system_configuration.return_value = CONFIG
+        self._card = Login(user="admin", passwd="password", host="10.0.0.100", lazy=True)
+        self._session = mock.Mock()
+        self._card.get_session = mock.Mock(return_value=self._session)
+    def _posts(self) -> dict:
+        """ Returns the payloads POSTed so far, keyed by endpoint. """
+        return {i[0][0].split("/")[-1]: i[1]["data"] for i in self._session.post.call_args_list}
+    def test_compliant_card(self) -> None:
+        """ A compliant card gets no writes and a single configuration download. """
+        state = DesiredState(STATE)
+        self.assertEqual(state.diff(self._card), {})
+        self.assertEqual(state.apply(self._card), {})
+        self.assertEqual(self._posts(), {})
+        self.assertEqual(self._batch.return_value.download_system_configuration.call_count, 1)
+    def test_changed_settings(self) -> None:
+        """ Only the setters of changed settings are called, one POST per endpoint. """
+        state = DesiredState({"web": {"http_port": 8080, "https_port": 443, "web_refresh": 30},
+                              "console": {"ssh_port": 22},
+                              "users": {"Read Only User": {"wan_access": False}},
+                              "syslog": {"servers": ["10.0.0.200", "10.0.0.201"]}})
+        self.assertEqual(state.apply(self._card), {
+            "web.http_port": ("80", "8080"),
+            "web.web_refresh": ("10", "30"),
+            "users.Read Only User.wan_access": ("1", "0"),
+            "syslog.servers": ("10.0.0.200", "10.0.0.200, 10.0.0.201")
+        })
+        posts = self._posts()
+        self.assertEqual(sorted(posts), ["adm_syslog", "adm_user", "adm_web"])
+        self.assertEqual(posts["adm_web"]["WEB_PORT_HTTP"], "8080")
+        self.assertEqual(posts["adm_web"]["WEB_REFRESH"], "30")
+        self.assertEqual(posts["adm_user"], {"account3": "user", "passwd3": "password",
+                                             "limit3": "0"})
+        self.assertEqual(posts["adm_syslog"]["SLG_SERVER2"], "10.0.0.201")
+        # The applied settings are held, so applying again writes nothing.
+        self._session.post.reset_mock()
+        self.assertEqual(state.apply(self._card), {})
+        self.assertEqual(self._posts(), {})
+    def test_connection_settings_last(self) -> None:
+        """ The address and web ports are written after every other setting. """
+        DesiredState({"network": {"ipv4": {"ip_addr": "10.0.0.101"}},
+                      "web": {"http_port": 8080},
+                      "console": {"ssh_port": 2222},
+                      "syslog": {"servers": ["10.0.0.201"]}}).apply(self._card)
+        posts = [i[0][0].split("/")[-1] for i in self._session.post.call_args_list]
+        self.assertEqual(posts, ["adm_console", "adm_syslog", "adm_web", "adm_ipconfig"])
+        self.assertEqual(self._posts()["adm_ipconfig"]["SYS_IP"], "10.0.0.101")
+    def test_setter_defaults(self) -> None:
+        """ Values neither the document nor the card has fall back to the setter's defaults. """
+        DesiredState({"users": {"Administrator": {"username": "root"}}}).apply(self._card)
+        self.assertEqual(self._posts()["adm_user"], {"account1": "root", "passwd1": "password",
+                                                     "limit1": "0"})
+    def test_missing_required_value(self) -> None:
+        """ A required value neither the document nor the card has is refused before writing. """
+        with self.assertRaises(ValueError):
+            DesiredState({"radius": {"port": 1813}}).apply(self._card)
+        self.assertEqual(self._posts(), {})
+    def test_document_validation(self) -> None:
+        """ Unknown sections and fields are refused, while empty sections are allowed. """
+        for state in ({"web": {"port": 80}}, {"unknown": {}}, {"users": {"Root": {}}},
+                      {"users": {"username": "root"}},
+                      {"syslog": {"servers": ["a", "b", "c", "d", "e"]}}):
+            with self.assertRaises(ValueError):
+                DesiredState(state)
+        self.assertEqual(DesiredState({"users": {}, "network": {}, "web": {}}).diff(self._card),
+                         {})
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+"""
+tests.test_session_store
+~~~~~~~~~~~~~~~~~~~~~~~~
+
+Tests for ``tlnetcard_python.session_store``.
+"""
+
+# Standard library.
+import json
+import os
+from tempfile import TemporaryDirectory
+import unittest
+from unittest import mock
+# Required internal classes/functions.
+from tlnetcard_python.session_store import SessionStore
+
+URL = "https://10.0.0.100:443"
+
+class TestSessionStore(unittest.TestCase):
+    """ Tests for ``SessionStore``. """
+    def setUp(self) -> None:
+        """ Creates a store in a temporary directory. """
+        self._directory = TemporaryDirectory()
+        self._path = os.path.join(self._directory.name, "sessions.json")
+        self._store = SessionStore(self._path, max_age=60.0)
+    def tearDown(self) -> None:
+        """ Removes the temporary directory. """
+        self._directory.cleanup()
+    def test_set_and_get(self) -> None:
+        """ Stored cookies are returned for the same card and user only. """
+        self._store.set(URL, "admin", {"session": "abc"})
+        self.assertEqual(self._store.get(URL, "admin"), {"session": "abc"})
+        self.assertIsNone(self._store.get(URL, "localadmin"))
+        self.assertEqual(os.stat(self._path).st_mode & 0o777, 0o600)
+    def test_expiry(self) -> None:
+        """ Sessions older than ``max_age`` seconds are ignored, and dropped on the next write. """
+        with mock.patch("tlnetcard_python.session_store.time", return_value=100.0):
+            self._store.set(URL, "admin", {"session": "abc"})
+        with mock.patch("tlnetcard_python.session_store.time", return_value=160.0):
+            self.assertIsNone(self._store.get(URL, "admin"))
+            self._store.set(URL, "localadmin", {"session": "def"})
+        with open(self._path, "r", encoding="utf-8") as file:
+            self.assertEqual(list(json.load(file)), ["localadmin@" + URL])
+    def test_delete_and_clear(self) -> None:
+        """ Deleted sessions are no longer returned. """
+        self._store.set(URL, "admin", {"session": "abc"})
+        self._store.set(URL, "localadmin", {"session": "def"})
+        self._store.delete(URL, "admin")
+        self.assertIsNone(self._store.get(URL, "admin"))
+        self.assertIsNotNone(self._store.get(URL, "localadmin"))
+        self._store.clear()
+        self.assertIsNone(self._store.get(URL, "localadmin"))
+    def test_malformed_entries(self) -> None:
+        """ Unreadable files and malformed entries hold no sessions. """
+        with open(self._path, "w", encoding="utf-8") as file:
+            json.dump({"admin@" + URL: {"cookies": {"session": "abc"}},
+                       "localadmin@" + URL: "junk"}, file)
+        self.assertIsNone(self._store.get(URL, "admin"))
+        self.assertIsNone(self._store.get(URL, "localadmin"))
+        self._store.set(URL, "user", {"session": "ghi"})
+        self.assertEqual(self._store.get(URL, "user"), {"session": "ghi"})
+        with open(self._path, "w", encoding="utf-8") as file:
+            file.write("[")
+        self.assertIsNone(self._store.get(URL, "user"))
+
+if __name__ == "__main__":
+    unittest.main()
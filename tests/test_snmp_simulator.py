@@ -0,0 +1,87 @@
+"""
+tests.test_snmp_simulator
+~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Tests for the SNMP functions of ``tlnetcard_python.monitor.information``, against the SNMP agent of
+``SnmpSimulator``.
+"""
+
+# Standard library.
+import asyncio
+import unittest
+from unittest import mock
+# Required internal classes/functions.
+from tlnetcard_python.monitor.information import information, oids
+from tlnetcard_python.monitor.information.information import get_with_snmp, walk_with_snmp
+from tlnetcard_python.monitor.information.simulator import SnmpSimulator
+from tlnetcard_python.monitor.information.snmp_cache import SnmpEngineRegistry
+try:
+    from tlnetcard_python.monitor.information.snmp_async import get_with_snmp_async
+except (AttributeError, ImportError):
+    # pysnmp's asyncio carrier cannot be imported on every Python version.
+    get_with_snmp_async = None
+
+CREDENTIALS = ("admin", "imadethisup", "imadethisuptoo")
+PORT = 16161
+SNMP_IDS = [oids.UPS_IDENT_MODEL, oids.UPS_BATTERY_STATUS, oids.UPS_CHARGE_REMAINING,
+            oids.IF_PHYS_ADDRESS_2]
+
+class TestSnmpSimulator(unittest.TestCase):
+    """ Tests for ``get_with_snmp()`` and friends against a simulated card. """
+    @classmethod
+    def setUpClass(cls) -> None:
+        """ Starts a simulated card with three table lines, refusing GETs of over two SNMP IDs. """
+        cls._simulator = SnmpSimulator(*CREDENTIALS, port=PORT, lines=3, max_var_binds=2)
+        cls._simulator.start()
+    @classmethod
+    def tearDownClass(cls) -> None:
+        """ Stops the simulated card. """
+        cls._simulator.stop()
+    def setUp(self) -> None:
+        """ Creates a registry of SNMP engines for the test. """
+        self._registry = SnmpEngineRegistry()
+        self.addCleanup(self._registry.close)
+    def _get(self, snmp_ids: list, **kwargs) -> list:
+        """ Gets the provided SNMP IDs from the simulated card. """
+        return get_with_snmp("127.0.0.1", snmp_ids, *CREDENTIALS, timeout=2.0,
+                             registry=self._registry, port=PORT, **kwargs)
+    def test_batching(self) -> None:
+        """ SNMP IDs are requested together, and split in halves when the agent reports tooBig. """
+        with mock.patch.object(information, "getCmd", wraps=information.getCmd) as get_cmd:
+            self.assertEqual(self._get(SNMP_IDS[1:3], typed=True), [2, 100])
+            self.assertEqual(get_cmd.call_count, 1)
+            get_cmd.reset_mock()
+            self.assertEqual(self._get(SNMP_IDS, typed=True)[1:3], [2, 100])
+            self.assertEqual(get_cmd.call_count, 3)
+            get_cmd.reset_mock()
+            self.assertEqual(self._get(SNMP_IDS, typed=True, batch=False)[1:3], [2, 100])
+            self.assertEqual(get_cmd.call_count, len(SNMP_IDS))
+    def test_typed_values(self) -> None:
+        """ Typed values are native Python values, and plain values are strings. """
+        self.assertEqual(self._get(SNMP_IDS, typed=True),
+                         [b"SU1500RTXLCD2U", 2, 100, b"\x00\x06\x67\x06\x08\xc0"])
+        values = self._get(SNMP_IDS)
+        self.assertTrue(all(isinstance(i, str) for i in values))
+        self.assertEqual(values[0].strip(), "SU1500RTXLCD2U")
+        self.assertEqual(oids.mac_decoder(self._get(SNMP_IDS[3:], typed=True)[0]),
+                         "00-06-67-06-08-c0")
+    def test_walk(self) -> None:
+        """ Every line of a table is walked, even past the first GETBULK PDU. """
+        columns = [oids.UPS_INPUT_VOLTAGE, oids.UPS_INPUT_CURRENT]
+        for max_repetitions in (1, 3, 5):
+            rows = walk_with_snmp("127.0.0.1", oids.UPS_INPUT_NUM_LINES, columns, *CREDENTIALS,
+                                  timeout=2.0, max_repetitions=max_repetitions,
+                                  registry=self._registry, typed=True, port=PORT)
+            self.assertEqual(rows, [[120, 34]] * 3)
+    @unittest.skipIf(get_with_snmp_async is None, "pysnmp's asyncio carrier is unavailable")
+    def test_async(self) -> None:
+        """ The asyncio API gets the same values, splitting on tooBig as well. """
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+        values = loop.run_until_complete(get_with_snmp_async(
+            "127.0.0.1", SNMP_IDS, *CREDENTIALS, timeout=2.0, typed=True, port=PORT
+        ))
+        self.assertEqual(values[1:3], [2, 100])
+
+if __name__ == "__main__":
+    unittest.main()
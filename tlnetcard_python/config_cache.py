@@ -0,0 +1,303 @@
+"""
+tlnetcard_python.config_cache
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Provides the ``ConfigCache`` object, which holds the SNMP and system configurations downloaded from
+TLNET Supervisors in memory so that every ``Login`` object to the same card can share them, and the
+``DiskConfigCache`` object, which holds them in a directory so that they are also shared between
+processes (for example, successive runs of a short-lived script).
+"""
+
+# Standard library.
+from collections import OrderedDict
+from hashlib import sha1
+import json
+import os
+from threading import Lock, RLock
+from time import time
+from typing import Tuple
+# Required internal classes/functions.
+from tlnetcard_python.config_parser import parse_config, ParsedConfig
+
+# Number of locks shared by every key of a cache (see get_lock()).
+_LOCK_STRIPES = 64
+
+class ConfigCache:
+    """
+    An in-memory cache of configurations keyed by card (see ``Login.get_system_config()``).
+    Configurations are held for ``max_age`` seconds, and at most ``max_entries`` of them are held,
+    the least recently used being evicted first, so memory stays bounded no matter how many cards
+    are managed. When ``refresh_ahead`` is set, a configuration which will expire within that many
+    seconds is downloaded again in the background, while callers keep getting the one held. This
+    object is thread-safe, and can be shared by any number of ``Login`` objects.
+
+    Basic Usage:
+
+    >>> from tlnetcard_python import Login
+    >>> from tlnetcard_python.config_cache import ConfigCache
+    >>> from tlnetcard_python.system.administration import Ftp
+    >>> cache = ConfigCache(max_age=600.0, max_entries=5000, refresh_ahead=60.0)
+    >>> card = Login(user="admin", passwd="password", host="10.0.0.100", config_cache=cache)
+    >>> Ftp(card).get_ftp_port()
+    21
+    >>> # A new Login object to the same card shares the system configuration downloaded above.
+    >>> card = Login(user="admin", passwd="password", host="10.0.0.100", config_cache=cache)
+    >>> Ftp(card).get_ftp_port()
+    21
+    """
+    def __init__(self, max_age: float = 300.0, max_entries: int = 1024,
+                 refresh_ahead: float = 0.0) -> None:
+        """
+        Initializes the ``ConfigCache`` object. Returns ``None``.
+
+        :param max_age: (optional) The number of seconds a configuration is held before it is
+        downloaded again. When set to ``None``, configurations never expire.
+        :param max_entries: (optional) The maximum number of configurations held.
+        :param refresh_ahead: (optional) The number of seconds before a configuration expires at
+        which it is downloaded again in the background. When set to ``0``, configurations are only
+        downloaded once they have expired.
+        :rtype: ``None``
+        """
+        self._max_age = max_age
+        self._max_entries = max_entries
+        self._refresh_ahead = refresh_ahead
+        self._lock = RLock()
+        self._locks = [Lock() for _ in range(_LOCK_STRIPES)]
+        self._entries = OrderedDict()
+    def clear(self) -> None:
+        """
+        Forgets every configuration. Returns ``None``.
+
+        :rtype: ``None``
+        """
+        with self._lock:
+            self._entries.clear()
+    def get(self, key: str) -> Tuple[ParsedConfig, float]:
+        """
+        Returns the configuration held for the provided key along with the time (as returned by
+        ``time.time()``) its download started, or ``None`` if no configuration is held (or it has
+        expired, or was invalidated). Returns ``Tuple[ParsedConfig, float]``.
+
+        :param key: The key of the configuration.
+        :rtype: ``Tuple[ParsedConfig, float]``
+        """
+        entry = self._load(key)
+        if entry is None or entry[0] is None or self._is_expired(entry[1], 0.0):
+            return None
+        return entry
+    def get_lock(self, key: str) -> Lock:
+        """
+        Returns the lock which must be held while the configuration for the provided key is
+        downloaded, so that only one download of it runs at a time. Keys share a fixed number of
+        locks, so the memory they use is bounded. Returns ``threading.Lock``.
+
+        :param key: The key of the configuration.
+        :rtype: ``threading.Lock``
+        """
+        return self._locks[int(sha1(key.encode('utf-8')).hexdigest(), 16) % _LOCK_STRIPES]
+    def get_max_age(self) -> float:
+        """
+        Returns the number of seconds a configuration is held before it is downloaded again.
+
+        :rtype: ``float``
+        """
+        return self._max_age
+    def invalidate(self, key: str) -> None:
+        """
+        Forgets the configuration held for the provided key, because the card's configuration has
+        changed. Configurations whose download started before this call are not held afterwards.
+        Returns ``None``.
+
+        :param key: The key of the configuration.
+        :rtype: ``None``
+        """
+        self._store(key, (None, time()))
+    def needs_refresh(self, created: float) -> bool:
+        """
+        Checks whether a configuration whose download started at the provided time should be
+        downloaded again in the background (see ``refresh_ahead``). Returns ``bool``.
+
+        :param created: The time its download started (as returned by ``time.time()``).
+        :rtype: ``bool``
+        """
+        return self._refresh_ahead > 0 and self._is_expired(created, self._refresh_ahead)
+    def set(self, key: str, config: ParsedConfig, created: float) -> None:
+        """
+        Holds the provided configuration for the provided key, unless the key was invalidated after
+        its download started. Returns ``None``.
+
+        :param key: The key of the configuration.
+        :param config: The configuration.
+        :param created: The time its download started (as returned by ``time.time()``).
+        :rtype: ``None``
+        """
+        with self._lock:
+            entry = self._load(key)
+            if entry is not None and entry[0] is None and entry[1] > created:
+                return
+            self._store(key, (config, created))
+    def set_max_age(self, max_age: float) -> None:
+        """
+        Sets the number of seconds a configuration is held before it is downloaded again. Returns
+        ``None``.
+
+        :param max_age: The number of seconds. When set to ``None``, configurations never expire.
+        :rtype: ``None``
+        """
+        self._max_age = max_age
+    def _is_expired(self, created: float, margin: float) -> bool:
+        """
+        Checks whether a configuration whose download started at the provided time is older than
+        ``max_age`` seconds less the provided margin. Returns ``bool``.
+
+        :param created: The time its download started (as returned by ``time.time()``).
+        :param margin: The number of seconds before expiry at which it counts as expired.
+        :rtype: ``bool``
+        """
+        return self._max_age is not None and time() - created >= self._max_age - margin
+    def _load(self, key: str) -> Tuple[ParsedConfig, float]:
+        """
+        Returns the entry held for the provided key (a configuration, or ``None`` if the key was
+        invalidated, along with its time), or ``None`` if there is none. Returns
+        ``Tuple[ParsedConfig, float]``.
+
+        :param key: The key of the configuration.
+        :rtype: ``Tuple[ParsedConfig, float]``
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+        return entry
+    def _store(self, key: str, entry: Tuple[ParsedConfig, float]) -> None:
+        """
+        Holds the provided entry for the provided key, evicting the least recently used entries if
+        more than ``max_entries`` are held. Returns ``None``.
+
+        :param key: The key of the configuration.
+        :param entry: The configuration (or ``None`` if the key was invalidated) and its time.
+        :rtype: ``None``
+        """
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+class DiskConfigCache(ConfigCache):
+    """
+    A ``ConfigCache`` which holds configurations in a directory (one file per configuration), so
+    that they are shared by every process using the same directory. The files are only readable by
+    their owner, as configurations hold passwords. See ``ConfigCache`` for the other parameters.
+
+    Basic Usage:
+
+    >>> from tlnetcard_python import Login
+    >>> from tlnetcard_python.config_cache import DiskConfigCache
+    >>> cache = DiskConfigCache("/var/cache/ups-inventory", max_age=3600.0)
+    >>> # Only downloads the system configuration if no run in the last hour did.
+    >>> card = Login(user="admin", passwd="password", host="10.0.0.100", config_cache=cache)
+    """
+    def __init__(self, path: str, max_age: float = 300.0, max_entries: int = 1024,
+                 refresh_ahead: float = 0.0) -> None:
+        """
+        Initializes the ``DiskConfigCache`` object, creating its directory if needed. Returns
+        ``None``.
+
+        :param path: The directory holding the configurations.
+        :param max_age: (optional) The number of seconds a configuration is held before it is
+        downloaded again. When set to ``None``, configurations never expire.
+        :param max_entries: (optional) The maximum number of configurations held.
+        :param refresh_ahead: (optional) The number of seconds before a configuration expires at
+        which it is downloaded again in the background.
+        :rtype: ``None``
+        """
+        super().__init__(max_age, max_entries, refresh_ahead)
+        self._path = path
+        os.makedirs(path, mode=0o700, exist_ok=True)
+    def clear(self) -> None:
+        """
+        Forgets every configuration. Returns ``None``.
+
+        :rtype: ``None``
+        """
+        with self._lock:
+            for name in os.listdir(self._path):
+                if name.endswith(".json"):
+                    self._remove(os.path.join(self._path, name))
+    def _file_path(self, key: str) -> str:
+        """
+        Returns the path of the file holding the configuration for the provided key.
+
+        :param key: The key of the configuration.
+        :rtype: ``str``
+        """
+        return os.path.join(self._path, sha1(key.encode('utf-8')).hexdigest() + ".json")
+    def _load(self, key: str) -> Tuple[ParsedConfig, float]:
+        """
+        Reads the entry for the provided key from its file. A missing or unreadable file holds no
+        entry. Returns ``Tuple[ParsedConfig, float]``.
+
+        :param key: The key of the configuration.
+        :rtype: ``Tuple[ParsedConfig, float]``
+        """
+        try:
+            with open(self._file_path(key), "r", encoding="utf-8") as file:
+                entry = json.load(file)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or entry.get('key') != key:
+            return None
+        # Configurations are held as the downloaded file, which is only parsed again if no
+        # identical file was parsed recently (see parse_config()).
+        text = entry.get('text')
+        return None if text is None else parse_config(text), entry.get('created', 0.0)
+    def _store(self, key: str, entry: Tuple[ParsedConfig, float]) -> None:
+        """
+        Writes the entry for the provided key to its file (next to it first, then moved into place,
+        so other processes never read a partly written file), evicting the least recently written
+        files if more than ``max_entries`` are held. Returns ``None``.
+
+        :param key: The key of the configuration.
+        :param entry: The configuration (or ``None`` if the key was invalidated) and its time.
+        :rtype: ``None``
+        """
+        file_path = self._file_path(key)
+        temp_path = file_path + "." + str(os.getpid()) + ".tmp"
+        descriptor = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(descriptor, "w", encoding="utf-8") as file:
+            text = None if entry[0] is None else entry[0].get_text()
+            json.dump({'key': key, 'text': text, 'created': entry[1]}, file)
+        os.replace(temp_path, file_path)
+
+        # Evicting the oldest files.
+        files = [os.path.join(self._path, i) for i in os.listdir(self._path) if i.endswith(".json")]
+        if len(files) > self._max_entries:
+            files.sort(key=self._mtime)
+            for i in files[:len(files) - self._max_entries]:
+                self._remove(i)
+    @staticmethod
+    def _mtime(file_path: str) -> float:
+        """
+        Returns the time the provided file was last written, or ``0`` if it no longer exists.
+
+        :param file_path: The path of the file.
+        :rtype: ``float``
+        """
+        try:
+            return os.path.getmtime(file_path)
+        except OSError:
+            return 0.0
+    @staticmethod
+    def _remove(file_path: str) -> None:
+        """
+        Removes the provided file, ignoring files which another process already removed. Returns
+        ``None``.
+
+        :param file_path: The path of the file.
+        :rtype: ``None``
+        """
+        try:
+            os.remove(file_path)
+        except OSError:
+            pass
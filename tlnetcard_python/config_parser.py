@@ -0,0 +1,211 @@
+"""
+tlnetcard_python.config_parser
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Provides the ``parse_config()`` function, which parses the SNMP and system configuration files
+downloaded from TLNET Supervisors (see ``BatchConfiguration``) into ``ParsedConfig`` objects, and
+remembers the most recently parsed files so that a file downloaded again unchanged is not parsed
+again.
+"""
+
+# Standard library.
+from collections import OrderedDict
+from collections.abc import Mapping
+from hashlib import sha1
+import re
+from threading import Lock
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Union
+
+# Values which are held as integers as well as text (see ParsedConfig.get_value()).
+_INTEGER = re.compile(r"^-?[0-9]+$")
+# Characters which would end a line of a configuration file (see ParsedConfig.replace()).
+_LINE_BREAK = re.compile(r"[\r\n]")
+# Number of parsed files remembered by parse_config(), and the files themselves (by content hash).
+_MAX_PARSED = 64
+_PARSED = OrderedDict()
+_PARSED_LOCK = Lock()
+
+class ParsedConfig(Mapping):
+    """
+    An immutable, indexed configuration file. Works as a read-only dictionary mapping every key
+    to its value as text (keys set in more than one section map to their last value, as they did
+    before configurations were parsed by section), and also indexes values by section and key.
+    Values which are integers are also held as ``int`` (see ``get_value()``). Every lookup is a
+    single dictionary lookup. Use ``parse_config()`` to create one.
+
+    Basic Usage:
+
+    >>> from tlnetcard_python import Login
+    >>> card = Login(user="admin", passwd="password", host="10.0.0.100")
+    >>> config = card.get_system_config()
+    >>> config["FTP Port"]
+    '21'
+    >>> config.get_value("FTP Port")
+    21
+    """
+    __slots__ = ('_flat', '_lines', '_sections', '_text', '_typed')
+    def __init__(self, text: str) -> None:
+        """
+        Initializes the ``ParsedConfig`` object by parsing the provided configuration file in a
+        single pass. Lines which are empty, comments (starting with ``;`` or ``#``) or have no
+        ``=`` are skipped, and keys found before the first section belong to the section ``""``.
+        Returns ``None``.
+
+        :param text: The configuration file.
+        :rtype: ``None``
+        """
+        self._text = text
+        self._flat = {}
+        self._lines = {}
+        self._typed = {}
+        sections = OrderedDict()
+        section = sections.setdefault("", {})
+        name = ""
+        for number, line in enumerate(text.splitlines()):
+            line = line.strip()
+            if line == "" or line[0] in ";#":
+                continue
+            if line[0] == "[" and line[-1] == "]":
+                name = line[1:-1].strip()
+                section = sections.setdefault(name, {})
+                continue
+            key, equals, value = line.partition("=")
+            if equals == "":
+                continue
+            key = key.strip()
+            value = value.strip()
+            section[key] = value
+            self._flat[key] = value
+            self._lines[key] = (number, name)
+            if _INTEGER.match(value):
+                self._typed[(name, key)] = int(value)
+        if not sections[""]:
+            del sections[""]
+        self._sections = OrderedDict((i, MappingProxyType(j)) for i, j in sections.items())
+    def __getitem__(self, key: str) -> str:
+        """
+        Returns the value of the provided key as text, raising ``KeyError`` if it is not set.
+
+        :param key: The key.
+        :rtype: ``str``
+        """
+        return self._flat[key]
+    def __iter__(self) -> Iterator[str]:
+        """
+        Iterates over every key. Returns ``Iterator[str]``.
+
+        :rtype: ``Iterator[str]``
+        """
+        return iter(self._flat)
+    def __len__(self) -> int:
+        """
+        Returns the number of keys.
+
+        :rtype: ``int``
+        """
+        return len(self._flat)
+    def __repr__(self) -> str:
+        """
+        Returns a representation of the object.
+
+        :rtype: ``str``
+        """
+        return "ParsedConfig(" + repr(self._flat) + ")"
+    def get_section(self, section: str) -> Mapping:
+        """
+        Returns the keys and values (as text) of the provided section as a read-only dictionary,
+        which is empty if the section does not exist. Returns ``Mapping[str, str]``.
+
+        :param section: The name of the section, without brackets.
+        :rtype: ``Mapping[str, str]``
+        """
+        return self._sections.get(section, MappingProxyType({}))
+    def get_sections(self) -> List[str]:
+        """
+        Returns the names of the sections, in the order of the configuration file.
+
+        :rtype: ``List[str]``
+        """
+        return list(self._sections)
+    def get_text(self) -> str:
+        """
+        Returns the configuration file this object was parsed from.
+
+        :rtype: ``str``
+        """
+        return self._text
+    def get_value(self, key: str, section: str = None, default: Any = None) -> Union[int, str]:
+        """
+        Returns the value of the provided key, as an ``int`` if it is an integer and as text
+        otherwise, or ``default`` if the key is not set. Returns ``Union[int, str]``.
+
+        :param key: The key.
+        :param section: (optional) The section of the key. When not provided, the key is looked up
+        as with ``config[key]``.
+        :param default: (optional) The value returned if the key is not set.
+        :rtype: ``Union[int, str]``
+        """
+        if section is None:
+            if key not in self._flat:
+                return default
+            section = self._lines[key][1]
+        elif key not in self.get_section(section):
+            return default
+        typed = self._typed.get((section, key))
+        return self._sections[section][key] if typed is None else typed
+    def replace(self, changes: Dict[str, str]) -> "ParsedConfig":
+        """
+        Returns a copy of this configuration with the provided values changed (on the line which
+        sets each key, so other sections are left alone) or, for keys which are not set, added at
+        its end. This object is not modified. Raises ``ValueError`` if a key or value contains a
+        line break, as it would add lines to the configuration file. Returns ``ParsedConfig``.
+
+        :param changes: The changed values as text, keyed as with ``config[key]``.
+        :rtype: ``ParsedConfig``
+        """
+        check_config_values(changes)
+        newline = "\r\n" if "\r\n" in self._text else "\n"
+        lines = self._text.splitlines()
+        for key in changes:
+            if key in self._lines:
+                lines[self._lines[key][0]] = key + "=" + changes[key]
+            else:
+                lines.append(key + "=" + changes[key])
+        return parse_config(newline.join(lines) + newline)
+
+def check_config_values(changes: Dict[str, str]) -> None:
+    """
+    Checks that the provided values can be written into a configuration file, raising
+    ``ValueError`` if a key or value contains a line break (which would add lines to the file).
+    Returns ``None``.
+
+    :param changes: The values as text, keyed as with ``config[key]``.
+    :rtype: ``None``
+    """
+    for key in changes:
+        if _LINE_BREAK.search(key) or _LINE_BREAK.search(changes[key]):
+            raise ValueError("Configuration values cannot contain line breaks: " + repr(key))
+def parse_config(text: str) -> ParsedConfig:
+    """
+    Parses the provided configuration file into a ``ParsedConfig`` object. The most recently
+    parsed files are remembered by the hash of their content, so a configuration downloaded again
+    unchanged returns the same (immutable) object without being parsed again. This function is
+    thread-safe. Returns ``ParsedConfig``.
+
+    :param text: The configuration file.
+    :rtype: ``ParsedConfig``
+    """
+    digest = sha1(text.encode('utf-8')).digest()
+    with _PARSED_LOCK:
+        config = _PARSED.get(digest)
+        if config is not None:
+            _PARSED.move_to_end(digest)
+            return config
+    # Parsing outside of the lock, so that other files can be looked up meanwhile.
+    config = ParsedConfig(text)
+    with _PARSED_LOCK:
+        _PARSED[digest] = config
+        while len(_PARSED) > _MAX_PARSED:
+            _PARSED.popitem(last=False)
+    return config
@@ -0,0 +1,323 @@
+"""
+tlnetcard_python.desired_state
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Provides the ``DesiredState`` object, which compares a document describing how a TLNET Supervisor
+should be configured against its system configuration, and applies only the settings which differ
+(with the payloads of the existing setters, coalesced by a ``ChangeSet``).
+"""
+
+# Standard library.
+from inspect import Parameter, signature
+from typing import Any, Callable, Dict, List, Tuple
+# Required internal classes/functions.
+from tlnetcard_python.config_parser import ParsedConfig
+from tlnetcard_python.login import Login
+from tlnetcard_python.system.administration import Console, Syslog, TcpIp, TimeServer, UserManager
+from tlnetcard_python.system.administration import Web
+
+# The user types of UserManager.set_user(), and the names the system configuration uses for them.
+_USERS = (("Administrator", "Administrator"), ("Device Manager", "Device Manager"),
+          ("Read Only User", "Read Only"))
+# The settings of a desired-state document, grouped by the setter which changes them: the path of
+# each group in the document, the setter (and its fixed arguments), and the fields of the group
+# mapped to the parameter of the setter they are passed as and the system config key holding them.
+_SETTERS = (
+    (("console",), Console, "set_ssh_port", {}, {"ssh_port": ("port", "SSH Port")}),
+    (("console",), Console, "set_telnet_port", {}, {"telnet_port": ("port", "Telnet Port")}),
+    (("time_server",), TimeServer, "set_primary_server", {},
+     {"primary_server": ("server", "Server1")}),
+    (("time_server",), TimeServer, "set_secondary_server", {},
+     {"secondary_server": ("server", "Server2")}),
+    (("radius",), UserManager, "set_server_info", {},
+     {"server": ("server", "RADIUS Server"), "secret": ("secret", "RADIUS Secret"),
+      "port": ("port", "RADIUS Port")}),
+) + tuple(
+    (("users", user), UserManager, "set_user", {"user": user},
+     {"username": ("username", name + " Account"), "passwd": ("passwd", name + " Password"),
+      "wan_access": ("wan_access", name + " Limit")}) for user, name in _USERS
+) + (
+    (("web",), Web, "set_http_port", {}, {"http_port": ("port", "HTTP Port")}),
+    (("web",), Web, "set_https_port", {}, {"https_port": ("port", "HTTPS Port")}),
+    (("web",), Web, "set_web_refresh", {}, {"web_refresh": ("seconds", "Web Refresh")}),
+    (("network", "ipv4"), TcpIp, "set_ipv4_info", {},
+     {"ip_addr": ("ip_addr", "IP"), "mask": ("mask", "Mask"), "gateway": ("gateway", "Gateway"),
+      "dns_ip": ("dns_ip", "DNS IP"), "domain": ("domain", "Domain")}),
+    (("network", "ipv6"), TcpIp, "set_ipv6_info", {},
+     {"ip_addr": ("ip_addr", "V6 IP"), "prefix_len": ("prefix_len", "V6 IP"),
+      "gateway": ("gateway", "V6 Gateway"), "dns_ip": ("dns_ip", "V6 DNS")}),
+    (("network", "system"), TcpIp, "set_system_info", {},
+     {"name": ("name", "Name"), "contact": ("contact", "Contact"),
+      "location": ("location", "Location")})
+)
+# The setters writing the endpoints which change how the card is reached (its web ports and
+# addresses). They are called last, as the POSTs after them would go to the old port or address.
+_CONNECTION_SETTERS = (Web, TcpIp)
+# The system config keys holding the syslog servers (see Syslog.get_servers()).
+_SYSLOG_SERVERS = ("SysLog Server", "SysLog Server2", "SysLog Server3", "SysLog Server4")
+
+class DesiredState:
+    """
+    A desired-state document for a TLNET Supervisor. The document maps sections (``"network"``,
+    ``"web"``, ``"console"``, ``"time_server"``, ``"syslog"``, ``"users"`` and ``"radius"``) to the
+    values they should have; any value left out is left as it is. ``diff()`` compares the document
+    against the system configuration held by a ``Login`` object, and ``apply()`` calls only the
+    setters whose values differ, in a single change set (see ``Login.change_set()``), so applying
+    it to a compliant card makes no writes and at most one configuration download.
+
+    Basic Usage:
+
+    >>> from tlnetcard_python import Login
+    >>> from tlnetcard_python.desired_state import DesiredState
+    >>> state = DesiredState({
+    >>>     "web": {"http_port": 80, "https_port": 443},
+    >>>     "console": {"ssh_port": 22},
+    >>>     "time_server": {"primary_server": "10.0.0.2"},
+    >>>     "syslog": {"servers": ["10.0.0.200"]},
+    >>>     "users": {"Administrator": {"username": "admin", "passwd": "password"}}
+    >>> })
+    >>> card = Login(user="admin", passwd="password", host="10.0.0.100")
+    >>> state.apply(card)
+    {'time_server.primary_server': ('pool.ntp.org', '10.0.0.2')}
+    >>> state.apply(card)
+    {}
+    """
+    def __init__(self, state: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Initializes the ``DesiredState`` object, raising ``ValueError`` if the document has any
+        unknown section or field. Returns ``None``.
+
+        :param state: The desired-state document. ``"network"`` holds the ``"ipv4"``, ``"ipv6"``
+        and ``"system"`` groups, whose fields are the parameters of ``TcpIp.set_ipv4_info()``,
+        ``TcpIp.set_ipv6_info()`` and ``TcpIp.set_system_info()``. ``"web"`` holds
+        ``"http_port"``, ``"https_port"`` and ``"web_refresh"``, ``"console"`` holds
+        ``"ssh_port"`` and ``"telnet_port"``, ``"time_server"`` holds ``"primary_server"`` and
+        ``"secondary_server"``, and ``"syslog"`` holds ``"servers"`` (a list of at most 4
+        servers). ``"users"`` maps user types (see ``UserManager.set_user()``) to their
+        ``"username"``, ``"passwd"`` and ``"wan_access"``, and ``"radius"`` holds the parameters of
+        ``UserManager.set_server_info()``.
+        :rtype: ``None``
+        """
+        # Collecting every known path and field, and checking the document against them.
+        known = {("syslog",): {"servers"}}
+        for path, _, _, _, fields in _SETTERS:
+            known.setdefault(path, set()).update(fields)
+        parents = {i[:j] for i in known for j in range(1, len(i))}
+        unknown = []
+        for path, values in self._walk(state, ()):
+            if path in known:
+                unknown.extend(".".join(path + (i,)) for i in values if i not in known[path])
+            elif path in parents:
+                # Sections holding groups (e.g. "users") may be empty, but hold no fields.
+                unknown.extend(".".join(path + (i,)) for i in values)
+            else:
+                unknown.append(".".join(path))
+        if unknown:
+            raise ValueError("Unknown desired state settings: " + ", ".join(unknown))
+        servers = state.get("syslog", {}).get("servers", [])
+        if len(servers) > len(_SYSLOG_SERVERS):
+            raise ValueError("At most " + str(len(_SYSLOG_SERVERS)) + " syslog servers are "
+                             "supported.")
+        self._state = state
+    def apply(self, login_object: Login, force: bool = False,
+              batch_threshold: int = None) -> Dict[str, Tuple[str, str]]:
+        """
+        Applies the settings which differ from the system configuration of the provided card
+        (see ``diff()``), calling each setter they belong to once, with the values of the document
+        and, for the other parameters of the setter, the values the card already has (or the
+        setter's defaults, where the card has none). The POSTs are coalesced by a change set, so
+        each ``/delta/adm_*`` endpoint is written at most once, and the web and network settings
+        (which change the port or address the card is reached on) are written last. Raises
+        ``ValueError`` before anything is written if a setter needs a value which neither the
+        document nor the card has. Returns the settings which were applied (see ``diff()``).
+
+        :param login_object: A valid ``tlnetcard_python.Login`` object.
+        :param force: (optional) Whether the system configuration should be downloaded even if a
+        current one is held (see ``Login.get_system_config()``).
+        :param batch_threshold: (optional) The number of changed endpoints from which the changes
+        are sent as a single system configuration upload (see ``Login.change_set()``).
+        :rtype: ``Dict[str, Tuple[str, str]]``
+        """
+        changes, calls, servers = self._plan(login_object.get_system_config(force))
+        if not changes:
+            return changes
+        with login_object.change_set(batch_threshold):
+            for setter, method, kwargs in calls:
+                if setter not in _CONNECTION_SETTERS:
+                    getattr(setter(login_object), method)(**kwargs)
+            if servers is not None:
+                syslog = Syslog(login_object)
+                syslog.clear_servers()
+                for server in servers:
+                    syslog.add_server(server)
+            for setter, method, kwargs in calls:
+                if setter in _CONNECTION_SETTERS:
+                    getattr(setter(login_object), method)(**kwargs)
+        return changes
+    # pylint: disable=too-many-locals
+    def _compare(self, config: ParsedConfig, entry: Tuple,
+                 changes: Dict[str, Tuple[str, str]]) -> Dict[str, Any]:
+        """
+        Compares a group of settings of the document against the provided system configuration,
+        adding the settings which differ to ``changes``. Returns the keyword arguments of the
+        setter of the group (the desired values, and for fields the document leaves out, the
+        current ones or, if the card has none, the setter's defaults), or ``None`` if no setting of
+        the group differs. Raises ``ValueError`` if a field without a default has no value.
+
+        :param config: The system configuration.
+        :param entry: The entry of the group in ``_SETTERS``.
+        :param changes: The settings which differ, keyed as with ``diff()``.
+        :rtype: ``Dict[str, Any]``
+        """
+        path, setter, method, fixed, fields = entry
+        desired = self._get(path)
+        kwargs = dict(fixed)
+        missing = []
+        changed = False
+        for field in fields:
+            param, key = fields[field]
+            current = self._current(config, field, key)
+            if field in desired:
+                value = self._as_text(desired[field])
+                if value != current:
+                    changes[".".join(path + (field,))] = (current, value)
+                    changed = True
+                kwargs[param] = desired[field]
+            elif current != "":
+                kwargs[param] = current
+            else:
+                missing.append((field, param))
+        if not changed:
+            return None
+        kwargs.update(self._get_defaults(getattr(setter, method), path, missing))
+        return kwargs
+    def diff(self, login_object: Login, force: bool = False) -> Dict[str, Tuple[str, str]]:
+        """
+        Compares the document against the system configuration of the provided card, which is
+        only downloaded if no current one is held (or ``force`` is set). Returns the settings which
+        differ, keyed by their path in the document (e.g. ``"web.http_port"``) and mapped to their
+        current and desired values as text. Returns ``Dict[str, Tuple[str, str]]``.
+
+        :param login_object: A valid ``tlnetcard_python.Login`` object.
+        :param force: (optional) Whether the system configuration should be downloaded even if a
+        current one is held (see ``Login.get_system_config()``).
+        :rtype: ``Dict[str, Tuple[str, str]]``
+        """
+        return self._plan(login_object.get_system_config(force))[0]
+    def get_state(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns the desired-state document.
+
+        :rtype: ``Dict[str, Dict[str, Any]]``
+        """
+        return self._state
+    def _get(self, path: Tuple[str, ...]) -> Dict[str, Any]:
+        """
+        Returns the values of the document at the provided path, or an empty dictionary if there
+        are none.
+
+        :param path: The path of a group of settings (e.g. ``("network", "ipv4")``).
+        :rtype: ``Dict[str, Any]``
+        """
+        values = self._state
+        for i in path:
+            values = values.get(i) or {}
+        return values
+    def _plan(self, config: ParsedConfig) -> Tuple[Dict[str, Tuple[str, str]],
+                                                    List[Tuple[type, str, Dict[str, Any]]],
+                                                    List[str]]:
+        """
+        Compares the document against the provided system configuration. Returns the settings
+        which differ (see ``diff()``), the setter calls which apply them (as the class, method and
+        keyword arguments of each call), and the syslog servers to set (``None`` if they do not
+        differ). Returns ``Tuple[Dict, List[Tuple[type, str, Dict]], List[str]]``.
+
+        :param config: The system configuration.
+        :rtype: ``Tuple[Dict, List[Tuple[type, str, Dict]], List[str]]``
+        """
+        changes = {}
+        calls = []
+        for entry in _SETTERS:
+            if self._get(entry[0]):
+                kwargs = self._compare(config, entry, changes)
+                if kwargs is not None:
+                    calls.append((entry[1], entry[2], kwargs))
+
+        # Comparing syslog servers as a list, as the order gives the slot of each server.
+        servers = self._get(("syslog",)).get("servers")
+        if servers is not None:
+            current = [config[i] for i in _SYSLOG_SERVERS if config.get(i, "") != ""]
+            if current != list(servers):
+                changes["syslog.servers"] = (", ".join(current), ", ".join(servers))
+            else:
+                servers = None
+        return changes, calls, servers
+    @staticmethod
+    def _as_text(value: Any) -> str:
+        """
+        Converts a value of the document to the text the system configuration holds it as.
+        Booleans are held as ``"1"`` and ``"0"``.
+
+        :param value: The value.
+        :rtype: ``str``
+        """
+        if isinstance(value, bool):
+            return str(int(value))
+        return str(value)
+    @staticmethod
+    def _current(config: ParsedConfig, field: str, key: str) -> str:
+        """
+        Returns the current value of a setting from the system configuration as text. The IPv6
+        address and prefix length share a single value (``address/prefix``).
+
+        :param config: The system configuration.
+        :param field: The field of the setting.
+        :param key: The system config key holding it.
+        :rtype: ``str``
+        """
+        value = config.get(key, "")
+        if key == "V6 IP":
+            address, _, prefix = value.partition("/")
+            return prefix if field == "prefix_len" else address
+        return value
+    @staticmethod
+    def _get_defaults(function: Callable, path: Tuple[str, ...],
+                      missing: List[Tuple[str, str]]) -> Dict[str, Any]:
+        """
+        Returns the defaults of the provided setter for the fields of a group which neither the
+        document nor the card has a value for, raising ``ValueError`` if any of them has no
+        default. Returns ``Dict[str, Any]``.
+
+        :param function: The setter.
+        :param path: The path of the group (e.g. ``("network", "ipv4")``).
+        :param missing: The fields without a value, along with their parameters.
+        :rtype: ``Dict[str, Any]``
+        """
+        parameters = signature(function).parameters
+        out = {}
+        for field, param in missing:
+            if parameters[param].default is Parameter.empty:
+                raise ValueError("The card has no value for " + ".".join(path + (field,)) +
+                                 ", so it must be provided.")
+            out[param] = parameters[param].default
+        return out
+    @staticmethod
+    def _walk(state: Dict[str, Any], path: Tuple[str, ...]) -> List[Tuple[Tuple[str, ...], Dict]]:
+        """
+        Lists the groups of settings of the provided document (dictionaries whose values are not
+        all dictionaries) along with their paths. Returns ``List[Tuple[Tuple[str, ...], Dict]]``.
+
+        :param state: The document (or part of it).
+        :param path: The path of the provided part.
+        :rtype: ``List[Tuple[Tuple[str, ...], Dict]]``
+        """
+        out = []
+        values = {}
+        for i in state:
+            if isinstance(state[i], dict):
+                out.extend(DesiredState._walk(state[i], path + (i,)))
+            else:
+                values[i] = state[i]
+        if values or not out and path:
+            out.append((path, values))
+        return out
@@ -7,20 +7,240 @@ with the TLNET Supervisor (requests' Session, hostname, port, SNMP and system co
 """
 
 # Standard library.
+from collections import OrderedDict
 from getpass import getpass
 from hashlib import md5
-from typing import Dict
+import os
+from tempfile import mkstemp
+from threading import local, Lock, Thread
+from time import time
+from typing import Any, Dict, List
+from urllib.parse import urlparse
 from warnings import filterwarnings, warn
 # Related third-party library.
-from requests import Session
+from requests import Response, Session
+from requests.adapters import HTTPAdapter
 from urllib3.exceptions import InsecureRequestWarning
+from urllib3.util.retry import Retry
+# Required internal classes/functions.
+from tlnetcard_python.config_cache import ConfigCache
+from tlnetcard_python.config_parser import check_config_values, parse_config, ParsedConfig
+from tlnetcard_python.page_cache import PageCache
+from tlnetcard_python.session_store import SessionStore
+
+class _LoginSession(Session):
+    """
+    The requests ``Session`` held by a ``Login`` object. Detects responses showing that the login
+    session has expired (the TLNET Supervisor answers with, or redirects to, its login page), in
+    which case the ``Login`` object logs in again and the request is replayed once.
+    """
+    def __init__(self, login: "Login") -> None:
+        """
+        Initializes the ``_LoginSession`` object. Returns ``None``.
+
+        :param login: The ``Login`` object which holds this session.
+        :rtype: ``None``
+        """
+        super().__init__()
+        self._login = login
+    # pylint: disable=arguments-differ
+    def request(self, method: str, url: str, *args: Any, **kwargs: Any) -> Response:
+        """
+        Sends a request (see ``requests.Session.request()``). If the response shows that the login
+        session has expired, logs in again and replays the request once. Returns
+        ``requests.Response``.
+
+        :param method: The HTTP method of the request.
+        :param url: The URL of the request.
+        :rtype: ``requests.Response``
+        """
+        cookies = self.cookies.get_dict()
+        response = super().request(method, url, *args, **kwargs)
+        if not self._is_login_page(response, kwargs.get('stream', False)):
+            return response
+        if not self._login._relogin(cookies): # pylint: disable=protected-access
+            return response
+        response.close()
+        # Rewinding uploaded files, which were read by the first attempt.
+        for upload in (kwargs.get('files') or {}).values():
+            upload = upload[1] if isinstance(upload, tuple) else upload
+            if hasattr(upload, 'seek'):
+                upload.seek(0)
+        return super().request(method, url, *args, **kwargs)
+    @staticmethod
+    def _is_login_page(response: Response, stream: bool) -> bool:
+        """
+        Checks whether the provided response is (or was redirected to) the login page of the TLNET
+        Supervisor. The body of streamed responses is not read, so only redirects are detected for
+        them. Returns ``bool``.
+
+        :param response: The response.
+        :param stream: Whether the body of the response is streamed.
+        :rtype: ``bool``
+        """
+        if response.history and urlparse(response.url).path in ('', '/', '/home.asp'):
+            return True
+        if stream or 'html' not in response.headers.get('Content-Type', 'text/html'):
+            return False
+        return response.text.find("login_title") != -1
+
+class ChangeSet:
+    """
+    A set of changes to a TLNET Supervisor, recorded by the setters of this API and applied
+    together. While a ``ChangeSet`` is used as a context manager (see ``Login.change_set()``),
+    setters called by the same thread record their changes instead of sending them, and the changes
+    are applied when the block exits: the payloads recorded for the same ``/delta/adm_*`` endpoint
+    are merged (later values win) and sent in a single POST per endpoint. If the block raises an
+    exception, nothing is sent. The system configuration returned to the recording thread includes
+    the changes recorded so far, so setters which read it (such as ``Syslog.add_server()``) see
+    earlier changes of the set, while other threads and ``Login`` objects sharing the configuration
+    only see them once they have been sent. Uploads, and setters which drive a browser, are sent
+    immediately.
+
+    When ``batch_threshold`` is set and at least that many endpoints were changed, the changes are
+    instead written into the system configuration and sent with a single
+    ``BatchConfiguration.upload_system_configuration()`` (after which the card is offline for about
+    10 seconds). Only values held in the system configuration are carried by the file, so this is
+    only done if every recorded change provided them.
+
+    Basic Usage:
+
+    >>> from tlnetcard_python import Login
+    >>> from tlnetcard_python.system.administration import Console, Syslog, TimeServer, Web
+    >>> card = Login(user="admin", passwd="password", host="10.0.0.100")
+    >>> with card.change_set():
+    >>>     Web(card).set_http_port(8080)
+    >>>     Web(card).set_web_refresh(30)
+    >>>     Console(card).set_ssh_port(2222)
+    >>>     TimeServer(card).set_primary_server("10.0.0.2")
+    >>>     Syslog(card).add_server("10.0.0.200")
+    >>> # Four POSTs were sent (one per endpoint) instead of five.
+    """
+    def __init__(self, login: "Login", batch_threshold: int = None) -> None:
+        """
+        Initializes the ``ChangeSet`` object. Returns ``None``.
+
+        :param login: The ``Login`` object of the card to change.
+        :param batch_threshold: (optional) The number of changed endpoints from which the changes
+        are sent as a single system configuration upload. When set to ``None``, they never are.
+        :rtype: ``None``
+        """
+        self._login = login
+        self._batch_threshold = batch_threshold
+        self._payloads = OrderedDict()
+        self._changes = {}
+        self._batchable = True
+    def __enter__(self) -> "ChangeSet":
+        """
+        Starts recording the changes made by setters called by the current thread. Returns
+        ``ChangeSet``.
+
+        :rtype: ``ChangeSet``
+        """
+        self._login._record_changes(self) # pylint: disable=protected-access
+        return self
+    def __exit__(self, exc_type: type, exc_value: BaseException, traceback: Any) -> None:
+        """
+        Stops recording changes, then applies them, or discards them if the block raised an
+        exception. Returns ``None``.
+
+        :rtype: ``None``
+        """
+        self._login._record_changes(None) # pylint: disable=protected-access
+        if exc_type is None:
+            self.apply()
+        else:
+            self.discard()
+    def add(self, url: str, data: Dict[str, str], changes: Dict[str, str] = None) -> None:
+        """
+        Records a POST of the provided payload to the provided endpoint, merging it into the
+        payload already recorded for the endpoint. Returns ``None``.
+
+        :param url: The URL of the endpoint.
+        :param data: The payload.
+        :param changes: (optional) The system configuration values changed by the payload (see
+        ``Login.update_system_config()``).
+        :rtype: ``None``
+        """
+        self._payloads.setdefault(url, {}).update(data)
+        if not changes:
+            self._batchable = False
+            return
+        self._changes.update(changes)
+    def apply(self) -> None:
+        """
+        Sends every recorded change, in a single POST per endpoint (or a single upload, see
+        ``batch_threshold``), then forgets them. If sending fails, the held system configuration
+        is renewed, as the card may have some of the changes. Returns ``None``.
+
+        :rtype: ``None``
+        """
+        payloads, changes = self._payloads, self._changes
+        batch = (self._batchable and self._batch_threshold is not None and
+                 len(payloads) >= self._batch_threshold)
+        self._payloads, self._changes, self._batchable = OrderedDict(), {}, True
+        if not payloads:
+            return
+        try:
+            if batch:
+                self._upload(changes)
+            else:
+                for url in payloads:
+                    self._login.get_session().post(url, data=payloads[url],
+                                                   timeout=self._login.get_timeout(),
+                                                   verify=self._login.get_reject_invalid_certs()
+                                                   ).raise_for_status()
+        except Exception:
+            self._login.request_system_config_renewal()
+            raise
+        self._login.update_system_config(changes)
+    def discard(self) -> None:
+        """
+        Forgets every recorded change without sending it. Returns ``None``.
+
+        :rtype: ``None``
+        """
+        self._payloads, self._changes, self._batchable = OrderedDict(), {}, True
+    def get_changes(self) -> Dict[str, str]:
+        """
+        Returns the system configuration values changed by the recorded changes.
+
+        :rtype: ``Dict[str, str]``
+        """
+        return dict(self._changes)
+    def get_endpoints(self) -> List[str]:
+        """
+        Returns the URLs of the endpoints which have recorded changes.
+
+        :rtype: ``List[str]``
+        """
+        return list(self._payloads)
+    def _upload(self, changes: Dict[str, str]) -> None:
+        """
+        Writes the provided values into the held system configuration and uploads it with
+        ``BatchConfiguration.upload_system_configuration()``. Returns ``None``.
+
+        :param changes: The system configuration values to change.
+        :rtype: ``None``
+        """
+        config = self._login.get_system_config().replace(changes)
+        descriptor, path = mkstemp(suffix=".ini")
+        try:
+            with os.fdopen(descriptor, "w", encoding="utf-8") as file:
+                file.write(config.get_text())
+            BatchConfiguration(self._login).upload_system_configuration(path)
+        finally:
+            os.remove(path)
 
 class Login:
     """
     A TLNET Supervisor ``Login`` object.
 
     A ``Login`` object is required by all classes in this repository. Provides login persistence and
-    saves pertinent session information.
+    saves pertinent session information. When ``lazy`` is set to ``True``, the login is only
+    performed once the session is first used. An expired session is logged in again (and the
+    request which found it expired is replayed) automatically. A ``Login`` object may be shared by
+    many threads.
 
     Basic Usage:
 
@@ -34,20 +254,28 @@ class Login:
     >>> batch_config.download_system_configuration(path="system_config.ini")
     'system-config.ini'
     """
-    # pylint: disable=too-many-arguments,too-many-instance-attributes
+    # pylint: disable=too-many-arguments,too-many-instance-attributes,too-many-locals
     def __init__(self, user: str = "admin", passwd: str = "password", host: str = "",
                  save_passwd: bool = False, ssl: bool = True,
-                 reject_invalid_certs: bool = True, timeout: float = 10.0, port: int = None
-                 ) -> None:
+                 reject_invalid_certs: bool = True, timeout: float = 10.0, port: int = None,
+                 page_cache_ttl: float = 5.0, session_store: SessionStore = None,
+                 lazy: bool = False, pool_connections: int = 1, pool_maxsize: int = 4,
+                 keep_alive: bool = True, max_retries: int = 2,
+                 backoff_factor: float = 0.3, config_ttl: float = 300.0,
+                 config_cache: ConfigCache = None) -> None:
         """
-        Initializes the ``Login`` object. If the ``passwd`` argument is not ``None``, then this
-        function will call ``self._perform_login()`` to execute the login. Returns ``None``.
+        Initializes the ``Login`` object. If a host was provided and ``lazy`` is set to ``False``,
+        then this function will call ``self._perform_login()`` to execute the login. Otherwise the
+        login is performed the first time the session is used. Returns ``None``.
 
         :param user: (optional) The TLNET Supervisor username.
         :param passwd: (optional) The TLNET Supervisor password.
         :param host: (optional) The address of the TLNETCARD.
         :param save_passwd: (optional) Determines whether or not the ``passwd`` value will be saved
-        in the object. When set to ``False``, the ``passwd`` value will not be saved.
+        in the object for later calls to ``set_host()``. When set to ``False``, the ``passwd`` value
+        will not be used for another host. Either way, the password of the current host is kept in
+        memory until ``logout()`` (or until the card rejects it), so that an expired session can be
+        logged in again.
         :param ssl: (optional) Determines whether or not the TLNET Supervisor at the host address
         has an SSL certificate i.e. does it use HTTPS. When set to ``True``, HTTPS will be used.
         :param reject_invalid_certs: (optional) Determines whether or not an invalid (i.e. a
@@ -56,6 +284,34 @@ class Login:
         :param timeout: (optional) The timeout value which will be used for all web and SNMP
         requests.
         :param port: (optional) The port which the TLNET Supervisor is using.
+        :param page_cache_ttl: (optional) The number of seconds webpages scraped from the TLNET
+        Supervisor are held before they are fetched again (see ``get_page_cache()``).
+        :param session_store: (optional) A ``SessionStore`` object holding the cookies of previous
+        login sessions. When provided, a stored session is reused (if it is still valid) instead of
+        logging in again, and new sessions are stored.
+        :param lazy: (optional) Determines whether the login is delayed until the session is first
+        used (see ``get_session()``). When set to ``False``, the login is performed immediately,
+        and a ``RuntimeWarning`` is thrown here if it fails. When set to ``True``, no request is
+        made until the session is first used, and a failed login is only reported then.
+        :param pool_connections: (optional) The number of connection pools (one per host) kept by
+        the session.
+        :param pool_maxsize: (optional) The maximum number of connections kept open to the TLNET
+        Supervisor.
+        :param keep_alive: (optional) Determines whether connections are kept open between
+        requests, so that each request does not pay for a new TCP connection and TLS handshake.
+        :param max_retries: (optional) The number of times a request is retried after a failed
+        connection (or, for requests which are safe to repeat, a failed read or a 502/503/504
+        response).
+        :param backoff_factor: (optional) The factor of the exponential delay between retries (the
+        n-th retry waits ``backoff_factor * 2 ** (n - 1)`` seconds).
+        :param config_ttl: (optional) The number of seconds the SNMP and system configurations are
+        held before they are downloaded again (see ``get_system_config()``). When set to ``None``,
+        they are only downloaded again when a renewal is requested. Ignored when ``config_cache``
+        is provided.
+        :param config_cache: (optional) A ``ConfigCache`` object holding the SNMP and system
+        configurations. When the same object is provided to many ``Login`` objects, a configuration
+        downloaded by one of them is used by every other ``Login`` object to the same card. When
+        not provided, this object holds its own configurations for ``config_ttl`` seconds.
         :rtype: ``None``
         """
         # Saving values which will be used independently.
@@ -65,6 +321,24 @@ class Login:
         self._save_passwd = save_passwd
         self._ssl = ssl
         self._timeout = timeout
+        self._session_store = session_store
+        self._lazy = lazy
+        self._keep_alive = keep_alive
+        # Initializing the connection pool shared by the login and every later request, so that a
+        # single warm connection to the card is reused.
+        retries = Retry(total=max_retries, backoff_factor=backoff_factor,
+                        status_forcelist=(502, 503, 504), raise_on_status=False)
+        self._adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize,
+                                    max_retries=retries)
+        # Initializing the session, which is logged in (and back in once expired) on demand.
+        self._session = _LoginSession(self)
+        self._configure_session(self._session)
+        self._logged_in = False
+        self._login_lock = Lock()
+        # The password of the current host is kept (in memory only) to log back in.
+        self._login_passwd = passwd
+        # Initializing the cache of scraped webpages (shared by every object using this login).
+        self._page_cache = PageCache(page_cache_ttl)
         # Setting port.
         if self._ssl and port is None:
             self._port = 443
@@ -77,14 +351,113 @@ class Login:
             self._passwd = passwd
         else:
             self._passwd = ""
-        # Executing login if a host was specified.
-        if self._host != "":
-            self._perform_login(passwd)
-        # Initializing system/snmp config list variables.
-        self._snmp_config = {}
-        self._system_config = {}
-        self._renew_snmp = True
-        self._renew_system = True
+        # Executing login if a host was specified (and the login is not delayed).
+        if self._host != "" and not self._lazy:
+            self._authenticate()
+        # Initializing the cache of system/snmp configurations (which may be shared with other
+        # Login objects). Each configuration is replaced (never modified) when it is refreshed,
+        # and only one thread refreshes it at a time.
+        if config_cache is None:
+            config_cache = ConfigCache(max_age=config_ttl, max_entries=2)
+        self._config_cache = config_cache
+        # Whether a background refresh (see ConfigCache's refresh_ahead) of each config is running.
+        self._refreshing = {'snmp': False, 'system': False}
+        # The change set each thread is recording (see change_set()).
+        self._change_sets = local()
+        # System config values written by setters which no download has confirmed yet, whether
+        # any setter has written since the last download, and the values the last one disproved.
+        self._pending_changes = {}
+        self._unverified_writes = False
+        self._config_mismatches = {}
+    def _authenticate(self) -> None:
+        """
+        Logs in with the password of the current host unless the session is already logged in (or
+        the password was rejected before). Returns ``None``.
+
+        :rtype: ``None``
+        """
+        with self._login_lock:
+            if self._logged_in or self._login_passwd is None:
+                return
+            if not self._perform_login(self._login_passwd):
+                # Not trying a rejected password again.
+                self._login_passwd = None
+    def change_set(self, batch_threshold: int = None) -> ChangeSet:
+        """
+        Returns a ``ChangeSet`` object which, used as a context manager, records the changes made
+        by setters of this API in its block and applies them together when the block exits, with
+        a single POST per ``/delta/adm_*`` endpoint. Returns ``ChangeSet``.
+
+        :param batch_threshold: (optional) The number of changed endpoints from which the changes
+        are sent as a single system configuration upload instead (see ``ChangeSet``). When set to
+        ``None``, they never are.
+        :rtype: ``ChangeSet``
+        """
+        return ChangeSet(self, batch_threshold)
+    def _check_pending_changes(self, config: ParsedConfig) -> None:
+        """
+        Confirms the values patched in by ``update_system_config()`` against a newly downloaded
+        system configuration, warning about every value the card does not have. The lock of the
+        system configuration (see ``ConfigCache.get_lock()``) must be held by the caller. Returns
+        ``None``.
+
+        :param config: The newly downloaded system configuration.
+        :rtype: ``None``
+        """
+        self._config_mismatches = {}
+        for key in self._pending_changes:
+            if config.get(key) != self._pending_changes[key]:
+                self._config_mismatches[key] = config.get(key)
+                warn("system config value " + key + " was not changed on host at URL " +
+                     self._host, RuntimeWarning)
+        self._pending_changes = {}
+        self._unverified_writes = False
+    def _config_key(self, name: str) -> str:
+        """
+        Generates the key of the SNMP (``name`` is ``"snmp"``) or system (``name`` is ``"system"``)
+        configuration of the current host in ``self._config_cache``. Returns ``str``.
+
+        :param name: The configuration, either ``"snmp"`` or ``"system"``.
+        :rtype: ``str``
+        """
+        return name + "@" + self.get_base_url()
+    def _configure_session(self, session: Session) -> None:
+        """
+        Mounts the connection pool of this object on the provided session, and disables keep-alive
+        if ``keep_alive`` was set to ``False``. Returns ``None``.
+
+        :param session: The session to configure.
+        :rtype: ``None``
+        """
+        session.mount('http://', self._adapter)
+        session.mount('https://', self._adapter)
+        if not self._keep_alive:
+            session.headers['Connection'] = 'close'
+    def _download_config(self, name: str) -> ParsedConfig:
+        """
+        Downloads the SNMP (``name`` is ``"snmp"``) or system (``name`` is ``"system"``)
+        configuration and stores it in ``self._config_cache``. The lock of the configuration (see
+        ``ConfigCache.get_lock()``) must be held by the caller. Returns ``ParsedConfig``.
+
+        :param name: The configuration, either ``"snmp"`` or ``"system"``.
+        :rtype: ``ParsedConfig``
+        """
+        # Noting when the download started, so that a renewal requested during the download
+        # triggers another one.
+        started = time()
+        # Initializing BatchConfiguration object pulling new config.
+        batch_object = BatchConfiguration(self)
+        if name == 'snmp':
+            text = batch_object.download_snmp_configuration(no_write=True)
+        else:
+            text = batch_object.download_system_configuration(no_write=True)
+        # Parsing the new config (unless an identical one was parsed recently), then replacing
+        # the previous one with it.
+        config = parse_config(text)
+        self._config_cache.set(self._config_key(name), config, started)
+        if name == 'system':
+            self._check_pending_changes(config)
+        return config
     def get_base_url(self) -> str:
         """
         Returns the base URL for TLNET Supervisor as a string.
@@ -97,6 +470,37 @@ class Login:
         else:
             base_url = 'http://' + self._host + ":" + str(self._port)
         return base_url
+    def _get_config(self, name: str, force: bool) -> ParsedConfig:
+        """
+        Returns the SNMP (``name`` is ``"snmp"``) or system (``name`` is ``"system"``)
+        configuration held in ``self._config_cache``, downloading it first if none is held (or it
+        has expired, or a renewal was requested) or the download is forced. Downloads are
+        single-flight: threads (and ``Login`` objects sharing the cache) which ask while one is in
+        progress wait for it and share its result instead of downloading the configuration again.
+        A refreshed configuration replaces the previous dictionary rather than refilling it, so a
+        dictionary which has been returned is never modified, and readers never see a partial
+        configuration.
+
+        :param name: The configuration, either ``"snmp"`` or ``"system"``.
+        :param force: Whether the configuration must be downloaded after this call was made.
+        :rtype: ``ParsedConfig``
+        """
+        called = time()
+        key = self._config_key(name)
+        # Returning the held config unless it is missing or the download is forced.
+        if not force:
+            entry = self._config_cache.get(key)
+            if entry is not None:
+                if self._config_cache.needs_refresh(entry[1]) and not self._refreshing[name]:
+                    self._refreshing[name] = True
+                    Thread(target=self._refresh_config, args=(name,), daemon=True).start()
+                return entry[0]
+        with self._config_cache.get_lock(key):
+            # Returning the configuration another thread downloaded while this one was waiting.
+            entry = self._config_cache.get(key)
+            if entry is not None and (not force or entry[1] >= called):
+                return entry[0]
+            return self._download_config(name)
     def get_host(self) -> str:
         """
         Returns the host as a string.
@@ -104,6 +508,16 @@ class Login:
         :rtype: ``str``
         """
         return self._host
+    def get_page_cache(self) -> PageCache:
+        """
+        Returns the ``PageCache`` object holding the webpages scraped from the TLNET Supervisor, so
+        that every value scraped from the same webpage (by any object using this login) costs a
+        single fetch. Its TTL can be changed with ``set_ttl()``, and ``clear()`` forgets every
+        webpage.
+
+        :rtype: ``PageCache``
+        """
+        return self._page_cache
     def get_port(self) -> int:
         """
         Returns the port number as an integer.
@@ -121,71 +535,61 @@ class Login:
         return self._reject_invalid_certs
     def get_session(self) -> Session:
         """
-        Returns the requests ``Session`` object that was created by the ``self._perform_login()``
-        function. If the ``self._perform_login()`` function has not run yet (i.e. no host was
-        specified), this function will return ``None``.
+        Returns the requests ``Session`` object which is logged in by the ``self._perform_login()``
+        function, logging in first if that has not happened yet. The session logs in again (and
+        replays the request once) whenever a response shows that it has expired. If no host was
+        specified, this function will return ``None``.
 
         :rtype: ``requests.Session``
         """
+        if self._host == "":
+            return None
+        if not self._logged_in:
+            self._authenticate()
         return self._session
-    def get_snmp_config(self, force: bool = False) -> Dict[str, str]:
+    def get_snmp_config(self, force: bool = False) -> ParsedConfig:
         """
         Checks if a refresh of the SNMP configuration has been requested (or forced). If so,
         initializes a ``tlnetcard_python.system.administration.BatchConfiguration`` object to pull
-        the current SNMP configuration and stores it locally as a dictionary. This information is
-        then returned. If a refresh was neither forced nor requested, it will return the
-        saved dictionary without pulling a new one.
+        the current SNMP configuration and stores it locally as a ``ParsedConfig`` object (a
+        read-only dictionary which also indexes values by section, see
+        ``tlnetcard_python.config_parser``). This information is then returned. If a refresh was
+        neither forced nor requested, it will return the saved dictionary without pulling a new
+        one. This function is thread-safe (see
+        ``self._get_config()``).
 
         :param force: Whether a new config file should be pulled from the TLNET Supervisor,
         regardless as to whether one has been requested by another function in this API. Setting
         this parameter to ``True`` guarantees the returned dictionary was just pulled, but
         frequent use will increase program runtimes while providing little or no benefit.
-        :rtype: ``Dict[str, str]``
+        :rtype: ``ParsedConfig``
         """
-        # Checking if a snmp config is required or forced and returning if neither.
-        if not self._renew_snmp and not force:
-            return self._snmp_config
-        # Otherwise initializing BatchConfiguration object pulling new SNMP config.
-        batch_object = BatchConfiguration(self)
-        snmp_config = batch_object.download_snmp_configuration(no_write=True).split('\n')
-        # Clearing existing SNMP config and writing new config.
-        self._snmp_config.clear()
-        for i in snmp_config:
-            if "=" in i:
-                info = i.split("+")
-                self._snmp_config[info[0]] = info[1]
-        # Resetting _renew_snmp variable to False.
-        self._renew_snmp = False
-        return self._snmp_config
-    def get_system_config(self, force: bool = False) -> Dict[str, str]:
+        return self._get_config('snmp', force)
+    def get_system_config(self, force: bool = False) -> ParsedConfig:
         """
         Checks if a refresh of the system configuration has been requested (or forced). If so,
         initializes a ``tlnetcard_python.system.administration.BatchConfiguration`` object to pull
-        the current system configuration and stores it locally as a dictionary. This information is
-        then returned. If a refresh was neither forced nor requested, it will return the
-        saved dictionary without pulling a new one.
+        the current system configuration and stores it locally as a ``ParsedConfig`` object (a
+        read-only dictionary which also indexes values by section, see
+        ``tlnetcard_python.config_parser``). This information is then returned. If a refresh was
+        neither forced nor requested, it will return the saved dictionary without pulling a new
+        one. This function is thread-safe (see ``self._get_config()``). While the current thread
+        records a change set (see ``change_set()``), the returned configuration also has the changes
+        recorded so far.
 
         :param force: Whether a new config file should be pulled from the TLNET Supervisor,
         regardless as to whether one has been requested by another function in this API. Setting
         this parameter to ``True`` guarantees the returned dictionary was just pulled, but
         frequent use will increase program runtimes while providing little or no benefit.
-        :rtype: ``Dict[str, str]``
+        :rtype: ``ParsedConfig``
         """
-        # Checking if a system config is required or forced and returning if neither.
-        if not self._renew_system and not force:
-            return self._system_config
-        # Otherwise initializing BatchConfiguration object pulling new system config.
-        batch_object = BatchConfiguration(self)
-        system_config = batch_object.download_system_configuration(no_write=True).split('\n')
-        # Clearing existing system config and writing new config.
-        self._system_config.clear()
-        for i in system_config:
-            if "=" in i:
-                info = i.split("+")
-                self._system_config[info[0]] = info[1]
-        # Resetting _renew_system variable to False.
-        self._renew_system = False
-        return self._system_config
+        config = self._get_config('system', force)
+        # Showing the recording thread the changes of its change set, which are only patched into
+        # the shared configuration once they have been sent.
+        change_set = getattr(self._change_sets, 'current', None)
+        if change_set is not None and change_set.get_changes():
+            config = config.replace(change_set.get_changes())
+        return config
     def get_timeout(self) -> float:
         """
         Returns the timeout value.
@@ -193,22 +597,56 @@ class Login:
         :rtype: ``float``
         """
         return self._timeout
+    def _is_logged_in(self, session: Session) -> bool:
+        """
+        Checks whether the provided ``Session`` object is logged in to the TLNET Supervisor, by
+        loading the home page (which shows the login form to sessions which are not). Returns
+        ``bool``.
+
+        :param session: The ``Session`` object to check.
+        :rtype: ``bool``
+        """
+        response = session.get(self.get_base_url() + '/home.asp', timeout=self._timeout,
+                               verify=self._reject_invalid_certs)
+        response.raise_for_status()
+        return response.text.find("login_title") == -1
     def logout(self) -> None:
         """ Closes the session. """
         # Restoring warnings in case reject_invalid_certs flag is used.
         filterwarnings("default", category=InsecureRequestWarning)
         self._session.close()
+        # Not logging back in once logged out.
+        with self._login_lock:
+            self._logged_in = False
+            self._login_passwd = None
+        # Webpages scraped with this session are not valid for the next one.
+        self._page_cache.clear()
+    def _patch_system_config(self, changes: Dict[str, str]) -> None:
+        """
+        Patches the provided values into the held system configuration (if one is held). The held
+        configuration is replaced rather than modified (see ``self._get_config()``). Returns
+        ``None``.
+
+        :param changes: The changed values, keyed as in ``get_system_config()``.
+        :rtype: ``None``
+        """
+        key = self._config_key('system')
+        with self._config_cache.get_lock(key):
+            entry = self._config_cache.get(key)
+            if entry is not None and changes:
+                self._config_cache.set(key, entry[0].replace(changes), entry[1])
     def _perform_login(self, passwd: str) -> bool:
         """
         Logs in to the TLNET Supervisor using the provided password, ``passwd``. Generates a POST
         request to the TLNET Supervisor login page at ``self._host`` and executes this request
         within a new requests ``Session``. If the login fails, the ``Session`` object is closed, a
-        ``RuntimeWarning`` is thrown, and ``False`` is returned. If the login succeeds, the
-        ``Session`` object is saved into ``self._session`` and ``True`` is returned.
+        ``RuntimeWarning`` is thrown, and ``False`` is returned. If the login succeeds, its cookies
+        are moved into ``self._session`` and ``True`` is returned. If a
+        ``SessionStore`` was provided, a stored session is tried first (which takes a single
+        request), and the login is only performed if it is no longer valid.
 
         This function was not meant to be called directly by the user of this API, but is instead
-        intended to be called indirectly via either the function initializer or by the
-        ``self.set_host()`` function.
+        intended to be called indirectly via ``self._authenticate()`` or ``self._relogin()``.
 
         :param passwd: The password to be used with the TLNET Supervisor.
         :rtype: ``bool``
@@ -221,8 +659,24 @@ class Login:
         login_get_url = self.get_base_url() + '/home.asp'
         login_post_url = self.get_base_url() + '/delta/login'
 
-        # Initializing session (to provide login persistence).
+        # Initializing a separate session for the login (sharing the connection pool), so the one
+        # in use only changes once the login has succeeded.
         session = Session()
+        self._configure_session(session)
+
+        # Trying a stored session first, which only takes a single request.
+        if self._session_store is not None:
+            cookies = self._session_store.get(self.get_base_url(), self._user)
+            if cookies is not None:
+                session.cookies.update(cookies)
+                if self._is_logged_in(session):
+                    self._session_store.set(self.get_base_url(), self._user,
+                                            session.cookies.get_dict())
+                    self._use_cookies(session)
+                    return True
+                # The session has expired, so a new one is required.
+                self._session_store.delete(self.get_base_url(), self._user)
+                session.cookies.clear()
 
         # Getting login screen HTML (so that Challenge can be retrieved).
         login_screen = session.get(login_get_url, timeout=self._timeout,
@@ -251,21 +705,74 @@ class Login:
                      verify=self._reject_invalid_certs).raise_for_status()
 
         # Checking if login was successful.
-        login_response = session.get(login_get_url, timeout=self._timeout,
-                                     verify=self._reject_invalid_certs)
-        login_response.raise_for_status()
-        if login_response.text.find("login_title") != -1:
+        if not self._is_logged_in(session):
             warn("login failed for host at URL " + self._host, RuntimeWarning)
-            session.close()
             return False
 
-        # Saving session.
-        self._session = session
+        # Saving session (and storing it for later Login objects).
+        if self._session_store is not None:
+            self._session_store.set(self.get_base_url(), self._user, session.cookies.get_dict())
+        self._use_cookies(session)
         return True
+    def _record_changes(self, change_set: ChangeSet) -> None:
+        """
+        Makes setters called by the current thread record their changes in the provided change
+        set (see ``submit()``), or send them again if ``None`` is provided. Returns ``None``.
+
+        :param change_set: The change set, or ``None``.
+        :rtype: ``None``
+        """
+        if change_set is not None and getattr(self._change_sets, 'current', None) is not None:
+            raise RuntimeError("A change set is already being recorded by this thread.")
+        self._change_sets.current = change_set
+    def _refresh_config(self, name: str) -> None:
+        """
+        Downloads the SNMP (``name`` is ``"snmp"``) or system (``name`` is ``"system"``)
+        configuration again before it expires (see ``ConfigCache``'s ``refresh_ahead``). Runs in a
+        background thread, so errors are reported as warnings. Returns ``None``.
+
+        :param name: The configuration, either ``"snmp"`` or ``"system"``.
+        :rtype: ``None``
+        """
+        key = self._config_key(name)
+        try:
+            with self._config_cache.get_lock(key):
+                # Skipping the download if another thread (or Login object) already refreshed it.
+                entry = self._config_cache.get(key)
+                if entry is None or self._config_cache.needs_refresh(entry[1]):
+                    self._download_config(name)
+        except Exception as error: # pylint: disable=broad-except
+            warn("Unable to refresh " + name + " config of host at URL " + self._host + ": " +
+                 str(error), RuntimeWarning)
+        finally:
+            self._refreshing[name] = False
+    def _relogin(self, cookies: Dict[str, str]) -> bool:
+        """
+        Logs in again after a response showed that the session with the provided cookies has
+        expired. If another thread already logged in again, its session is used instead. Returns
+        ``True`` if the request should be replayed, ``False`` otherwise.
+
+        :param cookies: The cookies of the session which has expired.
+        :rtype: ``bool``
+        """
+        with self._login_lock:
+            if self._session.cookies.get_dict() != cookies:
+                return True
+            if self._login_passwd is None:
+                return False
+            self._logged_in = False
+            # The card no longer accepts the stored session either.
+            if self._session_store is not None:
+                self._session_store.delete(self.get_base_url(), self._user)
+            if not self._perform_login(self._login_passwd):
+                self._login_passwd = None
+                return False
+            return True
     def request_snmp_config_renewal(self) -> None:
         """
-        Sets the ``self._renew_snmp`` attribute to ``True`` so that the next call to
-        ``get_snmp_config()`` will trigger a re-pull of the SNMP config file.
+        Invalidates the SNMP configuration in ``self._config_cache`` so that the next call to
+        ``get_snmp_config()`` (by any ``Login`` object sharing the cache) will trigger a re-pull of
+        the SNMP config file.
 
         This method was not intended to be called directly by the user of this API, but is instead
         intended to be called by functions in this API which make POST requests which may alter
@@ -275,21 +782,22 @@ class Login:
 
         :rtype: ``None``
         """
-        self._renew_snmp = True
+        self._config_cache.invalidate(self._config_key('snmp'))
     def request_system_config_renewal(self) -> None:
         """
-        Sets the ``self._renew_system`` attribute to ``True`` so that the next call to
-        ``get_system_config()`` will trigger a re-pull of the SNMP config file.
+        Invalidates the system configuration in ``self._config_cache`` so that the next call to
+        ``get_system_config()`` (by any ``Login`` object sharing the cache) will trigger a re-pull
+        of the system config file.
 
         This method was not intended to be called directly by the user of this API, but is instead
-        intended to be called by functions in this API which make POST requests which may alter
-        values in the SNMP configuration file. If the user wishes to pull a fresh dictionary of SNMP
-        values this should be accomplished using the ``self.get_system_config()`` function (see the
-        ``force`` parameter in particular).
+        intended to be called by functions in this API which replace the whole system configuration
+        file (setters which change individual values use ``self.update_system_config()``). If the
+        user wishes to pull a fresh dictionary of SNMP values this should be accomplished using the
+        ``self.get_system_config()`` function (see the ``force`` parameter in particular).
 
         :rtype: ``None``
         """
-        self._renew_system = True
+        self._config_cache.invalidate(self._config_key('system'))
     def set_host(self, host: str, passwd: str = "") -> None:
         """
         Sets host and then calls ``self._perform_login()``. Returns ``None``.
@@ -310,16 +818,90 @@ class Login:
         # Saving host value.
         self._host = host
 
-        # Checking if password was provided or if password was saved, and then logging in.
-        if passwd != "":
-            self._perform_login(passwd)
-        elif self._save_passwd:
-            self._perform_login(self._passwd)
-        else:
+        # Checking if password was provided or if password was saved.
+        if passwd == "" and self._save_passwd:
+            passwd = self._passwd
+        elif passwd == "":
             passwd = getpass()
-            if self._save_passwd:
-                self._passwd = passwd
-            self._perform_login(passwd)
+        # Logging in (unless the login is delayed until the session is used).
+        with self._login_lock:
+            self._logged_in = False
+            self._login_passwd = passwd
+        if not self._lazy:
+            self._authenticate()
+    def submit(self, url: str, data: Dict[str, str], changes: Dict[str, str] = None) -> None:
+        """
+        POSTs the provided payload to the provided ``/delta/adm_*`` endpoint, then patches the
+        values it changed into the held system configuration (see ``update_system_config()``).
+        If the current thread is recording a change set (see ``change_set()``), the POST is
+        recorded in it instead. Raises ``ValueError`` before sending anything if a changed value
+        contains a line break. Returns ``None``.
+
+        This method was not intended to be called directly by the user of this API, but is instead
+        intended to be called by the setters of this API.
+
+        :param url: The URL of the endpoint.
+        :param data: The payload.
+        :param changes: (optional) The changed values, keyed as in ``get_system_config()``.
+        :rtype: ``None``
+        """
+        # Refusing values which cannot be held by the configuration file before sending anything.
+        check_config_values(changes or {})
+        change_set = getattr(self._change_sets, 'current', None)
+        if change_set is not None:
+            change_set.add(url, data, changes)
+            return
+        self.get_session().post(url, data=data, timeout=self._timeout,
+                                verify=self._reject_invalid_certs).raise_for_status()
+        self.update_system_config(changes)
+    def update_system_config(self, changes: Dict[str, str] = None) -> None:
+        """
+        Patches the provided values into the system configuration held in ``self._config_cache``
+        (and therefore by every ``Login`` object sharing it) after a setter changed them on the
+        card, instead of downloading the whole configuration again. The held dictionary is replaced
+        rather than modified (see ``self._get_config()``). The values are confirmed by the next
+        download of the configuration (see ``verify_system_config()``). Setters call this with the
+        values this API reads back; values which are not provided are refreshed by the next
+        download (once the held configuration expires). Returns ``None``.
+
+        This method was not intended to be called directly by the user of this API, but is instead
+        intended to be called by functions in this API which make POST requests which alter values
+        in the system configuration file.
+
+        :param changes: (optional) The changed values, keyed as in ``get_system_config()``.
+        :rtype: ``None``
+        """
+        changes = changes or {}
+        with self._config_cache.get_lock(self._config_key('system')):
+            self._pending_changes.update(changes)
+            self._unverified_writes = True
+        # Only patching a configuration which is held; the next download will already have the
+        # changes.
+        self._patch_system_config(changes)
+    def _use_cookies(self, session: Session) -> None:
+        """
+        Replaces the cookies of ``self._session`` with those of the provided (logged in) session.
+        ``self._session`` itself is kept, as other objects hold it. The provided session is not
+        closed, as that would close the connection pool both share. Returns ``None``.
+
+        :param session: The logged in session.
+        :rtype: ``None``
+        """
+        self._session.cookies.clear()
+        self._session.cookies.update(session.cookies)
+        self._logged_in = True
+    def verify_system_config(self) -> Dict[str, str]:
+        """
+        Downloads the system configuration if any setter changed it since it was last downloaded,
+        confirming the values patched in by ``update_system_config()``. Returns the values the card
+        does not have as a dictionary, mapped to the values the card has (``None`` if it has none),
+        and warns about each of them.
+
+        :rtype: ``Dict[str, str]``
+        """
+        if self._unverified_writes:
+            self._get_config('system', True)
+        return dict(self._config_mismatches)
 
 # Importing BatchConfiguration module to access configuration files.
 # pylint: disable=line-too-long,wrong-import-position
@@ -0,0 +1,2 @@
+""" Initialize Configuration class. """
+from .configuration import Configuration
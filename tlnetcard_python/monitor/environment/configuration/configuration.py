@@ -64,12 +64,8 @@ class Configuration:
             "ENV_R" + first_empty + "_SSHUT": str(int(smart_shutdown)),
         }
 
-        # Uploading environment configuration and requesting system config renewal.
-        self._login_object.get_session().post(self._post_url, data=config_data,
-                                              timeout=self._login_object.get_timeout(),
-                                              verify=self._login_object.get_reject_invalid_certs()
-                                              ).raise_for_status()
-        self._login_object.request_system_config_renewal()
+        # Uploading environment configuration and updating the cached system config.
+        self._login_object.submit(self._post_url, config_data, {"Title Input" + first_empty: title})
         return True
     def clear_input_contacts(self) -> None:
         """
@@ -84,12 +80,9 @@ class Configuration:
             config_data["ENV_NCNO_R" + str(i)] = "0"
             config_data["ENV_R" + str(i) + "_SSHUT"] = "0"
 
-        # Uploading environment configuration and requesting system config renewal.
-        self._login_object.get_session().post(self._post_url, data=config_data,
-                                              timeout=self._login_object.get_timeout(),
-                                              verify=self._login_object.get_reject_invalid_certs()
-                                              ).raise_for_status()
-        self._login_object.request_system_config_renewal()
+        # Uploading environment configuration and updating the cached system config.
+        self._login_object.submit(self._post_url, config_data,
+                                  {"Title Input" + str(i): "" for i in range(1, 5)})
     def get_humidity_configuration(self) -> Dict[str, Any]:
         """
         Returns info for how humidity limits are configured as a dictionary.
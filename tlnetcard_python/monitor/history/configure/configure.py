@@ -46,12 +46,8 @@ class Configure:
             "CLEAR_DATA": "Clear Data Log"
         }
 
-        # Uploading FTP configuration and requesting system config renewal.
-        self._login_object.get_session().post(self._post_url, data=config_data,
-                                              timeout=self._login_object.get_timeout(),
-                                              verify=self._login_object.get_reject_invalid_certs()
-                                              ).raise_for_status()
-        self._login_object.request_system_config_renewal()
+        # Uploading FTP configuration and updating the cached system config.
+        self._login_object.submit(self._post_url, config_data)
     def clear_event_log(self) -> None:
         """
         Clears the data log. Returns ``None``.
@@ -63,12 +59,8 @@ class Configure:
             "CLEAR_LOG": "Clear Event Log"
         }
 
-        # Uploading FTP configuration and requesting system config renewal.
-        self._login_object.get_session().post(self._post_url, data=config_data,
-                                              timeout=self._login_object.get_timeout(),
-                                              verify=self._login_object.get_reject_invalid_certs()
-                                              ).raise_for_status()
-        self._login_object.request_system_config_renewal()
+        # Uploading FTP configuration and updating the cached system config.
+        self._login_object.submit(self._post_url, config_data)
     def set_data_interval(self, interval: int = 10) -> None:
         """
         Sets the interval in minutes at which information is saved to the data log. Returns
@@ -84,9 +76,5 @@ class Configure:
             "HCG_APPLY": "Apply"
         }
 
-        # Uploading FTP configuration and requesting system config renewal.
-        self._login_object.get_session().post(self._post_url, data=config_data,
-                                              timeout=self._login_object.get_timeout(),
-                                              verify=self._login_object.get_reject_invalid_certs()
-                                              ).raise_for_status()
-        self._login_object.request_system_config_renewal()
+        # Uploading FTP configuration and updating the cached system config.
+        self._login_object.submit(self._post_url, config_data)
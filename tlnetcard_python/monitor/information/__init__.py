@@ -2,6 +2,10 @@
 from tlnetcard_python.monitor.information.battery_parameters import BatteryParameters
 from tlnetcard_python.monitor.information.in_out_parameters import InOutParameters
 from tlnetcard_python.monitor.information.identification import Identification
+from tlnetcard_python.monitor.information.snapshot import Snapshot
+from tlnetcard_python.monitor.information.fleet import Fleet
+from tlnetcard_python.monitor.information.simulator import SnmpSimulator
+from tlnetcard_python.monitor.information.scrape_pool import ScrapePool
 
 # Functions which all classes share.
 from tlnetcard_python.monitor.information.information import *
@@ -7,23 +7,23 @@ This module provides a ``BatteryParameters`` object to provide the functionality
 """
 
 # Standard library.
-from typing import Any, Dict
+from typing import Any, Dict, List
 # Required internal classes/functions.
 from tlnetcard_python.login import Login
-from tlnetcard_python.monitor.information.information import get_with_snmp, scrape_with_selenium
+from tlnetcard_python.monitor.information import oids
+from tlnetcard_python.monitor.information.information import get_with_snmp, scrape_with_requests
 
 class BatteryParameters:
     """
     A TLNET Supervisor ``BatteryParameters`` object. Provides the functionality of the equivalent
     webpage TLNET Supervisor -> Monitor -> Information -> About. This functionality is provided
-    through either SNMP or Selenium per the user's choice. While Selenium requires no additional
-    arguments at runtime, it does require Google Chrome to be installed as well as the associated
-    WebDriver (see the README.md for more details), as well as suffering from greatly-reduced
-    speeds. As such, it is only recommended that Selenium be used on smaller workloads (if you
-    must use it at all). Alternatively, SNMP can be used to retrieve values at a much greater speed,
-    although this will require more arguments (SNMP user, auth key, and priv key as applicable), all
-    of which can be retrieved using the ``tlnetcard_python.system.adminitration.UserManager``
-    object.
+    through either SNMP or by scraping the webpage per the user's choice. Scraping requires no
+    additional arguments at runtime, and only falls back to Selenium (which requires Google Chrome
+    to be installed as well as the associated WebDriver, see the README.md for more details) for
+    values which cannot be read from the webpage and its scripts. Alternatively, SNMP can be used to
+    retrieve values at a much greater speed, although this will require more arguments (SNMP user,
+    auth key, and priv key as applicable), all of which can be retrieved using the
+    ``tlnetcard_python.system.adminitration.UserManager`` object.
 
     Basic Usage:
 
@@ -40,11 +40,25 @@ class BatteryParameters:
     >>>                                         snmp_priv_key="imadethisuptoo")
     {'Battery Status': 'Normal', 'On Battery Time (s)': 0}
 
-    Or they can be run using Selenium:
+    Or they can be run by scraping the webpage:
 
     >>> card_batt_parameters.get_battery_status(snmp=False)
     {'Battery Status': 'Normal', 'On Battery Time (s)': 0}
     """
+    # SNMP IDs of the battery status (see tlnetcard_python.monitor.information.oids).
+    STATUS_SNMP_DICT = {
+        'Battery Status': oids.UPS_BATTERY_STATUS,
+        'On Battery Time': oids.UPS_SECONDS_ON_BATTERY
+    }
+    # SNMP IDs of the battery measurements.
+    MEASUREMENTS_SNMP_DICT = {
+        'Battery Capacity': oids.UPS_CHARGE_REMAINING,
+        'Voltage': oids.UPS_BATTERY_VOLTAGE,
+        'Temperature': oids.UPS_BATTERY_TEMPERATURE,
+        'Remaining Minutes': oids.UPS_MINUTES_REMAINING
+    }
+    # Battery status is actually returned as an integer whose values map as follows:
+    BATTERY_STATUS_DICT = oids.BATTERY_STATUS_DICT
     def __init__(self, login_object: Login) -> None:
         """
         Initializes the ``BatteryParameters`` object. Returns ``None``.
@@ -54,13 +68,45 @@ class BatteryParameters:
         """
         self._login_object = login_object
         self._get_url = login_object.get_base_url() + "/en/ups/info_battery.asp"
+    @classmethod
+    def decode_battery_measurements(cls, values: List[Any]) -> Dict[str, Any]:
+        """
+        Returns the battery measurements decoded from the SNMP values of ``MEASUREMENTS_SNMP_DICT``
+        (in the same order) as a dictionary.
+
+        :param values: The SNMP values returned for ``MEASUREMENTS_SNMP_DICT``.
+        :rtype: ``Dict[str, Any]``
+        """
+        snmp_ids = list(cls.MEASUREMENTS_SNMP_DICT.values())
+        batt_cap, volts, temp, rem_time = oids.OID_REGISTRY.decode_all(snmp_ids, values)
+        return {
+            'Battery Capacity (%)': batt_cap,
+            'Voltage (V)': volts,
+            'Temperature (°C)': temp,
+            'Remaining Time (HH:MM)': rem_time
+        }
+    @classmethod
+    def decode_battery_status(cls, values: List[Any]) -> Dict[str, Any]:
+        """
+        Returns the battery status decoded from the SNMP values of ``STATUS_SNMP_DICT`` (in the same
+        order) as a dictionary.
+
+        :param values: The SNMP values returned for ``STATUS_SNMP_DICT``.
+        :rtype: ``Dict[str, Any]``
+        """
+        snmp_ids = list(cls.STATUS_SNMP_DICT.values())
+        batt_stat, batt_time = oids.OID_REGISTRY.decode_all(snmp_ids, values)
+        return {
+            'Battery Status': batt_stat,
+            'On Battery Time (s)': batt_time
+        }
     def get_battery_status(self, snmp: bool = True, snmp_user: str = "",
                            snmp_auth_key: str = "", snmp_priv_key: str = "") -> Dict[str, Any]:
         """
         Returns battery status information as a dictionary.
 
         :param snmp: (optional) Whether SNMP should be used or not. Setting this value to ``False``
-        will result in Selenium being used.
+        will result in the webpage being scraped.
         :param snmp_user: (optional) The SNMP user to connect with.
         :param snmp_auth_key: (optional) The SNMP auth key to connect with.
         :param snmp_priv_key: (optional) The SNMP priv key to connect with.
@@ -68,38 +114,17 @@ class BatteryParameters:
         """
         if snmp:
             # SNMP will be used to get the value. This is the preferred method.
-            # Generating SNMP ID dictionary.
-            snmp_dict = {
-                'Battery Status': 'iso.3.6.1.2.1.33.1.2.1',
-                'On Battery Time': 'iso.3.6.1.2.1.33.1.2.2'
-            }
-
             # Getting values.
-            batt_stat, batt_time = get_with_snmp(self._login_object.get_host(),
-                                                 [snmp_dict[i] for i in snmp_dict], snmp_user,
-                                                 snmp_auth_key, snmp_priv_key,
-                                                 self._login_object.get_timeout())
-            # Battery status is actually returned as an integer whose values map as follows:
-            status_dict = {
-                1: 'Unknown',
-                2: 'Normal',
-                3: 'Low',
-                4: 'Depleted'
-            }
+            values = get_with_snmp(self._login_object.get_host(),
+                                   list(self.STATUS_SNMP_DICT.values()), snmp_user, snmp_auth_key,
+                                   snmp_priv_key, self._login_object.get_timeout(), typed=True)
 
             # Generating out dictionary.
-            out = {
-                'Battery Status': status_dict[int(batt_stat)],
-                'On Battery Time (s)': int(batt_time)
-            }
+            out = self.decode_battery_status(values)
         else:
-            # Selenium will be used to scrape the value. This method is slower than using SNMP.
+            # The webpage will be scraped for the value. This method is slower than using SNMP.
             # Getting values.
-            batt_stat, batt_time = scrape_with_selenium(self._login_object.get_host(),
-                                                        ["UPS_BATTSTS", "UPS_ONBATTTIME"],
-                                                        self._get_url,
-                                                        self._login_object.get_session(),
-                                                        self._login_object.get_timeout())
+            batt_stat, batt_time = self._scrape(["UPS_BATTSTS", "UPS_ONBATTTIME"])
 
             # Generating out dictionary.
             out = {
@@ -107,6 +132,27 @@ class BatteryParameters:
                 'On Battery Time (s)': int(batt_time)
             }
         return out
+    async def get_battery_status_async(self, snmp_user: str = "",
+                                       snmp_auth_key: str = "", snmp_priv_key: str = ""
+                                       ) -> Dict[str, Any]:
+        """
+        Returns battery status information as a dictionary without blocking the event loop. This is
+        the asyncio counterpart of ``get_battery_status()``, and always uses SNMP.
+
+        :param snmp_user: (optional) The SNMP user to connect with.
+        :param snmp_auth_key: (optional) The SNMP auth key to connect with.
+        :param snmp_priv_key: (optional) The SNMP priv key to connect with.
+        :rtype: ``Dict[str, Any]``
+        """
+        # Imported here, as pysnmp's asyncio API cannot be imported on every Python version
+        # this package supports, and the synchronous functions of this class do not need it.
+        # pylint: disable=import-outside-toplevel
+        from tlnetcard_python.monitor.information.snmp_async import get_with_snmp_async
+        values = await get_with_snmp_async(self._login_object.get_host(),
+                                           list(self.STATUS_SNMP_DICT.values()), snmp_user,
+                                           snmp_auth_key, snmp_priv_key,
+                                           self._login_object.get_timeout(), typed=True)
+        return self.decode_battery_status(values)
     def get_battery_measurements(self, snmp: bool = True, snmp_user: str = "",
                                  snmp_auth_key: str = "", snmp_priv_key: str = ""
                                  ) -> Dict[str, Any]:
@@ -115,7 +161,7 @@ class BatteryParameters:
         as a dictionary.
 
         :param snmp: (optional) Whether SNMP should be used or not. Setting this value to ``False``
-        will result in Selenium being used.
+        will result in the webpage being scraped.
         :param snmp_user: (optional) The SNMP user to connect with.
         :param snmp_auth_key: (optional) The SNMP auth key to connect with.
         :param snmp_priv_key: (optional) The SNMP priv key to connect with.
@@ -123,42 +169,19 @@ class BatteryParameters:
         """
         if snmp:
             # SNMP will be used to get the value. This is the preferred method.
-            # Generating SNMP ID dictionary.
-            snmp_dict = {
-                'Battery Capacity': 'iso.3.6.1.2.1.33.1.2.4',
-                'Voltage': 'iso.3.6.1.2.1.33.1.2.5', # In decivolts (i.e. divide this value by 10).
-                'Temperature': 'iso.3.6.1.2.1.33.1.2.7',
-                'Remaining Minutes': 'iso.3.6.1.2.1.33.1.2.3',
-            }
-
             # Getting values.
-            batt_cap, volts, temp, rem_mins = get_with_snmp(self._login_object.get_host(),
-                                                            [snmp_dict[i] for i in snmp_dict],
-                                                            snmp_user, snmp_auth_key,
-                                                            snmp_priv_key,
-                                                            self._login_object.get_timeout())
+            values = get_with_snmp(self._login_object.get_host(),
+                                   list(self.MEASUREMENTS_SNMP_DICT.values()), snmp_user,
+                                   snmp_auth_key, snmp_priv_key,
+                                   self._login_object.get_timeout(), typed=True)
 
             # Generating out dictionary.
-            mins = int(rem_mins)
-            hours = int((mins - (mins % 60))/60)
-            rem_time = '{hours:02d}:{mins:02d}'.format(hours=hours, mins=mins % 60)
-            out = {
-                'Battery Capacity (%)': int(batt_cap),
-                'Voltage (V)': float(volts)/10,
-                'Temperature (°C)': int(temp),
-                'Remaining Time (HH:MM)': rem_time
-            }
+            out = self.decode_battery_measurements(values)
         else:
-            # Selenium will be used to scrape the value. This method is slower than using SNMP.
+            # The webpage will be scraped for the value. This method is slower than using SNMP.
             # Getting values.
-            batt_cap, volts, temp, time, = scrape_with_selenium(self._login_object.get_host(),
-                                                                ["UPS_BATTLEVEL",
-                                                                 "UPS_BATTVOLT",
-                                                                 "UPS_TEMP",
-                                                                 "UPS_BATTREMAIN"],
-                                                                self._get_url,
-                                                                self._login_object.get_session(),
-                                                                self._login_object.get_timeout())
+            batt_cap, volts, temp, time, = self._scrape(["UPS_BATTLEVEL", "UPS_BATTVOLT",
+                                                         "UPS_TEMP", "UPS_BATTREMAIN"])
 
             # Generating out dictionary.
             out = {
@@ -168,6 +191,26 @@ class BatteryParameters:
                 'Remaining Time (HH:MM)': time
             }
         return out
+    async def get_battery_measurements_async(self, snmp_user: str = "",
+                                             snmp_auth_key: str = "", snmp_priv_key: str = ""
+                                             ) -> Dict[str, Any]:
+        """
+        Gets information about battery capacity, temperature, and voltage without blocking the event
+        loop. Returns this information as a dictionary. This is the asyncio counterpart of
+        ``get_battery_measurements()``, and always uses SNMP.
+
+        :param snmp_user: (optional) The SNMP user to connect with.
+        :param snmp_auth_key: (optional) The SNMP auth key to connect with.
+        :param snmp_priv_key: (optional) The SNMP priv key to connect with.
+        :rtype: ``Dict[str, Any]``
+        """
+        # pylint: disable=import-outside-toplevel
+        from tlnetcard_python.monitor.information.snmp_async import get_with_snmp_async
+        values = await get_with_snmp_async(self._login_object.get_host(),
+                                           list(self.MEASUREMENTS_SNMP_DICT.values()), snmp_user,
+                                           snmp_auth_key, snmp_priv_key,
+                                           self._login_object.get_timeout(), typed=True)
+        return self.decode_battery_measurements(values)
     def get_last_replacement_date(self) -> str:
         """
         Gets the last date the UPS battery was changed and returns it as a string.
@@ -175,9 +218,7 @@ class BatteryParameters:
         :rtype: ``str``
         """
         # This value is not available with SNMP.
-        return scrape_with_selenium(self._login_object.get_host(), ["UPS_BATTLAST"],
-                                    self._get_url, self._login_object.get_session(),
-                                    self._login_object.get_timeout())[0]
+        return self._scrape(["UPS_BATTLAST"])[0]
     def get_next_replacement_date(self) -> str:
         """
         Gets the next date the UPS battery should be changed and returns it as a string.
@@ -185,6 +226,20 @@ class BatteryParameters:
         :rtype: ``str``
         """
         # This value is not available with SNMP.
-        return scrape_with_selenium(self._login_object.get_host(), ["UPS_BATTNEXT"],
-                                    self._get_url, self._login_object.get_session(),
-                                    self._login_object.get_timeout())[0]
+        return self._scrape(["UPS_BATTNEXT"])[0]
+    def _scrape(self, element_ids: List[str], xpath: bool = False) -> List[str]:
+        """
+        Scrapes the provided web elements from the webpage of this object (see
+        ``scrape_with_requests()``), through the page cache of the ``Login`` object. Returns
+        ``List[str]``.
+
+        :param element_ids: A list of HTML element IDs to retrieve. These will instead be Xpaths if
+        ``xpath`` is set to ``True``.
+        :param xpath: (optional) Whether Xpath should be used to find element values instead of IDs.
+        :rtype: ``List[str]``
+        """
+        return scrape_with_requests(self._login_object.get_host(), element_ids, self._get_url,
+                                    self._login_object.get_session(),
+                                    self._login_object.get_timeout(), xpath,
+                                    self._login_object.get_reject_invalid_certs(),
+                                    cache=self._login_object.get_page_cache())
@@ -0,0 +1,2 @@
+""" Initializes Fleet class. """
+from .fleet import Fleet
@@ -0,0 +1,171 @@
+"""
+tlnetcard_python.monitor.information.fleet.fleet
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+This module provides a ``Fleet`` object which polls the SNMP values of TLNET Supervisor -> Monitor
+-> Information from many cards at once.
+"""
+
+# Standard library.
+import asyncio
+from typing import Any, Dict, Iterator, List, Set, Tuple, Union
+# Required internal classes/functions.
+from tlnetcard_python.monitor.information.snapshot import Snapshot
+
+# Groups of values which can be polled, mapped to their SNMP IDs and the function decoding them.
+POLL_GROUPS = Snapshot.GROUPS
+
+class Fleet:
+    """
+    A ``Fleet`` object. Polls the values of the ``InOutParameters``, ``BatteryParameters`` and
+    ``Identification`` objects from many cards at once using SNMP. Every card is read with a single
+    batched SNMP exchange, at most ``concurrency`` cards are read at the same time, and a card which
+    does not answer within ``deadline`` seconds is reported as an error rather than holding up the
+    rest of the sweep. No web login is required.
+
+    Basic Usage:
+
+    >>> from tlnetcard_python.monitor.information import Fleet
+    >>> # Hosts can either be given as strings (using the default SNMP credentials) or as
+    >>> # dictionaries overriding any of them.
+    >>> fleet = Fleet(["10.0.0.100", {"host": "10.0.0.101", "snmp_user": "other_user"}],
+    >>>               snmp_user="admin", snmp_auth_key="imadethisup",
+    >>>               snmp_priv_key="imadethisuptoo")
+    >>> for host, results, error in fleet.poll(["Battery Status"]):
+    >>>     print(host, error or results["Battery Status"]["Battery Status"])
+    10.0.0.101 Normal
+    10.0.0.100 Normal
+    >>> fleet.close()
+    """
+    # pylint: disable=too-many-arguments
+    def __init__(self, hosts: List[Union[str, Dict[str, Any]]], snmp_user: str = "",
+                 snmp_auth_key: str = "", snmp_priv_key: str = "", concurrency: int = 64,
+                 deadline: float = 10.0, timeout: float = 3.0, port: int = 161) -> None:
+        """
+        Initializes the ``Fleet`` object. Returns ``None``.
+
+        :param hosts: The cards to poll. Each card is either the IP address/DNS name of the card, or
+        a dictionary with a ``host`` key and (optionally) ``snmp_user``, ``snmp_auth_key``,
+        ``snmp_priv_key`` and ``port`` keys overriding the default SNMP credentials and port.
+        :param snmp_user: (optional) The default SNMP user to connect with.
+        :param snmp_auth_key: (optional) The default SNMP auth key to connect with.
+        :param snmp_priv_key: (optional) The default SNMP priv key to connect with.
+        :param concurrency: (optional) The maximum number of cards which are read at the same time.
+        :param deadline: (optional) The number of seconds a single card may take to be read.
+        :param timeout: (optional) The number of seconds to wait for each SNMP response.
+        :param port: (optional) The default UDP port of the cards.
+        :rtype: ``None``
+        """
+        defaults = {
+            'snmp_user': snmp_user,
+            'snmp_auth_key': snmp_auth_key,
+            'snmp_priv_key': snmp_priv_key,
+            'port': port
+        }
+        self._hosts = []
+        for i in hosts:
+            entry = dict(defaults)
+            entry.update({'host': i} if isinstance(i, str) else i)
+            self._hosts.append(entry)
+        self._concurrency = concurrency
+        self._deadline = deadline
+        self._timeout = timeout
+        # The event loop is kept between polls so that SNMP engines (and discovery) are reused.
+        self._loop = asyncio.new_event_loop()
+    def close(self) -> None:
+        """
+        Closes the SNMP engines and event loop used by this object. Returns ``None``.
+
+        :rtype: ``None``
+        """
+        # Imported here (as in _poll_host()), so that importing this package does not need
+        # pysnmp's asyncio API, which cannot be imported on every Python version it supports.
+        # pylint: disable=import-outside-toplevel
+        from tlnetcard_python.monitor.information.snmp_async import close_snmp_engines_async
+        close_snmp_engines_async(self._loop)
+        # Letting the dispatchers' timer tasks process their cancellation before closing the loop.
+        self._loop.run_until_complete(asyncio.sleep(0))
+        self._loop.close()
+    def get_hosts(self) -> List[str]:
+        """
+        Returns the IP addresses/DNS names of the cards polled by this object.
+
+        :rtype: ``List[str]``
+        """
+        return [i['host'] for i in self._hosts]
+    def poll(self, groups: List[str] = None
+             ) -> Iterator[Tuple[str, Dict[str, Dict[str, Any]], Exception]]:
+        """
+        Polls every card and yields a ``(host, results, error)`` tuple for each card as soon as it
+        has been read. ``results`` maps each group name to the same dictionary the equivalent
+        ``InOutParameters``, ``BatteryParameters`` or ``Identification`` function returns, and
+        ``error`` is ``None`` unless the card could not be read (in which case ``results`` is
+        empty).
+
+        :param groups: (optional) The names of the groups to poll (keys of ``POLL_GROUPS``). If no
+        groups are provided, every group is polled.
+        :rtype: ``Iterator[Tuple[str, Dict[str, Dict[str, Any]], Exception]]``
+        """
+        if groups is None:
+            groups = list(POLL_GROUPS)
+        # Checking the groups (and building the SNMP IDs) once for the whole sweep.
+        snmp_ids = Snapshot.get_snmp_ids(groups)
+
+        pending = self._loop.run_until_complete(self._start(groups, snmp_ids))
+        try:
+            while pending:
+                done, pending = self._loop.run_until_complete(
+                    asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                )
+                for task in done:
+                    yield task.result()
+        finally:
+            # Cancelling the remaining reads if the caller stopped iterating early.
+            for task in pending:
+                task.cancel()
+            if pending:
+                self._loop.run_until_complete(asyncio.wait(pending))
+    async def _poll_host(self, entry: Dict[str, Any], groups: List[str], snmp_ids: List[str],
+                         semaphore: asyncio.Semaphore
+                         ) -> Tuple[str, Dict[str, Dict[str, Any]], Exception]:
+        """
+        Reads the provided groups from a single card. Returns a ``(host, results, error)`` tuple.
+
+        :param entry: The host entry of the card.
+        :param groups: The names of the groups to poll.
+        :param snmp_ids: The union of the SNMP IDs of the groups.
+        :param semaphore: The semaphore limiting the number of cards read at the same time.
+        :rtype: ``Tuple[str, Dict[str, Dict[str, Any]], Exception]``
+        """
+        # pylint: disable=import-outside-toplevel
+        from tlnetcard_python.monitor.information.snmp_async import get_with_snmp_async
+        async with semaphore:
+            try:
+                values = await asyncio.wait_for(
+                    get_with_snmp_async(entry['host'], snmp_ids, entry['snmp_user'],
+                                        entry['snmp_auth_key'], entry['snmp_priv_key'],
+                                        self._timeout, strict=True, typed=True,
+                                        port=entry['port']),
+                    self._deadline
+                )
+                results = Snapshot.decode_snapshot(groups, values)
+            except asyncio.TimeoutError:
+                return entry['host'], {}, TimeoutError("No response from " + entry['host'] +
+                                                       " within " + str(self._deadline) +
+                                                       " seconds.")
+            # A failing card is reported to the caller rather than stopping the sweep.
+            except Exception as error: # pylint: disable=broad-except
+                return entry['host'], {}, error
+        return entry['host'], results, None
+    async def _start(self, groups: List[str], snmp_ids: List[str]) -> Set[asyncio.Future]:
+        """
+        Starts reading the provided groups from every card. Returns the set of running tasks.
+
+        :param groups: The names of the groups to poll.
+        :param snmp_ids: The union of the SNMP IDs of the groups.
+        :rtype: ``Set[asyncio.Future]``
+        """
+        # Created here so that the semaphore belongs to this object's event loop.
+        semaphore = asyncio.Semaphore(self._concurrency)
+        return {asyncio.ensure_future(self._poll_host(i, groups, snmp_ids, semaphore))
+                for i in self._hosts}
@@ -0,0 +1,258 @@
+"""
+tlnetcard_python.monitor.information.html_scraper
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Provides the ``ElementParser`` object, which streams the HTML of a TLNET Supervisor webpage and
+collects the text of elements by their ID or Xpath without running a browser, and the
+find_script_values() and find_data_urls() methods, which recover values that are filled in by the
+scripts of a webpage.
+"""
+
+# Standard library.
+from html import unescape
+from html.parser import HTMLParser
+import re
+from typing import Dict, List, Tuple
+
+# Elements which never have content (and therefore never have an end tag).
+_VOID_ELEMENTS = {'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'keygen', 'link',
+                  'meta', 'param', 'source', 'track', 'wbr'}
+# Elements whose end tag may be omitted, mapped to the elements which close them when started.
+_IMPLIED_END_TAGS = {
+    'td': {'td', 'th', 'tr'},
+    'th': {'td', 'th', 'tr'},
+    'tr': {'tr'},
+    'li': {'li'},
+    'option': {'option'},
+    'p': {'p', 'div', 'table', 'ul', 'ol'}
+}
+# Elements at which the search for an element to implicitly close stops.
+_SCOPE_ELEMENTS = {'table', 'tbody', 'thead', 'tfoot', 'ul', 'ol', 'select', 'html', 'body'}
+# Patterns of the URLs scripts explicitly GET data from. Other requests (POSTs, or options objects
+# which may be either) can change settings or log out, so they are never followed.
+_DATA_URL_PATTERNS = [
+    re.compile(r"""\.open\(\s*['"]GET['"]\s*,\s*['"]([^'"]+)['"]""", re.IGNORECASE),
+    re.compile(r"""\$\.(?:get|getJSON)\(\s*['"]([^'"]+)['"]""")
+]
+# Pages which change settings or end the session when requested, even by GET.
+_UNSAFE_URL = re.compile(r"""(?:^|/)(?:adm_[^/]*|[^/]*log_?(?:out|off)[^/]*)$""", re.IGNORECASE)
+
+# pylint: disable=too-many-instance-attributes
+class ElementParser(HTMLParser):
+    """
+    A streaming HTML parser which collects the text of the provided elements, either by their ID or
+    by their Xpath. Xpaths are matched the way a browser builds its DOM, so the ``tbody`` elements
+    browsers insert into tables (and end tags the webpage omits) are accounted for. The text of each
+    element is whitespace-collapsed, as with Selenium's ``WebElement.text``. Inline scripts and the
+    sources of external scripts are kept for ``find_script_values()`` and ``find_data_urls()``.
+
+    Basic Usage:
+
+    >>> from tlnetcard_python.monitor.information.html_scraper import ElementParser
+    >>> parser = ElementParser(["UPS_BATTSTS"])
+    >>> parser.feed('<table><tr><td id="UPS_BATTSTS"> Normal </td></tr></table>')
+    >>> parser.close()
+    >>> parser.get_values()
+    ['Normal']
+    """
+    def __init__(self, element_ids: List[str], xpath: bool = False) -> None:
+        """
+        Initializes the ``ElementParser`` object. Returns ``None``.
+
+        :param element_ids: A list of HTML element IDs to collect. These will instead be Xpaths if
+        ``xpath`` is set to ``True``.
+        :param xpath: (optional) Whether Xpaths should be used to find elements instead of IDs.
+        :rtype: ``None``
+        """
+        super().__init__(convert_charrefs=True)
+        self._xpath = xpath
+        # Element IDs (or parsed Xpaths) mapped to their positions in element_ids.
+        self._targets = {}
+        for i, element_id in enumerate(element_ids):
+            key = self._parse_xpath(element_id) if xpath else element_id
+            self._targets.setdefault(key, []).append(i)
+        self._values = [None] * len(element_ids)
+        # Each open element is a [tag, child tag counts, path] list.
+        self._stack = [[None, {}, ()]]
+        # Each element being collected is a [stack depth, positions, text pieces] list.
+        self._captures = []
+        self._script = None
+        self._scripts = []
+        self._script_sources = []
+    def get_script_sources(self) -> List[str]:
+        """
+        Returns the ``src`` attributes of the external scripts of the webpage.
+
+        :rtype: ``List[str]``
+        """
+        return list(self._script_sources)
+    def get_scripts(self) -> List[str]:
+        """
+        Returns the contents of the inline scripts of the webpage.
+
+        :rtype: ``List[str]``
+        """
+        return list(self._scripts)
+    def get_values(self) -> List[str]:
+        """
+        Returns the text of the elements (in the order they were provided). Elements which were not
+        found are returned as empty strings.
+
+        :rtype: ``List[str]``
+        """
+        return ["" if i is None else i for i in self._values]
+    def handle_data(self, data: str) -> None:
+        """
+        Handles text found in the webpage. Returns ``None``.
+
+        :param data: The text.
+        :rtype: ``None``
+        """
+        if self._script is not None:
+            self._script.append(data)
+            return
+        for capture in self._captures:
+            capture[2].append(data)
+    def handle_endtag(self, tag: str) -> None:
+        """
+        Handles an end tag found in the webpage. Returns ``None``.
+
+        :param tag: The name of the tag.
+        :rtype: ``None``
+        """
+        if tag in ('script', 'style') and self._script is not None:
+            if tag == 'script':
+                self._scripts.append("".join(self._script))
+            self._script = None
+        # Stray end tags are ignored, as browsers do.
+        for depth in range(len(self._stack) - 1, 0, -1):
+            if self._stack[depth][0] == tag:
+                self._pop(depth)
+                return
+    def handle_startendtag(self, tag: str, attrs: List[Tuple[str, str]]) -> None:
+        """
+        Handles a self-closing tag found in the webpage. Returns ``None``.
+
+        :param tag: The name of the tag.
+        :param attrs: The attributes of the tag.
+        :rtype: ``None``
+        """
+        self.handle_starttag(tag, attrs)
+        if tag not in _VOID_ELEMENTS:
+            self.handle_endtag(tag)
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, str]]) -> None:
+        """
+        Handles a start tag found in the webpage. Returns ``None``.
+
+        :param tag: The name of the tag.
+        :param attrs: The attributes of the tag.
+        :rtype: ``None``
+        """
+        attrs = dict(attrs)
+        if tag == 'script' and attrs.get('src'):
+            self._script_sources.append(attrs['src'])
+        # The contents of scripts and styles are not part of the text of an element.
+        if tag in ('script', 'style'):
+            self._script = []
+        # Closing elements whose end tag was omitted.
+        closes = {i for i in _IMPLIED_END_TAGS if tag in _IMPLIED_END_TAGS[i]}
+        close_depth = None
+        for depth in range(len(self._stack) - 1, 0, -1):
+            if self._stack[depth][0] in _SCOPE_ELEMENTS:
+                break
+            if self._stack[depth][0] in closes:
+                close_depth = depth
+        if close_depth is not None:
+            self._pop(close_depth)
+        # Browsers place table rows inside a tbody element, even if the webpage has none.
+        if tag == 'tr' and self._stack[-1][0] == 'table':
+            self._push('tbody')
+        self._push(tag)
+        key = self._stack[-1][2] if self._xpath else attrs.get('id')
+        if key in self._targets:
+            self._captures.append([len(self._stack) - 1, self._targets[key], []])
+        if tag in _VOID_ELEMENTS:
+            self._pop(len(self._stack) - 1)
+    def _pop(self, depth: int) -> None:
+        """
+        Closes every open element from the provided stack depth up. Returns ``None``.
+
+        :param depth: The stack depth of the outermost element to close.
+        :rtype: ``None``
+        """
+        del self._stack[depth:]
+        while self._captures and self._captures[-1][0] >= depth:
+            _, positions, pieces = self._captures.pop()
+            text = " ".join("".join(pieces).split())
+            for i in positions:
+                if self._values[i] is None:
+                    self._values[i] = text
+    def _push(self, tag: str) -> None:
+        """
+        Opens an element. Returns ``None``.
+
+        :param tag: The name of the tag.
+        :rtype: ``None``
+        """
+        parent = self._stack[-1]
+        parent[1][tag] = parent[1].get(tag, 0) + 1
+        self._stack.append([tag, {}, parent[2] + ((tag, parent[1][tag]),)])
+    @staticmethod
+    def _parse_xpath(xpath: str) -> Tuple[Tuple[str, int], ...]:
+        """
+        Parses an absolute Xpath (e.g. "/html/body/table/tbody/tr[5]/td[3]") into a tuple of
+        ``(tag, index)`` tuples. Returns ``Tuple[Tuple[str, int], ...]``.
+
+        :param xpath: The Xpath.
+        :rtype: ``Tuple[Tuple[str, int], ...]``
+        """
+        path = []
+        for step in xpath.strip("/").split("/"):
+            tag, _, index = step.partition("[")
+            path.append((tag.lower(), int(index.rstrip("]")) if index else 1))
+        return tuple(path)
+def find_data_urls(scripts: List[str]) -> List[str]:
+    """
+    Finds the URLs the provided scripts GET data from (with ``XMLHttpRequest``, ``$.get()`` or
+    ``$.getJSON()``), leaving out the pages which change settings or log out. Returns ``List[str]``.
+
+    :param scripts: The contents of the scripts.
+    :rtype: ``List[str]``
+    """
+    urls = []
+    for script in scripts:
+        for pattern in _DATA_URL_PATTERNS:
+            for url in pattern.findall(script):
+                if url not in urls and not _UNSAFE_URL.search(url.split("?")[0].split("#")[0]):
+                    urls.append(url)
+    return urls
+def find_script_values(text: str, element_ids: List[str]) -> Dict[str, str]:
+    """
+    Finds the values scripts (or data responses) assign to the provided element IDs, whether the
+    script sets the element directly (e.g. ``document.getElementById("ID").innerHTML = "value"``) or
+    the ID is used as a variable, object key or form field (e.g. ``ID = "value"``, ``"ID": 60`` or
+    ``ID=60``). Unquoted values are only recognized when they are numbers, dates or times. Returns
+    ``Dict[str, str]`` of the element IDs which were found.
+
+    :param text: The contents of the script or data response.
+    :param element_ids: A list of HTML element IDs to look for.
+    :rtype: ``Dict[str, str]``
+    """
+    out = {}
+    for element_id in element_ids:
+        name = re.escape(element_id)
+        patterns = [
+            r"""getElementById\(\s*['"]""" + name +
+            r"""['"]\s*\)\s*\.\s*(?:innerHTML|innerText|textContent|value)""" +
+            r"""\s*=\s*(['"])(.*?)(?<!\\)\1""",
+            r"""(?<![\w.])['"]?""" + name + r"""['"]?\s*[:=]\s*(['"])(.*?)(?<!\\)\1""",
+            r"""(?<![\w.])['"]?""" + name + r"""['"]?\s*[:=]\s*()(-?\d[\d.:/-]*)"""
+        ]
+        for pattern in patterns:
+            match = re.search(pattern, text, re.DOTALL)
+            if match is not None:
+                # Values may contain markup, which a browser would not show.
+                value = unescape(re.sub(r"<[^>]*>", " ", match.group(2).replace('\\"', '"')))
+                out[element_id] = " ".join(value.split())
+                break
+    return out
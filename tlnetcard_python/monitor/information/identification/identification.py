@@ -6,22 +6,22 @@ This module provides a ``Identification`` object to provide the functionality of
 Monitor -> Information -> Identification.
 """
 # Standard library.
-from typing import Any, Dict
+from typing import Any, Dict, List
 # Required internal classes/functions.
 from tlnetcard_python.login import Login
-from tlnetcard_python.monitor.information.information import get_with_snmp, scrape_with_selenium
+from tlnetcard_python.monitor.information import oids
+from tlnetcard_python.monitor.information.information import get_with_snmp, scrape_with_requests
 
 class Identification:
     """
     A TLNET Supervisor ``Identification`` object. Provides the functionality of the equivalent
     webpage TLNET Supervisor -> Monitor -> Information -> Identification. This functionality is
-    provided through either SNMP or Selenium per the user's choice. While Selenium requires no
-    additional arguments at runtime, it does require Google Chrome to be installed as well as the
-    associated WebDriver (see the README.md for more details), as well as suffering from
-    greatly-reduced speeds. As such, it is only recommended that Selenium be used on smaller
-    workloads (if you must use it at all). Alternatively, SNMP can be used to retrieve values at a
-    much greater speed, although this will require more arguments (SNMP user, auth key, and priv key
-    as applicable), all of which can be retrieved using the
+    provided through either SNMP or by scraping the webpage per the user's choice. Scraping requires
+    no additional arguments at runtime, and only falls back to Selenium (which requires Google
+    Chrome to be installed as well as the associated WebDriver, see the README.md for more details)
+    for values which cannot be read from the webpage and its scripts. Alternatively, SNMP can be
+    used to retrieve values at a much greater speed, although this will require more arguments (SNMP
+    user, auth key, and priv key as applicable), all of which can be retrieved using the
     ``tlnetcard_python.system.notification.Snmpv3Usm`` object.
 
     Basic Usage:
@@ -41,13 +41,22 @@ class Identification:
     'Interface Firmware': '01.12.05c', 'UPS Serial Number': '2628ELCPS795100166',
     'Interface Serial Number': '2634BLCAC897C00163', 'MAC Address': '00-06-67-06-08-c0'}
 
-    Or they can be run using Selenium:
+    Or they can be run by scraping the webpage:
 
     >>> card_identification.get_identification_info(snmp=False)
     {'Model': 'SU1500RTXLCD2U', 'Type': 'On line', 'UPS Firmware': 'FW2567R16',
     'Interface Firmware': '01.12.05c', 'UPS Serial Number': '2628ELCPS795100166',
     'Interface Serial Number': '2634BLCAC897C00163', 'MAC Address': '00-06-67-06-08-c0'}
     """
+    # SNMP IDs of the identification information (see tlnetcard_python.monitor.information.oids).
+    IDENTIFICATION_SNMP_DICT = {
+        'Model': oids.UPS_IDENT_MODEL,
+        'UPS Firmware': oids.UPS_IDENT_UPS_FIRMWARE,
+        'Interface Firmware': oids.UPS_IDENT_AGENT_FIRMWARE,
+        'UPS Serial Number': oids.TRIPPLITE_UPS_SERIAL_NUMBER,
+        'Interface Serial Number': oids.TRIPPLITE_AGENT_SERIAL_NUMBER,
+        'MAC Address': oids.IF_PHYS_ADDRESS_2
+    }
     def __init__(self, login_object: Login) -> None:
         """
         Initializes the ``Identification`` object. Returns ``None``.
@@ -57,6 +66,27 @@ class Identification:
         """
         self._login_object = login_object
         self._get_url = login_object.get_base_url() + "/en/ups/info_ident.asp"
+    @classmethod
+    def decode_identification_info(cls, values: List[Any]) -> Dict[str, str]:
+        """
+        Returns the identifying information decoded from the SNMP values of
+        ``IDENTIFICATION_SNMP_DICT`` (in the same order) as a dictionary.
+
+        :param values: The SNMP values returned for ``IDENTIFICATION_SNMP_DICT``.
+        :rtype: ``Dict[str, str]``
+        """
+        snmp_ids = list(cls.IDENTIFICATION_SNMP_DICT.values())
+        model, ups_firm, int_firm, ups_ser, int_ser, mac = oids.OID_REGISTRY.decode_all(snmp_ids,
+                                                                                       values)
+        return {
+            'Model': model,
+            'Type': 'On line',
+            'UPS Firmware': ups_firm,
+            'Interface Firmware': int_firm,
+            'UPS Serial Number': ups_ser,
+            'Interface Serial Number': int_ser,
+            'MAC Address': mac
+        }
     # pylint: disable=too-many-locals
     def get_identification_info(self, snmp: bool = True, snmp_user: str = "",
                                 snmp_auth_key: str = "", snmp_priv_key: str = "") -> Dict[str, str]:
@@ -64,7 +94,7 @@ class Identification:
         Returns UPS identifying information as a dictionary.
 
         :param snmp: (optional) Whether SNMP should be used or not. Setting this value to ``False``
-        will result in Selenium being used.
+        will result in the webpage being scraped.
         :param snmp_user: (optional) The SNMP user to connect with.
         :param snmp_auth_key: (optional) The SNMP auth key to connect with.
         :param snmp_priv_key: (optional) The SNMP priv key to connect with.
@@ -72,41 +102,17 @@ class Identification:
         """
         if snmp:
             # SNMP will be used to get values. This is the preferred method.
-            # Generating SNMP ID dictionary.
-            snmp_dict = {
-                'Model': 'iso.3.6.1.2.1.33.1.1.2',
-                'UPS Firmware': 'iso.3.6.1.2.1.33.1.1.3',
-                'Interface Firmware': 'iso.3.6.1.2.1.33.1.1.4',
-                'UPS Serial Number': 'iso.3.6.1.4.1.850.100.1.1.2',
-                'Interface Serial Number': 'iso.3.6.1.4.1.850.100.1.1.4',
-                'MAC Address': 'iso.3.6.1.2.1.2.2.1.6.2'
-            }
-
             # Getting values.
-            host = self._login_object.get_host()
-            timeout = self._login_object.get_timeout()
-            snmp_ids = [snmp_dict[i] for i in snmp_dict]
-            model, ups_firm, int_firm, ups_ser, int_ser, mac = get_with_snmp(host,
-                                                                             snmp_ids, snmp_user,
-                                                                             snmp_auth_key,
-                                                                             snmp_priv_key, timeout)
+            values = get_with_snmp(self._login_object.get_host(),
+                                   list(self.IDENTIFICATION_SNMP_DICT.values()), snmp_user,
+                                   snmp_auth_key, snmp_priv_key,
+                                   self._login_object.get_timeout(), typed=True)
 
             # Generating out dictionary.
-            out = {
-                'Model': model,
-                'Type': 'On line',
-                'UPS Firmware': ups_firm,
-                'Interface Firmware': int_firm,
-                'UPS Serial Number': ups_ser,
-                'Interface Serial Number': int_ser,
-                'MAC Address': mac
-            }
+            out = self.decode_identification_info(values)
         else:
-            # Selenium will be used to scrape values. This method is slower than using SNMP.
+            # The webpage will be scraped for values. This method is slower than using SNMP.
             # Getting values.
-            host = self._login_object.get_host()
-            session = self._login_object.get_session()
-            timeout = self._login_object.get_timeout()
             # For some reason the values on this page don't have IDs so Xpaths will be used instead.
             # pylint: disable=line-too-long
             xpaths = ["/html/body/table/tbody/tr[5]/td[3]/table/tbody/tr[3]/td[1]/div/table/tbody/tr[2]/td[2]/div/table/tbody/tr[1]/td[2]",
@@ -116,12 +122,7 @@ class Identification:
                       "/html/body/table/tbody/tr[5]/td[3]/table/tbody/tr[3]/td[1]/div/table/tbody/tr[2]/td[2]/div/table/tbody/tr[6]/td[2]",
                       "/html/body/table/tbody/tr[5]/td[3]/table/tbody/tr[3]/td[1]/div/table/tbody/tr[2]/td[2]/div/table/tbody/tr[7]/td[2]"]
             # pylint: enable=line-too-long
-            model, ups_firm, int_firm, ups_ser, int_ser, mac = scrape_with_selenium(host,
-                                                                                    xpaths,
-                                                                                    self._get_url,
-                                                                                    session,
-                                                                                    timeout,
-                                                                                    xpath=True)
+            model, ups_firm, int_firm, ups_ser, int_ser, mac = self._scrape(xpaths, xpath=True)
 
             # Generating out dictionary.
             out = {
@@ -134,20 +135,36 @@ class Identification:
                 'MAC Address': mac
             }
         return out
-        # pylint: disable=too-many-locals
+    async def get_identification_info_async(self, snmp_user: str = "", snmp_auth_key: str = "",
+                                            snmp_priv_key: str = "") -> Dict[str, str]:
+        """
+        Returns UPS identifying information as a dictionary without blocking the event loop. This is
+        the asyncio counterpart of ``get_identification_info()``, and always uses SNMP.
+
+        :param snmp_user: (optional) The SNMP user to connect with.
+        :param snmp_auth_key: (optional) The SNMP auth key to connect with.
+        :param snmp_priv_key: (optional) The SNMP priv key to connect with.
+        :rtype: ``Dict[str, str]``
+        """
+        # Imported here, as pysnmp's asyncio API cannot be imported on every Python version
+        # this package supports, and the synchronous functions of this class do not need it.
+        # pylint: disable=import-outside-toplevel
+        from tlnetcard_python.monitor.information.snmp_async import get_with_snmp_async
+        values = await get_with_snmp_async(self._login_object.get_host(),
+                                           list(self.IDENTIFICATION_SNMP_DICT.values()),
+                                           snmp_user, snmp_auth_key, snmp_priv_key,
+                                           self._login_object.get_timeout(), typed=True)
+        return self.decode_identification_info(values)
     def get_ups_rating(self) -> Dict[str, Any]:
         """
-        Returns UPS rating information as a dictionary. This function uses Selenium only, as UPS
-        rating values and not output with SNMP. These values should all be the same between UPS
+        Returns UPS rating information as a dictionary. This function only scrapes the webpage, as
+        UPS rating values and not output with SNMP. These values should all be the same between UPS
         with identical hardware.
 
         :rtype: ``Dict[str, str]``
         """
-        # Selenium will be used to scrape values. This method is slower than using SNMP.
+        # The webpage will be scraped for values. This method is slower than using SNMP.
         # Getting values.
-        host = self._login_object.get_host()
-        session = self._login_object.get_session()
-        timeout = self._login_object.get_timeout()
         # For some reason the values on this page don't have IDs so Xpaths will be used instead.
         # pylint: disable=line-too-long
         xpaths = ["/html/body/table/tbody/tr[5]/td[3]/table/tbody/tr[3]/td[3]/div/table/tbody/tr[2]/td[2]/div/table/tbody/tr[1]/td[2]",
@@ -160,8 +177,7 @@ class Identification:
                   "/html/body/table/tbody/tr[5]/td[3]/table/tbody/tr[3]/td[3]/div/table/tbody/tr[2]/td[2]/div/table/tbody/tr[8]/td[2]"]
         # pylint: enable=line-too-long
 
-        rating_info = scrape_with_selenium(host, xpaths, self._get_url, session, timeout,
-                                           xpath=True)
+        rating_info = self._scrape(xpaths, xpath=True)
         volt_amp, power, in_volt, out_volt, freq, batt_volt, hi_volt, low_volt = rating_info
         # Generating out dictionary.
         out = {
@@ -175,3 +191,19 @@ class Identification:
             'Low Transfer Voltage (V)': int(low_volt.split(" ")[0])
         }
         return out
+    def _scrape(self, element_ids: List[str], xpath: bool = False) -> List[str]:
+        """
+        Scrapes the provided web elements from the webpage of this object (see
+        ``scrape_with_requests()``), through the page cache of the ``Login`` object. Returns
+        ``List[str]``.
+
+        :param element_ids: A list of HTML element IDs to retrieve. These will instead be Xpaths if
+        ``xpath`` is set to ``True``.
+        :param xpath: (optional) Whether Xpath should be used to find element values instead of IDs.
+        :rtype: ``List[str]``
+        """
+        return scrape_with_requests(self._login_object.get_host(), element_ids, self._get_url,
+                                    self._login_object.get_session(),
+                                    self._login_object.get_timeout(), xpath,
+                                    self._login_object.get_reject_invalid_certs(),
+                                    cache=self._login_object.get_page_cache())
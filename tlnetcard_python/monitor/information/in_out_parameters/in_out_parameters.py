@@ -7,22 +7,23 @@ This module provides a ``InOutParameters`` object to provide the functionality o
 """
 
 # Standard library.
-from typing import Any, Dict
+from typing import Any, Dict, List
 # Required internal classes/functions.
 from tlnetcard_python.login import Login
-from tlnetcard_python.monitor.information.information import get_with_snmp, scrape_with_selenium
+from tlnetcard_python.monitor.information import oids
+from tlnetcard_python.monitor.information.information import get_with_snmp, scrape_with_requests
+from tlnetcard_python.monitor.information.information import walk_with_snmp
 
 class InOutParameters:
     """
     A TLNET Supervisor ``InOutParameters`` object. Provides the functionality of the equivalent
     webpage TLNET Supervisor -> Monitor -> Information -> In/Out Parameters. This functionality is
-    provided through either SNMP or Selenium per the user's choice. While Selenium requires no
-    additional arguments at runtime, it does require Google Chrome to be installed as well as the
-    associated WebDriver (see the README.md for more details), as well as suffering from
-    greatly-reduced speeds. As such, it is only recommended that Selenium be used on smaller
-    workloads (if you must use it at all). Alternatively, SNMP can be used to retrieve values at a
-    much greater speed, although this will require more arguments (SNMP user, auth key, and priv key
-    as applicable), all of which can be retrieved using the
+    provided through either SNMP or by scraping the webpage per the user's choice. Scraping requires
+    no additional arguments at runtime, and only falls back to Selenium (which requires Google
+    Chrome to be installed as well as the associated WebDriver, see the README.md for more details)
+    for values which cannot be read from the webpage and its scripts. Alternatively, SNMP can be
+    used to retrieve values at a much greater speed, although this will require more arguments (SNMP
+    user, auth key, and priv key as applicable), all of which can be retrieved using the
     ``tlnetcard_python.system.notification.Snmpv3Usm`` object.
 
     Basic Usage:
@@ -41,12 +42,58 @@ class InOutParameters:
     {'Output Source': 'Normal', 'Frequency (Hz)': 59.9, 'Voltage (V)': 120.0, 'Current (A)': 3.6,
     'Power (Watt)': 409, 'Loading (%)': 30}
 
-    Or they can be run using Selenium:
+    Or they can be run by scraping the webpage:
 
     >>> card_io_parameters.get_output_measurements(snmp=False)
     {'Output Source': 'Normal', 'Frequency (Hz)': 59.9, 'Voltage (V)': 120.0, 'Current (A)': 3.6,
     'Power (Watt)': 409, 'Loading (%)': 30}
     """
+    # SNMP IDs of the bypass measurements (see tlnetcard_python.monitor.information.oids).
+    BYPASS_SNMP_DICT = {
+        'Frequency': oids.UPS_BYPASS_FREQUENCY,
+        'Voltage': oids.UPS_BYPASS_VOLTAGE_1,
+        'Current': oids.UPS_BYPASS_CURRENT_1,
+        'Power': oids.UPS_BYPASS_POWER_1
+    }
+    # SNMP IDs of the input measurements.
+    INPUT_SNMP_DICT = {
+        'Frequency': oids.UPS_INPUT_FREQUENCY_1,
+        'Voltage': oids.UPS_INPUT_VOLTAGE_1
+    }
+    # SNMP IDs of the output measurements.
+    OUTPUT_SNMP_DICT = {
+        'Output': oids.UPS_OUTPUT_SOURCE,
+        'Frequency': oids.UPS_OUTPUT_FREQUENCY,
+        'Voltage': oids.UPS_OUTPUT_VOLTAGE_1,
+        'Current': oids.UPS_OUTPUT_CURRENT_1,
+        'Power': oids.UPS_OUTPUT_POWER_1,
+        'Loading': oids.UPS_OUTPUT_PERCENT_LOAD_1
+    }
+    # SNMP IDs of the number of lines and the columns of the bypass table (upsBypassTable).
+    BYPASS_NUM_LINES_SNMP_ID = oids.UPS_BYPASS_NUM_LINES
+    BYPASS_TABLE_SNMP_DICT = {
+        'Voltage': oids.UPS_BYPASS_VOLTAGE,
+        'Current': oids.UPS_BYPASS_CURRENT,
+        'Power': oids.UPS_BYPASS_POWER
+    }
+    # SNMP IDs of the number of lines and the columns of the input table (upsInputTable).
+    INPUT_NUM_LINES_SNMP_ID = oids.UPS_INPUT_NUM_LINES
+    INPUT_TABLE_SNMP_DICT = {
+        'Frequency': oids.UPS_INPUT_FREQUENCY,
+        'Voltage': oids.UPS_INPUT_VOLTAGE,
+        'Current': oids.UPS_INPUT_CURRENT,
+        'Power': oids.UPS_INPUT_TRUE_POWER
+    }
+    # SNMP IDs of the number of lines and the columns of the output table (upsOutputTable).
+    OUTPUT_NUM_LINES_SNMP_ID = oids.UPS_OUTPUT_NUM_LINES
+    OUTPUT_TABLE_SNMP_DICT = {
+        'Voltage': oids.UPS_OUTPUT_VOLTAGE,
+        'Current': oids.UPS_OUTPUT_CURRENT,
+        'Power': oids.UPS_OUTPUT_POWER,
+        'Loading': oids.UPS_OUTPUT_PERCENT_LOAD
+    }
+    # Output source status is actually returned as an integer whose values map as follows:
+    OUTPUT_SOURCE_DICT = oids.OUTPUT_SOURCE_DICT
     def __init__(self, login_object: Login) -> None:
         """
         Initializes the ``InOutParameters`` object. Returns ``None``.
@@ -56,6 +103,123 @@ class InOutParameters:
         """
         self._login_object = login_object
         self._get_url = login_object.get_base_url() + "/en/ups/info_io.asp"
+    @classmethod
+    def decode_bypass_line(cls, values: List[Any]) -> Dict[str, Any]:
+        """
+        Returns a line of the bypass table decoded from the SNMP values of
+        ``BYPASS_TABLE_SNMP_DICT`` (in the same order) as a dictionary.
+
+        :param values: The SNMP values returned for ``BYPASS_TABLE_SNMP_DICT``.
+        :rtype: ``Dict[str, Any]``
+        """
+        snmp_ids = list(cls.BYPASS_TABLE_SNMP_DICT.values())
+        volts, curr, power = oids.OID_REGISTRY.decode_all(snmp_ids, values)
+        return {
+            'Voltage (V)': volts,
+            'Current (A)': curr,
+            'Power (Watt)': power
+        }
+    @classmethod
+    def decode_bypass_measurements(cls, values: List[Any]) -> Dict[str, Any]:
+        """
+        Returns the bypass measurements decoded from the SNMP values of ``BYPASS_SNMP_DICT`` (in the
+        same order) as a dictionary.
+
+        :param values: The SNMP values returned for ``BYPASS_SNMP_DICT``.
+        :rtype: ``Dict[str, Any]``
+        """
+        snmp_ids = list(cls.BYPASS_SNMP_DICT.values())
+        freq, volts, curr, power = oids.OID_REGISTRY.decode_all(snmp_ids, values)
+        return {
+            'Frequency (Hz)': freq,
+            'Voltage (V)': volts,
+            'Current (A)': curr,
+            'Power (Watt)': power
+        }
+    @classmethod
+    def decode_input_line(cls, values: List[Any]) -> Dict[str, Any]:
+        """
+        Returns a line of the input table decoded from the SNMP values of ``INPUT_TABLE_SNMP_DICT``
+        (in the same order) as a dictionary.
+
+        :param values: The SNMP values returned for ``INPUT_TABLE_SNMP_DICT``.
+        :rtype: ``Dict[str, Any]``
+        """
+        snmp_ids = list(cls.INPUT_TABLE_SNMP_DICT.values())
+        freq, volts, curr, power = oids.OID_REGISTRY.decode_all(snmp_ids, values)
+        return {
+            'Frequency (Hz)': freq,
+            'Voltage (V)': volts,
+            'Current (A)': curr,
+            'Power (Watt)': power
+        }
+    @classmethod
+    def decode_input_measurements(cls, values: List[Any]) -> Dict[str, Any]:
+        """
+        Returns the input measurements decoded from the SNMP values of ``INPUT_SNMP_DICT`` (in the
+        same order) as a dictionary.
+
+        :param values: The SNMP values returned for ``INPUT_SNMP_DICT``.
+        :rtype: ``Dict[str, Any]``
+        """
+        snmp_ids = list(cls.INPUT_SNMP_DICT.values())
+        freq, volts = oids.OID_REGISTRY.decode_all(snmp_ids, values)
+        return {
+            'Frequency (Hz)': freq,
+            'Voltage (V)': volts
+        }
+    @classmethod
+    def decode_output_line(cls, values: List[Any]) -> Dict[str, Any]:
+        """
+        Returns a line of the output table decoded from the SNMP values of
+        ``OUTPUT_TABLE_SNMP_DICT`` (in the same order) as a dictionary.
+
+        :param values: The SNMP values returned for ``OUTPUT_TABLE_SNMP_DICT``.
+        :rtype: ``Dict[str, Any]``
+        """
+        snmp_ids = list(cls.OUTPUT_TABLE_SNMP_DICT.values())
+        volts, curr, power, load = oids.OID_REGISTRY.decode_all(snmp_ids, values)
+        return {
+            'Voltage (V)': volts,
+            'Current (A)': curr,
+            'Power (Watt)': power,
+            'Loading (%)': load
+        }
+    @classmethod
+    def decode_output_measurements(cls, values: List[Any]) -> Dict[str, Any]:
+        """
+        Returns the output measurements decoded from the SNMP values of ``OUTPUT_SNMP_DICT`` (in the
+        same order) as a dictionary.
+
+        :param values: The SNMP values returned for ``OUTPUT_SNMP_DICT``.
+        :rtype: ``Dict[str, Any]``
+        """
+        snmp_ids = list(cls.OUTPUT_SNMP_DICT.values())
+        out, freq, volts, curr, power, load = oids.OID_REGISTRY.decode_all(snmp_ids, values)
+        return {
+            'Output Source': out,
+            'Frequency (Hz)': freq,
+            'Voltage (V)': volts,
+            'Current (A)': curr,
+            'Power (Watt)': power,
+            'Loading (%)': load
+        }
+    def get_bypass_lines(self, snmp_user: str = "", snmp_auth_key: str = "",
+                         snmp_priv_key: str = "") -> List[Dict[str, Any]]:
+        """
+        Returns the measurements of every line of the bypass table as a list of dictionaries (one
+        per line). This function uses SNMP only.
+
+        :param snmp_user: (optional) The SNMP user to connect with.
+        :param snmp_auth_key: (optional) The SNMP auth key to connect with.
+        :param snmp_priv_key: (optional) The SNMP priv key to connect with.
+        :rtype: ``List[Dict[str, Any]]``
+        """
+        rows = walk_with_snmp(self._login_object.get_host(), self.BYPASS_NUM_LINES_SNMP_ID,
+                              list(self.BYPASS_TABLE_SNMP_DICT.values()), snmp_user,
+                              snmp_auth_key, snmp_priv_key,
+                              self._login_object.get_timeout(), typed=True)
+        return [self.decode_bypass_line(i) for i in rows]
     def get_bypass_measurements(self, snmp: bool = True, snmp_user: str = "",
                                 snmp_auth_key: str = "", snmp_priv_key: str = ""
                                 ) -> Dict[str, Any]:
@@ -63,7 +227,7 @@ class InOutParameters:
         Returns battery bypass measurements as a dictionary.
 
         :param snmp: (optional) Whether SNMP should be used or not. Setting this value to ``False``
-        will result in Selenium being used.
+        will result in the webpage being scraped.
         :param snmp_user: (optional) The SNMP user to connect with.
         :param snmp_auth_key: (optional) The SNMP auth key to connect with.
         :param snmp_priv_key: (optional) The SNMP priv key to connect with.
@@ -71,38 +235,18 @@ class InOutParameters:
         """
         if snmp:
             # SNMP will be used to get values. This is the preferred method.
-            # Generating SNMP ID dictionary.
-            snmp_dict = {
-                'Frequency': 'iso.3.6.1.2.1.33.1.5.1', # In decihertz
-                                                       # (i.e. divide this value by 10).
-                'Voltage': 'iso.3.6.1.2.1.33.1.5.3.1.2.1',
-                'Current': 'iso.3.6.1.2.1.33.1.5.3.1.3.1', # In deciamps
-                                                           # (i.e. divide this value by 10).
-                'Power': 'iso.3.6.1.2.1.33.1.5.3.1.4.1'
-            }
-
             # Getting values.
-            freq, volts, curr, power = get_with_snmp(self._login_object.get_host(),
-                                                     [snmp_dict[i] for i in snmp_dict], snmp_user,
-                                                     snmp_auth_key, snmp_priv_key,
-                                                     self._login_object.get_timeout())
+            values = get_with_snmp(self._login_object.get_host(),
+                                   list(self.BYPASS_SNMP_DICT.values()), snmp_user, snmp_auth_key,
+                                   snmp_priv_key, self._login_object.get_timeout(), typed=True)
 
             # Generating out dictionary.
-            out = {
-                'Frequency (Hz)': float(freq)/10,
-                'Voltage (V)': float(volts),
-                'Current (A)': float(curr)/10,
-                'Power (Watt)': int(power)
-            }
+            out = self.decode_bypass_measurements(values)
         else:
-            # Selenium will be used to scrape values. This method is slower than using SNMP.
+            # The webpage will be scraped for values. This method is slower than using SNMP.
             # Getting values.
-            freq, volts, curr, power = scrape_with_selenium(self._login_object.get_host(),
-                                                            ["UPS_BYFREQ1", "UPS_BYVOLT1",
-                                                             "UPS_BYAMP1", "UPS_BYPOWER1"],
-                                                            self._get_url,
-                                                            self._login_object.get_session(),
-                                                            self._login_object.get_timeout())
+            freq, volts, curr, power = self._scrape(["UPS_BYFREQ1", "UPS_BYVOLT1",
+                                                     "UPS_BYAMP1", "UPS_BYPOWER1"])
 
             # Generating out dictionary.
             out = {
@@ -112,6 +256,42 @@ class InOutParameters:
                 'Power (Watt)': int(power)
             }
         return out
+    async def get_bypass_measurements_async(self, snmp_user: str = "", snmp_auth_key: str = "",
+                                            snmp_priv_key: str = "") -> Dict[str, Any]:
+        """
+        Returns battery bypass measurements as a dictionary without blocking the event loop. This is
+        the asyncio counterpart of ``get_bypass_measurements()``, and always uses SNMP.
+
+        :param snmp_user: (optional) The SNMP user to connect with.
+        :param snmp_auth_key: (optional) The SNMP auth key to connect with.
+        :param snmp_priv_key: (optional) The SNMP priv key to connect with.
+        :rtype: ``Dict[str, Any]``
+        """
+        # Imported here, as pysnmp's asyncio API cannot be imported on every Python version
+        # this package supports, and the synchronous functions of this class do not need it.
+        # pylint: disable=import-outside-toplevel
+        from tlnetcard_python.monitor.information.snmp_async import get_with_snmp_async
+        values = await get_with_snmp_async(self._login_object.get_host(),
+                                           list(self.BYPASS_SNMP_DICT.values()), snmp_user,
+                                           snmp_auth_key, snmp_priv_key,
+                                           self._login_object.get_timeout(), typed=True)
+        return self.decode_bypass_measurements(values)
+    def get_input_lines(self, snmp_user: str = "", snmp_auth_key: str = "",
+                        snmp_priv_key: str = "") -> List[Dict[str, Any]]:
+        """
+        Returns the measurements of every line of the input table as a list of dictionaries (one
+        per line). This function uses SNMP only.
+
+        :param snmp_user: (optional) The SNMP user to connect with.
+        :param snmp_auth_key: (optional) The SNMP auth key to connect with.
+        :param snmp_priv_key: (optional) The SNMP priv key to connect with.
+        :rtype: ``List[Dict[str, Any]]``
+        """
+        rows = walk_with_snmp(self._login_object.get_host(), self.INPUT_NUM_LINES_SNMP_ID,
+                              list(self.INPUT_TABLE_SNMP_DICT.values()), snmp_user,
+                              snmp_auth_key, snmp_priv_key,
+                              self._login_object.get_timeout(), typed=True)
+        return [self.decode_input_line(i) for i in rows]
     def get_input_measurements(self, snmp: bool = True, snmp_user: str = "",
                                snmp_auth_key: str = "", snmp_priv_key: str = ""
                                ) -> Dict[str, Any]:
@@ -119,7 +299,7 @@ class InOutParameters:
         Returns battery input measurements as a dictionary.
 
         :param snmp: (optional) Whether SNMP should be used or not. Setting this value to ``False``
-        will result in Selenium being used.
+        will result in the webpage being scraped.
         :param snmp_user: (optional) The SNMP user to connect with.
         :param snmp_auth_key: (optional) The SNMP auth key to connect with.
         :param snmp_priv_key: (optional) The SNMP priv key to connect with.
@@ -127,30 +307,17 @@ class InOutParameters:
         """
         if snmp:
             # SNMP will be used to get values. This is the preferred method.
-            # Generating SNMP ID dictionary.
-            snmp_dict = {
-                'Frequency': 'iso.3.6.1.2.1.33.1.3.3.1.2.1', # In decihertz
-                                                             # (i.e. divide this number by 10).
-                'Voltage': 'iso.3.6.1.2.1.33.1.3.3.1.3.1',
-            }
-
             # Getting values.
-            freq, volts = get_with_snmp(self._login_object.get_host(),
-                                        [snmp_dict[i] for i in snmp_dict], snmp_user, snmp_auth_key,
-                                        snmp_priv_key, self._login_object.get_timeout())
+            values = get_with_snmp(self._login_object.get_host(),
+                                   list(self.INPUT_SNMP_DICT.values()), snmp_user, snmp_auth_key,
+                                   snmp_priv_key, self._login_object.get_timeout(), typed=True)
 
             # Generating out dictionary.
-            out = {
-                'Frequency (Hz)': float(freq)/10,
-                'Voltage (V)': float(volts)
-            }
+            out = self.decode_input_measurements(values)
         else:
-            # Selenium will be used to scrape values. This method is slower than using SNMP.
+            # The webpage will be scraped for values. This method is slower than using SNMP.
             # Getting values.
-            freq, volts = scrape_with_selenium(self._login_object.get_host(),
-                                               ["UPS_INFREQ1", "UPS_INVOLT1"], self._get_url,
-                                               self._login_object.get_session(),
-                                               self._login_object.get_timeout())
+            freq, volts = self._scrape(["UPS_INFREQ1", "UPS_INVOLT1"])
 
             # Generating out dictionary.
             out = {
@@ -158,6 +325,40 @@ class InOutParameters:
                 'Voltage (V)': float(volts),
             }
         return out
+    async def get_input_measurements_async(self, snmp_user: str = "", snmp_auth_key: str = "",
+                                           snmp_priv_key: str = "") -> Dict[str, Any]:
+        """
+        Returns battery input measurements as a dictionary without blocking the event loop. This is
+        the asyncio counterpart of ``get_input_measurements()``, and always uses SNMP.
+
+        :param snmp_user: (optional) The SNMP user to connect with.
+        :param snmp_auth_key: (optional) The SNMP auth key to connect with.
+        :param snmp_priv_key: (optional) The SNMP priv key to connect with.
+        :rtype: ``Dict[str, Any]``
+        """
+        # pylint: disable=import-outside-toplevel
+        from tlnetcard_python.monitor.information.snmp_async import get_with_snmp_async
+        values = await get_with_snmp_async(self._login_object.get_host(),
+                                           list(self.INPUT_SNMP_DICT.values()), snmp_user,
+                                           snmp_auth_key, snmp_priv_key,
+                                           self._login_object.get_timeout(), typed=True)
+        return self.decode_input_measurements(values)
+    def get_output_lines(self, snmp_user: str = "", snmp_auth_key: str = "",
+                         snmp_priv_key: str = "") -> List[Dict[str, Any]]:
+        """
+        Returns the measurements of every line of the output table as a list of dictionaries (one
+        per line). This function uses SNMP only.
+
+        :param snmp_user: (optional) The SNMP user to connect with.
+        :param snmp_auth_key: (optional) The SNMP auth key to connect with.
+        :param snmp_priv_key: (optional) The SNMP priv key to connect with.
+        :rtype: ``List[Dict[str, Any]]``
+        """
+        rows = walk_with_snmp(self._login_object.get_host(), self.OUTPUT_NUM_LINES_SNMP_ID,
+                              list(self.OUTPUT_TABLE_SNMP_DICT.values()), snmp_user,
+                              snmp_auth_key, snmp_priv_key,
+                              self._login_object.get_timeout(), typed=True)
+        return [self.decode_output_line(i) for i in rows]
     # pylint: disable=too-many-locals
     def get_output_measurements(self, snmp: bool = True, snmp_user: str = "",
                                 snmp_auth_key: str = "", snmp_priv_key: str = ""
@@ -166,7 +367,7 @@ class InOutParameters:
         Returns battery output measurements as a dictionary.
 
         :param snmp: (optional) Whether SNMP should be used or not. Setting this value to ``False``
-        will result in Selenium being used.
+        will result in the webpage being scraped.
         :param snmp_user: (optional) The SNMP user to connect with.
         :param snmp_auth_key: (optional) The SNMP auth key to connect with.
         :param snmp_priv_key: (optional) The SNMP priv key to connect with.
@@ -174,58 +375,19 @@ class InOutParameters:
         """
         if snmp:
             # SNMP will be used to get values. This is the preferred method.
-            # Generating SNMP ID dictionary.
-            snmp_dict = {
-                'Output': 'iso.3.6.1.2.1.33.1.4.1',
-                'Frequency': 'iso.3.6.1.2.1.33.1.4.2', # In decihertz
-                                                       # (i.e. divide this value by 10).
-                'Voltage': 'iso.3.6.1.2.1.33.1.4.4.1.2.1',
-                'Current': 'iso.3.6.1.2.1.33.1.4.4.1.3.1', # In deciamps
-                                                           # (i.e. divide this value by 10).
-                'Power': 'iso.3.6.1.2.1.33.1.4.4.1.4.1',
-                'Loading': 'iso.3.6.1.2.1.33.1.4.4.1.5.1'
-            }
-
             # Getting values.
-            out, freq, volts, curr, power, load = get_with_snmp(self._login_object.get_host(),
-                                                                [snmp_dict[i] for i in snmp_dict],
-                                                                snmp_user, snmp_auth_key,
-                                                                snmp_priv_key,
-                                                                self._login_object.get_timeout())
-            # Output source status is actually returned as an integer whose values map as follows:
-            status_dict = {
-                1: 'Other',
-                2: 'None',
-                3: 'Normal',
-                4: 'Bypass',
-                5: 'Battery',
-                6: 'Booster',
-                7: 'Reducer'
-            }
+            values = get_with_snmp(self._login_object.get_host(),
+                                   list(self.OUTPUT_SNMP_DICT.values()), snmp_user, snmp_auth_key,
+                                   snmp_priv_key, self._login_object.get_timeout(), typed=True)
 
             # Generating out dictionary.
-            out = {
-                'Output Source': status_dict[int(out)],
-                'Frequency (Hz)': float(freq)/10,
-                'Voltage (V)': float(volts),
-                'Current (A)': float(curr)/10,
-                'Power (Watt)': int(power),
-                'Loading (%)': int(load)
-            }
+            out = self.decode_output_measurements(values)
         else:
-            # Selenium will be used to scrape values. This method is slower than using SNMP.
+            # The webpage will be scraped for values. This method is slower than using SNMP.
             # Getting values.
-            host = self._login_object.get_host()
-            session = self._login_object.get_session()
-            timeout = self._login_object.get_timeout()
-            out, freq, volts, curr, power, load = scrape_with_selenium(host,
-                                                                       ["UPS_OUTSRC", "UPS_OUTFREQ",
-                                                                        "UPS_OUTVOLT1",
-                                                                        "UPS_OUTAMP1",
-                                                                        "UPS_OUTPOWER1",
-                                                                        "UPS_OUTLOAD1"],
-                                                                       self._get_url, session,
-                                                                       timeout)
+            out, freq, volts, curr, power, load = self._scrape(["UPS_OUTSRC", "UPS_OUTFREQ",
+                                                                 "UPS_OUTVOLT1", "UPS_OUTAMP1",
+                                                                 "UPS_OUTPOWER1", "UPS_OUTLOAD1"])
 
             # Generating out dictionary.
             out = {
@@ -237,3 +399,37 @@ class InOutParameters:
                 'Loading (%)': int(load)
             }
         return out
+    async def get_output_measurements_async(self, snmp_user: str = "", snmp_auth_key: str = "",
+                                            snmp_priv_key: str = "") -> Dict[str, Any]:
+        """
+        Returns battery output measurements as a dictionary without blocking the event loop. This is
+        the asyncio counterpart of ``get_output_measurements()``, and always uses SNMP.
+
+        :param snmp_user: (optional) The SNMP user to connect with.
+        :param snmp_auth_key: (optional) The SNMP auth key to connect with.
+        :param snmp_priv_key: (optional) The SNMP priv key to connect with.
+        :rtype: ``Dict[str, Any]``
+        """
+        # pylint: disable=import-outside-toplevel
+        from tlnetcard_python.monitor.information.snmp_async import get_with_snmp_async
+        values = await get_with_snmp_async(self._login_object.get_host(),
+                                           list(self.OUTPUT_SNMP_DICT.values()), snmp_user,
+                                           snmp_auth_key, snmp_priv_key,
+                                           self._login_object.get_timeout(), typed=True)
+        return self.decode_output_measurements(values)
+    def _scrape(self, element_ids: List[str], xpath: bool = False) -> List[str]:
+        """
+        Scrapes the provided web elements from the webpage of this object (see
+        ``scrape_with_requests()``), through the page cache of the ``Login`` object. Returns
+        ``List[str]``.
+
+        :param element_ids: A list of HTML element IDs to retrieve. These will instead be Xpaths if
+        ``xpath`` is set to ``True``.
+        :param xpath: (optional) Whether Xpath should be used to find element values instead of IDs.
+        :rtype: ``List[str]``
+        """
+        return scrape_with_requests(self._login_object.get_host(), element_ids, self._get_url,
+                                    self._login_object.get_session(),
+                                    self._login_object.get_timeout(), xpath,
+                                    self._login_object.get_reject_invalid_certs(),
+                                    cache=self._login_object.get_page_cache())
@@ -2,27 +2,106 @@
 tlnetcard_python.monitor.information.information
 ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
-Provides the get_with_snmp() and scrape_with_selenium() methods which can be used independently of
-the rest of this class.
+Provides the get_with_snmp(), walk_with_snmp(), scrape_with_requests() and scrape_with_selenium()
+methods which can be used independently of the rest of this class.
 """
 
 # Standard library.
-from time import sleep
-from typing import List
+from codecs import getincrementaldecoder
+from typing import Any, List, Tuple
+from urllib.parse import urljoin, urlparse
 from warnings import warn
 # Related third-party library.
-from pysnmp.hlapi import getCmd, SnmpEngine, UsmUserData, UdpTransportTarget
-from pysnmp.hlapi import ContextData, ObjectType, ObjectIdentity
+from pysnmp.hlapi import bulkCmd, getCmd, SnmpEngine, UsmUserData, UdpTransportTarget
+from pysnmp.hlapi import ContextData, ObjectIdentity
+from pysnmp.proto.rfc1902 import ObjectName
 from requests import Session
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
+# Required internal classes/functions.
+from tlnetcard_python.monitor.information.html_scraper import ElementParser, find_data_urls
+from tlnetcard_python.monitor.information.html_scraper import find_script_values
+from tlnetcard_python.monitor.information.oids import OID_REGISTRY, get_native_value
+from tlnetcard_python.monitor.information.snmp_cache import SnmpEngineRegistry
+from tlnetcard_python.page_cache import CachedPage, PageCache
+from tlnetcard_python.webdriver_pool import WEBDRIVER_POOL
+
+# Error status reported by an SNMP agent when its response would not fit into a single message.
+_SNMP_TOO_BIG = 1
+# Registry of SNMP engines shared by every call to get_with_snmp().
+_SNMP_REGISTRY = SnmpEngineRegistry()
+# Script run by scrape_with_selenium(). Finds the elements which are still missing content whenever
+# the DOM changes, and returns their (whitespace-collapsed) text as soon as none are missing, or
+# returns what it has once the timeout (in milliseconds) has passed.
+_WAIT_FOR_ELEMENTS_SCRIPT = """
+var elementIds = arguments[0], xpath = arguments[1], timeout = arguments[2];
+var done = arguments[arguments.length - 1];
+var values = [], finished = false, observer = null;
+for (var i = 0; i < elementIds.length; i++) {
+    values.push('');
+}
+function findMissing() {
+    var missing = 0;
+    for (var i = 0; i < elementIds.length; i++) {
+        if (values[i] !== '') {
+            continue;
+        }
+        var element = xpath ? document.evaluate(elementIds[i], document, null,
+            XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue
+            : document.getElementById(elementIds[i]);
+        if (element !== null) {
+            var text = element.innerText === undefined ? element.textContent : element.innerText;
+            values[i] = (text || '').replace(/\\s+/g, ' ').trim();
+        }
+        if (values[i] === '') {
+            missing++;
+        }
+    }
+    return missing;
+}
+function finish() {
+    if (!finished) {
+        finished = true;
+        if (observer !== null) {
+            observer.disconnect();
+        }
+        done(values);
+    }
+}
+if (findMissing() === 0) {
+    finish();
+} else {
+    observer = new MutationObserver(function () {
+        if (findMissing() === 0) {
+            finish();
+        }
+    });
+    observer.observe(document, {childList: true, subtree: true, characterData: true,
+                                attributes: true});
+    window.setTimeout(function () {
+        findMissing();
+        finish();
+    }, timeout);
+}
+"""
 
 # Initialize class methods.
-# pylint: disable=too-many-arguments
+def close_snmp_engines(host: str = None) -> None:
+    """
+    Closes the cached SNMP engines (and their sockets) used by ``get_with_snmp()``. The next call
+    to ``get_with_snmp()`` for a closed host will repeat SNMPv3 discovery. Returns ``None``.
+
+    :param host: (optional) The IP address/DNS name of the SNMP device whose engines should be
+    closed. If no host is provided, every cached engine is closed.
+    :rtype: ``None``
+    """
+    _SNMP_REGISTRY.close(host)
+# pylint: disable=too-many-arguments,too-many-locals
 def get_with_snmp(host: str, snmp_ids: List[str], snmp_user: str = "", snmp_auth_key: str = "",
-                  snmp_priv_key: str = "", timeout: float = 10.0) -> List[str]:
+                  snmp_priv_key: str = "", timeout: float = 10.0, batch: bool = True,
+                  registry: SnmpEngineRegistry = None, typed: bool = False,
+                  port: int = 161) -> List[Any]:
     """
-    Gets the provided SNMP values from their SNMP IDs. Returns ``List[str]``.
+    Gets the provided SNMP values from their SNMP IDs. Returns ``List[str]``, or ``List[Any]`` if
+    ``typed`` is set to ``True``.
 
     :param host: The IP address/DNS name of the SNMP device.
     :param snmp_ids: A list of SNMP IDs to retrieve from the host.
@@ -30,46 +109,209 @@ def get_with_snmp(host: str, snmp_ids: List[str], snmp_user: str = "", snmp_auth
     :param snmp_auth_key: (optional) The Auth key for the SNMP user to connect as.
     :param snmp_priv_key: (optional) The Priv key for the SNMP user to connect as.
     :param timeout: (optional) The number of seconds to wait for responses before quitting.
-    :rtype: ``List[str]``
+    :param batch: (optional) Whether all SNMP IDs should be requested in as few GET PDUs as
+    possible. When set to ``False``, a separate GET request is sent for every SNMP ID.
+    :param registry: (optional) The ``SnmpEngineRegistry`` from which the SNMP engine for the host
+    will be taken. If no registry is provided, a registry shared by the whole module is used.
+    :param typed: (optional) Whether values should be returned as native Python values (see
+    ``get_native_value()``) rather than strings. Typed values are neither formatted as strings nor
+    looked up in MIBs. Values which could not be retrieved are ``None`` rather than ``""``.
+    :param port: (optional) The UDP port of the SNMP device.
+    :rtype: ``List[Any]``
     """
     out = []
+    empty = None if typed else ""
 
-    if snmp_auth_key != "" and snmp_priv_key != "":
-        usm_user_data = UsmUserData(snmp_user, authKey=snmp_auth_key, privKey=snmp_priv_key)
-    elif snmp_auth_key != "":
-        usm_user_data = UsmUserData(snmp_user, authKey=snmp_auth_key)
-    elif snmp_priv_key != "":
-        usm_user_data = UsmUserData(snmp_user, privKey=snmp_priv_key)
-    else:
-        usm_user_data = UsmUserData(snmp_user)
-
-    for i in snmp_ids:
-        error_indication, error_status, error_index, var_binds = next(
-            getCmd(SnmpEngine(),
-                   usm_user_data,
-                   UdpTransportTarget((host, 161),
-                                      timeout=timeout, retries=1),
-                   ContextData(),
-                   ObjectType(ObjectIdentity(i)))
-        )
-        # pylint: disable=no-else-return
-        if error_indication:
-            warn(error_indication, RuntimeError)
-            # Creating an output list of the proper size.
-            return ["" for i in snmp_ids]
-        elif error_status:
-            warn('%s at %s' % (error_status.prettyPrint(),
-                               error_index and var_binds[int(error_index) - 1][0] or '?'),
-                 RuntimeError)
-            # Creating an output list of the proper size.
-            return ["" for i in snmp_ids]
+    # Getting the long-lived engine, user and transport for this host and these credentials.
+    if registry is None:
+        registry = _SNMP_REGISTRY
+    target = registry.get(host, snmp_user, snmp_auth_key, snmp_priv_key, port)
+
+    with target.lock:
+        snmp_engine = target.engine
+        usm_user_data = target.usm_user_data
+        transport_target = target.get_transport_target(timeout)
+
+        if batch:
+            # Requesting every SNMP ID at once (splitting only if the agent reports tooBig).
+            error, var_binds = _get_batch(snmp_engine, usm_user_data, transport_target, snmp_ids,
+                                          not typed)
+            if error:
+                warn(error, RuntimeWarning)
+                # Creating an output list of the proper size.
+                return [empty for i in snmp_ids]
+            return _get_values(var_binds, typed)
+
+        for i in OID_REGISTRY.get_object_types(snmp_ids):
+            error_indication, error_status, error_index, var_binds = next(
+                getCmd(snmp_engine,
+                       usm_user_data,
+                       transport_target,
+                       ContextData(),
+                       i,
+                       lookupMib=not typed)
+            )
+            # pylint: disable=no-else-return
+            if error_indication:
+                warn(error_indication, RuntimeError)
+                # Creating an output list of the proper size.
+                return [empty for i in snmp_ids]
+            elif error_status:
+                warn('%s at %s' % (error_status.prettyPrint(),
+                                   error_index and var_binds[int(error_index) - 1][0] or '?'),
+                     RuntimeError)
+                # Creating an output list of the proper size.
+                return [empty for i in snmp_ids]
+            else:
+                out += _get_values(var_binds, typed)
+    return out
+def _get_batch(snmp_engine: SnmpEngine, usm_user_data: UsmUserData,
+               transport_target: UdpTransportTarget, snmp_ids: List[str],
+               lookup_mib: bool = True) -> Tuple[str, List[Any]]:
+    """
+    Requests all of the provided SNMP IDs in a single GET PDU. If the agent reports that the
+    response would be too big, the SNMP IDs are split in half and each half is requested
+    separately (recursively, until a single SNMP ID is left). Returns a tuple containing an error
+    message (empty upon success) and the variable bindings in the same order as ``snmp_ids``.
+
+    :param snmp_engine: The ``SnmpEngine`` to send the request with.
+    :param usm_user_data: The ``UsmUserData`` to authenticate the request with.
+    :param transport_target: The ``UdpTransportTarget`` of the SNMP device.
+    :param snmp_ids: A list of SNMP IDs to retrieve from the host.
+    :param lookup_mib: (optional) Whether the variable bindings should be looked up in MIBs.
+    :rtype: ``Tuple[str, List[Any]]``
+    """
+    error_indication, error_status, error_index, var_binds = next(
+        getCmd(snmp_engine, usm_user_data, transport_target, ContextData(),
+               *OID_REGISTRY.get_object_types(snmp_ids), lookupMib=lookup_mib)
+    )
+    if error_indication:
+        return str(error_indication), []
+    if int(error_status) == _SNMP_TOO_BIG and len(snmp_ids) > 1:
+        # Splitting the request in half and retrying each half.
+        half = len(snmp_ids) // 2
+        error, first_half = _get_batch(snmp_engine, usm_user_data, transport_target,
+                                       snmp_ids[:half], lookup_mib)
+        if error:
+            return error, []
+        error, second_half = _get_batch(snmp_engine, usm_user_data, transport_target,
+                                        snmp_ids[half:], lookup_mib)
+        if error:
+            return error, []
+        return "", first_half + second_half
+    if error_status:
+        return '%s at %s' % (error_status.prettyPrint(),
+                             error_index and var_binds[int(error_index) - 1][0] or '?'), []
+    return "", list(var_binds)
+def _get_values(var_binds: List[Any], typed: bool) -> List[Any]:
+    """
+    Returns the values of the provided variable bindings, either as native Python values (see
+    ``get_native_value()``) or as strings.
+
+    :param var_binds: The variable bindings to return the values of.
+    :param typed: Whether the values should be returned as native Python values.
+    :rtype: ``List[Any]``
+    """
+    if typed:
+        return [get_native_value(i[1]) for i in var_binds]
+    return [str(i).split("=")[-1] for i in var_binds]
+# pylint: disable=too-many-arguments,too-many-branches,too-many-locals
+def scrape_with_requests(host: str, element_ids: List[str], url: str, session: Session = None,
+                         timeout: float = 10.0, xpath: bool = False, verify: bool = True,
+                         fallback: bool = True, cache: PageCache = None) -> List[str]:
+    """
+    Scrapes the provided web elements by their ID from the provided webpage without a browser.
+    Values which are filled in by the scripts of the webpage are recovered from its inline scripts
+    and from the data they request. Selenium is only used for values which still could not be
+    found. Returns ``List[str]``.
+
+    :param host: The IP address/DNS name of the web server.
+    :param element_ids: A list of HTML element IDs to retrieve from the host. These will instead be
+    Xpaths if ``xpath`` is set to ``True``.
+    :param url: The specific URL from which element ID values will be scraped.
+    :param session: (optional) A ``requests.Session`` object (with the login cookies) to use.
+    :param timeout: (optional) The number of seconds to wait for responses before quitting.
+    :param xpath: (optional) Whether Xpath should be used to find element values instead of IDs.
+    :param verify: (optional) Whether the certificate of the web server should be verified.
+    :param fallback: (optional) Whether ``scrape_with_selenium()`` should be used for values which
+    could not be found.
+    :param cache: (optional) The ``PageCache`` holding the webpages (and the data they load) of the
+    web server, so that every value of a webpage costs a single fetch. If no cache is provided, the
+    webpage is always fetched.
+    :rtype: ``List[str]``
+    """
+    own_session = session is None
+    if own_session:
+        session = Session()
+    page = None if cache is None else cache.get(url)
+    try:
+        parser = ElementParser(element_ids, xpath)
+        if page is None:
+            # Streaming the webpage into the parser (keeping its HTML for later calls).
+            resp = session.get(url, timeout=timeout, verify=verify, stream=True)
+            resp.raise_for_status()
+            decoder = getincrementaldecoder(resp.encoding or 'utf-8')('replace')
+            html = []
+            for chunk in resp.iter_content(chunk_size=8192):
+                html.append(decoder.decode(chunk))
+                parser.feed(html[-1])
+            html.append(decoder.decode(b'', final=True))
+            parser.feed(html[-1])
+            page = CachedPage("".join(html))
+            if cache is not None:
+                cache.set(url, page)
         else:
-            out.append(str(var_binds[0]).split("=")[-1])
+            parser.feed(page.html)
+        parser.close()
+        out = parser.get_values()
+
+        # Values filled in by scripts can only be found by their ID.
+        missing = [element_ids[i] for i in range(len(out)) if out[i] == ""]
+        if missing and not xpath:
+            # Only values with content count as found, so empty ones are looked up in the data too.
+            found = find_script_values("\n".join(parser.get_scripts()), missing)
+            found = {i: found[i] for i in found if found[i] != ""}
+            # Fetching the scripts and data the webpage loads (from the same web server only).
+            urls = [urljoin(url, i) for i in parser.get_script_sources() +
+                    find_data_urls(parser.get_scripts())]
+            for data_url in urls:
+                if len(found) == len(missing):
+                    break
+                if urlparse(data_url).netloc != urlparse(url).netloc or data_url == url:
+                    continue
+                if data_url not in page.resources:
+                    data_resp = session.get(data_url, timeout=timeout, verify=verify)
+                    page.resources[data_url] = data_resp.text if data_resp.ok else None
+                if page.resources[data_url] is not None:
+                    values = find_script_values(page.resources[data_url],
+                                                [i for i in missing if i not in found])
+                    found.update((i, values[i]) for i in values if values[i] != "")
+            out = [found.get(element_ids[i], out[i]) for i in range(len(out))]
+    finally:
+        if own_session:
+            session.close()
+
+    # Reusing values a browser already rendered for this webpage.
+    missing = [i for i in range(len(out)) if out[i] == ""]
+    for i in missing:
+        out[i] = page.rendered.get((element_ids[i], xpath), "")
+    missing = [i for i in missing if out[i] == ""]
+    if fallback and missing:
+        rendered = scrape_with_selenium(host, [element_ids[i] for i in missing], url,
+                                        None if own_session else session, timeout, xpath)
+        for i, value in zip(missing, rendered):
+            out[i] = value
+            if value != "":
+                page.rendered[(element_ids[i], xpath)] = value
     return out
 def scrape_with_selenium(host: str, element_ids: List[str], url: str, session: Session = None,
                          timeout: float = 10.0, xpath: bool = False) -> List[str]:
     """
-    Scrapes the provided web elements by their ID from the provided webpage. Returns ``List[str]``.
+    Scrapes the provided web elements by their ID from the provided webpage, using a headless
+    browser from ``WEBDRIVER_POOL``. Values are returned as soon as every element has content (a
+    ``MutationObserver`` re-checks only the elements still missing whenever the webpage changes).
+    Elements which are still empty (or missing) after ``timeout`` are returned as empty strings.
+    Returns ``List[str]``.
 
     :param host: The IP address/DNS name of the web server.
     :param element_ids: A list of HTML element IDs to retrieve from the host. These will instead be
@@ -80,37 +322,122 @@ def scrape_with_selenium(host: str, element_ids: List[str], url: str, session: S
     :param xpath: (optional) Whether Xpath should be used to find element values instead of IDs.
     :rtype: ``List[str]``
     """
-    # Configuring Selenium to run headless (i.e. without a GUI).
-    browser_options = Options()
-    browser_options.add_argument("--headless")
-    browser = webdriver.Chrome(options=browser_options)
-    # Getting url.
-    browser.get(url)
-    if session is not None:
-        # Adding cookies from requests session.
-        requests_cookies = session.cookies.get_dict()
-        for cookie in requests_cookies:
-            browser.add_cookie({'name': cookie,
-                                'domain': host,
-                                'value': requests_cookies[cookie]})
-        # Getting webpage again now that cookies are installed.
+    # Taking a long-lived headless browser (with the session's cookies installed) from the pool.
+    with WEBDRIVER_POOL.browser(host, session, url) as browser:
+        # Getting url.
         browser.get(url)
 
-    # Getting out dictionary.
-    out = {}
-    counter = 0.0
-    while timeout > counter:
-        # pylint: disable=consider-using-enumerate
-        for i in range(0, len(element_ids)):
-            if not xpath:
-                out[i] = browser.find_element_by_id(element_ids[i]).text
-            else:
-                out[i] = browser.find_element_by_xpath(element_ids[i]).text
-        if '' not in [out[j] for j in out]:
-            break
-        sleep(0.5)
-        counter += 0.5
+        # Waiting (without polling) until every element has content, or until timeout.
+        browser.set_script_timeout(timeout + 5.0)
+        out = browser.execute_async_script(_WAIT_FOR_ELEMENTS_SCRIPT, element_ids, xpath,
+                                           int(timeout * 1000))
+
+    # Returning (the browser is given back to the pool rather than closed).
+    return out
+# pylint: disable=too-many-arguments,too-many-locals
+def walk_with_snmp(host: str, num_lines_id: str, column_ids: List[str], snmp_user: str = "",
+                   snmp_auth_key: str = "", snmp_priv_key: str = "", timeout: float = 10.0,
+                   max_repetitions: int = 3, registry: SnmpEngineRegistry = None,
+                   typed: bool = False, port: int = 161) -> List[List[Any]]:
+    """
+    Walks the provided columns of an SNMP table using GETBULK. The number of lines in the table is
+    read from ``num_lines_id`` in the same request, so the whole table is returned in a single
+    GETBULK PDU (or two, if the table has more than ``max_repetitions`` lines). Returns one list of
+    column values per table line as ``List[List[str]]``, or ``List[List[Any]]`` if ``typed`` is set
+    to ``True``.
 
-    # Closing browser and returning.
-    browser.close()
-    return [out[i] for i in out]
+    :param host: The IP address/DNS name of the SNMP device.
+    :param num_lines_id: The SNMP ID of the value holding the number of lines in the table.
+    :param column_ids: A list of SNMP IDs of the table columns to retrieve (without line indexes).
+    :param snmp_user: (optional) The username for the SNMP user to connect as.
+    :param snmp_auth_key: (optional) The Auth key for the SNMP user to connect as.
+    :param snmp_priv_key: (optional) The Priv key for the SNMP user to connect as.
+    :param timeout: (optional) The number of seconds to wait for responses before quitting.
+    :param max_repetitions: (optional) The number of lines requested by the first GETBULK PDU.
+    :param registry: (optional) The ``SnmpEngineRegistry`` from which the SNMP engine for the host
+    will be taken. If no registry is provided, a registry shared by the whole module is used.
+    :param typed: (optional) Whether values should be returned as native Python values (see
+    ``get_native_value()``) rather than strings.
+    :param port: (optional) The UDP port of the SNMP device.
+    :rtype: ``List[List[Any]]``
+    """
+    if registry is None:
+        registry = _SNMP_REGISTRY
+    target = registry.get(host, snmp_user, snmp_auth_key, snmp_priv_key, port)
+
+    with target.lock:
+        transport_target = target.get_transport_target(timeout)
+        # Requesting the number of lines (as a non-repeater) along with the first lines.
+        error, var_bind_table = _get_bulk(target.engine, target.usm_user_data, transport_target,
+                                          1, max_repetitions, [num_lines_id] + column_ids,
+                                          not typed)
+        if error:
+            warn(error, RuntimeWarning)
+            return []
+        num_lines = int(var_bind_table[0][0][1]) if var_bind_table else 0
+        rows = _get_table_rows(column_ids, [i[1:] for i in var_bind_table])
+
+        if len(rows) < num_lines and len(rows) == max_repetitions:
+            # Requesting the remaining lines, continuing from the last line received.
+            error, var_bind_table = _get_bulk(target.engine, target.usm_user_data,
+                                              transport_target, 0, num_lines - len(rows),
+                                              [str(_get_oid(i[0])) for i in rows[-1]], not typed)
+            if error:
+                warn(error, RuntimeWarning)
+                return []
+            rows += _get_table_rows(column_ids, var_bind_table)
+    return [_get_values(i, typed) for i in rows[:num_lines]]
+def _get_bulk(snmp_engine: SnmpEngine, usm_user_data: UsmUserData,
+              transport_target: UdpTransportTarget, non_repeaters: int, max_repetitions: int,
+              snmp_ids: List[str], lookup_mib: bool = True) -> Tuple[str, List[List[Any]]]:
+    """
+    Sends a single GETBULK PDU. Returns a tuple containing an error message (empty upon success)
+    and the variable binding table of the response (one row per repetition).
+
+    :param snmp_engine: The ``SnmpEngine`` to send the request with.
+    :param usm_user_data: The ``UsmUserData`` to authenticate the request with.
+    :param transport_target: The ``UdpTransportTarget`` of the SNMP device.
+    :param non_repeaters: The number of SNMP IDs (at the start of ``snmp_ids``) requested only once.
+    :param max_repetitions: The number of successors requested for every other SNMP ID.
+    :param snmp_ids: A list of SNMP IDs to request the successors of.
+    :param lookup_mib: (optional) Whether the variable bindings should be looked up in MIBs.
+    :rtype: ``Tuple[str, List[List[Any]]]``
+    """
+    var_bind_table = []
+    for error_indication, error_status, error_index, var_binds in bulkCmd(
+            snmp_engine, usm_user_data, transport_target, ContextData(), non_repeaters,
+            max_repetitions, *OID_REGISTRY.get_object_types(snmp_ids), maxCalls=1,
+            lookupMib=lookup_mib):
+        if error_indication:
+            return str(error_indication), []
+        if error_status:
+            return '%s at %s' % (error_status.prettyPrint(),
+                                 error_index and var_binds[int(error_index) - 1][0] or '?'), []
+        var_bind_table.append(var_binds)
+    return "", var_bind_table
+def _get_oid(name: Any) -> ObjectName:
+    """
+    Returns the OID of the name of a variable binding, which is an ``ObjectIdentity`` if the
+    variable binding was looked up in MIBs and an ``ObjectName`` otherwise.
+
+    :param name: The name of the variable binding.
+    :rtype: ``ObjectName``
+    """
+    return name.getOid() if isinstance(name, ObjectIdentity) else name
+def _get_table_rows(column_ids: List[str], var_bind_table: List[List[Any]]) -> List[List[Any]]:
+    """
+    Returns the rows of the provided variable binding table which still belong to the provided
+    table columns (GETBULK keeps going past the end of a table).
+
+    :param column_ids: A list of SNMP IDs of the table columns.
+    :param var_bind_table: The variable binding table returned by ``_get_bulk()``.
+    :rtype: ``List[List[Any]]``
+    """
+    # SNMP IDs are given in the "iso.3.6..." form, which is "1.3.6..." as a plain OID.
+    columns = [ObjectName(i.replace("iso", "1", 1)) for i in column_ids]
+    rows = []
+    for i in var_bind_table:
+        if not all(j.isPrefixOf(_get_oid(k[0])) for j, k in zip(columns, i)):
+            break
+        rows.append(i)
+    return rows
@@ -0,0 +1,232 @@
+"""
+tlnetcard_python.monitor.information.oids
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Provides the ``OID_REGISTRY`` object, which holds every UPS-MIB (1.3.6.1.2.1.33) and Tripp Lite
+(1.3.6.1.4.1.850) SNMP value used by this package along with its decoder, and hands out SNMP objects
+which are resolved only once per process rather than once per request. Also provides the
+get_native_value() method, which turns pysnmp values into native Python values.
+"""
+
+# Standard library.
+from threading import Lock
+from typing import Any, Callable, Dict, List, Union
+# Related third-party library.
+from pyasn1.type import univ
+from pysnmp.hlapi import ObjectType, ObjectIdentity
+from pysnmp.proto.rfc1902 import ObjectName
+from pysnmp.smi.builder import MibBuilder
+from pysnmp.smi.view import MibViewController
+
+class OidRegistry:
+    """
+    A registry of SNMP IDs. Holds the decoder of every registered SNMP ID (scaling, enumeration
+    maps, etc.), and caches a resolved ``ObjectType`` for every SNMP ID requested through it
+    (whether registered or not). This object is thread-safe.
+
+    Basic Usage:
+
+    >>> from tlnetcard_python.monitor.information.oids import OID_REGISTRY, UPS_OUTPUT_FREQUENCY
+    >>> OID_REGISTRY.decode(UPS_OUTPUT_FREQUENCY, " 600")
+    60.0
+    """
+    def __init__(self) -> None:
+        """
+        Initializes the ``OidRegistry`` object. Returns ``None``.
+
+        :rtype: ``None``
+        """
+        self._lock = Lock()
+        self._decoders = {}
+        self._object_types = {}
+        self._mib_view = None
+    def decode(self, snmp_id: str, value: Any) -> Any:
+        """
+        Decodes a value returned for the provided SNMP ID. Values of unregistered SNMP IDs are
+        returned unchanged. Returns ``Any``.
+
+        :param snmp_id: The SNMP ID the value was returned for.
+        :param value: The value returned by ``get_with_snmp()`` (either typed or as a string).
+        :rtype: ``Any``
+        """
+        decoder = self._decoders.get(snmp_id)
+        return value if decoder is None else decoder(value)
+    def decode_all(self, snmp_ids: List[str], values: List[Any]) -> List[Any]:
+        """
+        Decodes the values returned for the provided SNMP IDs (in the same order). Returns
+        ``List[Any]``.
+
+        :param snmp_ids: The SNMP IDs the values were returned for.
+        :param values: The values returned by ``get_with_snmp()`` (either typed or as strings).
+        :rtype: ``List[Any]``
+        """
+        return [self.decode(i, j) for i, j in zip(snmp_ids, values)]
+    def get_object_types(self, snmp_ids: List[str]) -> List[ObjectType]:
+        """
+        Returns a resolved ``ObjectType`` for every provided SNMP ID. Every SNMP ID is only resolved
+        the first time it is requested, and the same object is handed out afterwards.
+
+        :param snmp_ids: A list of SNMP IDs, either in the "iso.3.6..." or the "1.3.6..." form.
+        :rtype: ``List[ObjectType]``
+        """
+        missing = [i for i in snmp_ids if i not in self._object_types]
+        if missing:
+            with self._lock:
+                if self._mib_view is None:
+                    self._mib_view = MibViewController(MibBuilder())
+                for i in missing:
+                    # SNMP IDs are turned into plain OIDs so that no MIB lookup is necessary.
+                    object_type = ObjectType(ObjectIdentity(ObjectName(i.replace("iso", "1", 1))))
+                    self._object_types[i] = object_type.resolveWithMib(self._mib_view)
+        return [self._object_types[i] for i in snmp_ids]
+    def register(self, snmp_id: str, decoder: Callable[[Any], Any] = None) -> str:
+        """
+        Registers an SNMP ID along with the function decoding its values. Returns the SNMP ID, so
+        that it can be stored in a constant.
+
+        :param snmp_id: The SNMP ID to register.
+        :param decoder: (optional) The function turning a value returned by ``get_with_snmp()``
+        (either typed or as a string) into its final form. If no decoder is provided, values are
+        returned unchanged.
+        :rtype: ``str``
+        """
+        if decoder is not None:
+            self._decoders[snmp_id] = decoder
+        return snmp_id
+
+def enum_decoder(mapping: Dict[int, str]) -> Callable[[Union[int, str]], str]:
+    """
+    Returns a decoder mapping integer values through the provided dictionary.
+
+    :param mapping: The dictionary mapping every integer value to its meaning.
+    :rtype: ``Callable[[Union[int, str]], str]``
+    """
+    return lambda value: mapping[int(value)]
+def get_native_value(value: Any) -> Any:
+    """
+    Returns the native Python value of a pysnmp value: ``int`` for integer types (including
+    counters, gauges and time ticks), ``bytes`` for octet string types, ``str`` for object
+    identifiers, and ``None`` for missing values (noSuchObject, noSuchInstance, endOfMibView).
+
+    :param value: The pysnmp value of a variable binding.
+    :rtype: ``Any``
+    """
+    # Null types must be checked first, as pyasn1 derives them from OctetString.
+    if isinstance(value, univ.Null):
+        return None
+    if isinstance(value, univ.Integer):
+        return int(value)
+    if isinstance(value, univ.OctetString):
+        return value.asOctets()
+    if isinstance(value, univ.ObjectIdentifier):
+        return str(value)
+    return value.prettyPrint()
+def mac_decoder(value: Union[bytes, str]) -> str:
+    """
+    Decodes a physical address into the "00-06-67-06-08-c0" form used by the TLNET Supervisor
+    webpages. Returns ``str``.
+
+    :param value: The physical address, either as bytes or as a string.
+    :rtype: ``str``
+    """
+    if isinstance(value, bytes):
+        return '-'.join('{:02x}'.format(i) for i in value)
+    return value.strip()
+def minutes_decoder(value: Union[int, str]) -> str:
+    """
+    Decodes a number of minutes into an "HH:MM" string. Returns ``str``.
+
+    :param value: The number of minutes.
+    :rtype: ``str``
+    """
+    mins = int(value)
+    hours = int((mins - (mins % 60))/60)
+    return '{hours:02d}:{mins:02d}'.format(hours=hours, mins=mins % 60)
+def scaled_decoder(divisor: int) -> Callable[[Union[int, str]], float]:
+    """
+    Returns a decoder dividing values by the provided divisor (e.g. ``10`` for decihertz).
+
+    :param divisor: The number the values must be divided by.
+    :rtype: ``Callable[[Union[int, str]], float]``
+    """
+    return lambda value: int(value)/divisor
+def text_decoder(value: Union[bytes, str]) -> str:
+    """
+    Decodes a text value. Returns ``str``.
+
+    :param value: The text value, either as bytes or as a string.
+    :rtype: ``str``
+    """
+    if isinstance(value, bytes):
+        return value.decode('utf-8', 'replace')
+    return value.strip()
+
+# Output source status is actually returned as an integer whose values map as follows:
+OUTPUT_SOURCE_DICT = {
+    1: 'Other',
+    2: 'None',
+    3: 'Normal',
+    4: 'Bypass',
+    5: 'Battery',
+    6: 'Booster',
+    7: 'Reducer'
+}
+# Battery status is actually returned as an integer whose values map as follows:
+BATTERY_STATUS_DICT = {
+    1: 'Unknown',
+    2: 'Normal',
+    3: 'Low',
+    4: 'Depleted'
+}
+
+# Registry of every SNMP value used by this package.
+OID_REGISTRY = OidRegistry()
+
+# UPS-MIB identification group (upsIdent).
+UPS_IDENT_MODEL = OID_REGISTRY.register('iso.3.6.1.2.1.33.1.1.2', text_decoder)
+UPS_IDENT_UPS_FIRMWARE = OID_REGISTRY.register('iso.3.6.1.2.1.33.1.1.3', text_decoder)
+UPS_IDENT_AGENT_FIRMWARE = OID_REGISTRY.register('iso.3.6.1.2.1.33.1.1.4', text_decoder)
+# UPS-MIB battery group (upsBattery).
+UPS_BATTERY_STATUS = OID_REGISTRY.register('iso.3.6.1.2.1.33.1.2.1',
+                                           enum_decoder(BATTERY_STATUS_DICT))
+UPS_SECONDS_ON_BATTERY = OID_REGISTRY.register('iso.3.6.1.2.1.33.1.2.2', int)
+UPS_MINUTES_REMAINING = OID_REGISTRY.register('iso.3.6.1.2.1.33.1.2.3', minutes_decoder)
+UPS_CHARGE_REMAINING = OID_REGISTRY.register('iso.3.6.1.2.1.33.1.2.4', int)
+UPS_BATTERY_VOLTAGE = OID_REGISTRY.register('iso.3.6.1.2.1.33.1.2.5', scaled_decoder(10))
+UPS_BATTERY_TEMPERATURE = OID_REGISTRY.register('iso.3.6.1.2.1.33.1.2.7', int)
+# UPS-MIB input group (upsInput).
+UPS_INPUT_NUM_LINES = OID_REGISTRY.register('iso.3.6.1.2.1.33.1.3.2', int)
+UPS_INPUT_FREQUENCY = OID_REGISTRY.register('iso.3.6.1.2.1.33.1.3.3.1.2', scaled_decoder(10))
+UPS_INPUT_VOLTAGE = OID_REGISTRY.register('iso.3.6.1.2.1.33.1.3.3.1.3', float)
+UPS_INPUT_CURRENT = OID_REGISTRY.register('iso.3.6.1.2.1.33.1.3.3.1.4', scaled_decoder(10))
+UPS_INPUT_TRUE_POWER = OID_REGISTRY.register('iso.3.6.1.2.1.33.1.3.3.1.5', int)
+UPS_INPUT_FREQUENCY_1 = OID_REGISTRY.register(UPS_INPUT_FREQUENCY + '.1', scaled_decoder(10))
+UPS_INPUT_VOLTAGE_1 = OID_REGISTRY.register(UPS_INPUT_VOLTAGE + '.1', float)
+# UPS-MIB output group (upsOutput).
+UPS_OUTPUT_SOURCE = OID_REGISTRY.register('iso.3.6.1.2.1.33.1.4.1',
+                                          enum_decoder(OUTPUT_SOURCE_DICT))
+UPS_OUTPUT_FREQUENCY = OID_REGISTRY.register('iso.3.6.1.2.1.33.1.4.2', scaled_decoder(10))
+UPS_OUTPUT_NUM_LINES = OID_REGISTRY.register('iso.3.6.1.2.1.33.1.4.3', int)
+UPS_OUTPUT_VOLTAGE = OID_REGISTRY.register('iso.3.6.1.2.1.33.1.4.4.1.2', float)
+UPS_OUTPUT_CURRENT = OID_REGISTRY.register('iso.3.6.1.2.1.33.1.4.4.1.3', scaled_decoder(10))
+UPS_OUTPUT_POWER = OID_REGISTRY.register('iso.3.6.1.2.1.33.1.4.4.1.4', int)
+UPS_OUTPUT_PERCENT_LOAD = OID_REGISTRY.register('iso.3.6.1.2.1.33.1.4.4.1.5', int)
+UPS_OUTPUT_VOLTAGE_1 = OID_REGISTRY.register(UPS_OUTPUT_VOLTAGE + '.1', float)
+UPS_OUTPUT_CURRENT_1 = OID_REGISTRY.register(UPS_OUTPUT_CURRENT + '.1', scaled_decoder(10))
+UPS_OUTPUT_POWER_1 = OID_REGISTRY.register(UPS_OUTPUT_POWER + '.1', int)
+UPS_OUTPUT_PERCENT_LOAD_1 = OID_REGISTRY.register(UPS_OUTPUT_PERCENT_LOAD + '.1', int)
+# UPS-MIB bypass group (upsBypass).
+UPS_BYPASS_FREQUENCY = OID_REGISTRY.register('iso.3.6.1.2.1.33.1.5.1', scaled_decoder(10))
+UPS_BYPASS_NUM_LINES = OID_REGISTRY.register('iso.3.6.1.2.1.33.1.5.2', int)
+UPS_BYPASS_VOLTAGE = OID_REGISTRY.register('iso.3.6.1.2.1.33.1.5.3.1.2', float)
+UPS_BYPASS_CURRENT = OID_REGISTRY.register('iso.3.6.1.2.1.33.1.5.3.1.3', scaled_decoder(10))
+UPS_BYPASS_POWER = OID_REGISTRY.register('iso.3.6.1.2.1.33.1.5.3.1.4', int)
+UPS_BYPASS_VOLTAGE_1 = OID_REGISTRY.register(UPS_BYPASS_VOLTAGE + '.1', float)
+UPS_BYPASS_CURRENT_1 = OID_REGISTRY.register(UPS_BYPASS_CURRENT + '.1', scaled_decoder(10))
+UPS_BYPASS_POWER_1 = OID_REGISTRY.register(UPS_BYPASS_POWER + '.1', int)
+# Tripp Lite MIB (tripplite).
+TRIPPLITE_UPS_SERIAL_NUMBER = OID_REGISTRY.register('iso.3.6.1.4.1.850.100.1.1.2', text_decoder)
+TRIPPLITE_AGENT_SERIAL_NUMBER = OID_REGISTRY.register('iso.3.6.1.4.1.850.100.1.1.4',
+                                                      text_decoder)
+# IF-MIB physical address of the card's network interface.
+IF_PHYS_ADDRESS_2 = OID_REGISTRY.register('iso.3.6.1.2.1.2.2.1.6.2', mac_decoder)
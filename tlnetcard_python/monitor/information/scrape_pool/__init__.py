@@ -0,0 +1,2 @@
+""" Initializes ScrapePool class. """
+from .scrape_pool import ScrapePool
@@ -0,0 +1,146 @@
+"""
+tlnetcard_python.monitor.information.scrape_pool.scrape_pool
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+This module provides a ``ScrapePool`` object which scrapes the webpages of many cards at once with
+a bounded pool of worker processes, each of which runs at most one headless browser.
+"""
+
+# Standard library.
+from multiprocessing import get_context
+from multiprocessing.util import Finalize
+from queue import Queue
+from typing import Dict, Iterator, List, Tuple
+from urllib.parse import urljoin
+# Related third-party library.
+from requests import Session
+# Required internal classes/functions.
+from tlnetcard_python.login import Login
+from tlnetcard_python.monitor.information.information import scrape_with_selenium
+from tlnetcard_python.webdriver_pool import WEBDRIVER_POOL
+
+# The host whose browser the current worker process holds (None until its first task).
+_WORKER_STATE = {'host': None}
+
+class ScrapePool:
+    """
+    A ``ScrapePool`` object. Scrapes values which have no SNMP source (such as the battery
+    replacement dates of ``BatteryParameters`` or the rating of ``Identification``) from many cards
+    at once. Every card is scraped by one of at most ``workers`` worker processes, each of which
+    keeps a single headless browser, so the memory used by browsers is capped by ``workers`` no
+    matter how many cards are scraped. Results are yielded as each card finishes.
+
+    Basic Usage:
+
+    >>> from tlnetcard_python import Login
+    >>> from tlnetcard_python.monitor.information import ScrapePool
+    >>> cards = [Login(user="admin", passwd="password", host="10.0.0." + str(i))
+    >>>          for i in range(100, 102)]
+    >>> pool = ScrapePool(cards, workers=2)
+    >>> fields = {"/en/ups/info_battery.asp": ["UPS_BATTLAST", "UPS_BATTNEXT"]}
+    >>> for host, results, error in pool.scrape({i.get_host(): fields for i in cards}):
+    >>>     print(host, error or results["/en/ups/info_battery.asp"]["UPS_BATTNEXT"])
+    10.0.0.101 05/01/2023
+    10.0.0.100 05/01/2023
+    >>> pool.close()
+    """
+    def __init__(self, logins: List[Login], workers: int = 4, timeout: float = 10.0) -> None:
+        """
+        Initializes the ``ScrapePool`` object. Returns ``None``.
+
+        :param logins: The ``Login`` objects of the cards to scrape.
+        :param workers: (optional) The maximum number of worker processes (and therefore browsers).
+        :param timeout: (optional) The number of seconds to wait for the elements of each webpage.
+        :rtype: ``None``
+        """
+        self._logins = {i.get_host(): i for i in logins}
+        self._timeout = timeout
+        # Spawning (rather than forking) the workers, so that none of them inherits the browsers
+        # of this process's WEBDRIVER_POOL, or a lock another thread held at the time of the fork.
+        self._pool = get_context("spawn").Pool(processes=workers)
+    def close(self) -> None:
+        """
+        Waits for every scrape in progress, then shuts down the worker processes (and their
+        browsers). Returns ``None``.
+
+        :rtype: ``None``
+        """
+        self._pool.close()
+        self._pool.join()
+    def get_hosts(self) -> List[str]:
+        """
+        Returns the IP addresses/DNS names of the cards which can be scraped by this object.
+
+        :rtype: ``List[str]``
+        """
+        return list(self._logins)
+    def scrape(self, fields: Dict[str, Dict[str, List[str]]]) \
+            -> Iterator[Tuple[str, Dict[str, Dict[str, str]], Exception]]:
+        """
+        Scrapes the provided fields from every provided card, yielding a ``(host, results, error)``
+        tuple for each card as soon as it has been scraped. ``results`` maps each webpage to the
+        values of its fields, and ``error`` is ``None`` unless the card could not be scraped (in
+        which case ``results`` is empty). Returns
+        ``Iterator[Tuple[str, Dict[str, Dict[str, str]], Exception]]``.
+
+        :param fields: The cards to scrape, mapped from their host to their webpages (e.g.
+        "/en/ups/info_battery.asp"), which are mapped to the element IDs to scrape from them.
+        Element IDs starting with "/" are used as Xpaths.
+        :rtype: ``Iterator[Tuple[str, Dict[str, Dict[str, str]], Exception]]``
+        """
+        unknown = [i for i in fields if i not in self._logins]
+        if unknown:
+            raise ValueError("No Login object was provided for: " + ", ".join(unknown))
+
+        # Submitting every card at once; at most workers cards are scraped at the same time, and
+        # each card is queued as it finishes.
+        finished = Queue()
+        for host in fields:
+            login = self._logins[host]
+            self._pool.apply_async(
+                _scrape_host, (host, login.get_base_url(), login.get_session().cookies.get_dict(),
+                               fields[host], self._timeout),
+                callback=lambda results, host=host: finished.put((host, results, None)),
+                error_callback=lambda error, host=host: finished.put((host, {}, error))
+            )
+
+        # Yielding each card as it finishes.
+        for _ in fields:
+            yield finished.get()
+# pylint: disable=too-many-arguments
+def _scrape_host(host: str, base_url: str, cookies: Dict[str, str], pages: Dict[str, List[str]],
+                 timeout: float) -> Dict[str, Dict[str, str]]:
+    """
+    Scrapes the provided webpages of a single card. Runs in a worker process of a ``ScrapePool``,
+    and shuts down the browser the worker holds for its previous card first, so that each worker
+    only ever holds one browser. Returns ``Dict[str, Dict[str, str]]``.
+
+    :param host: The IP address/DNS name of the card.
+    :param base_url: The base URL of the card.
+    :param cookies: The cookies of the card's login session.
+    :param pages: The webpages to scrape, mapped to the element IDs (or Xpaths) to scrape.
+    :param timeout: The number of seconds to wait for the elements of each webpage.
+    :rtype: ``Dict[str, Dict[str, str]]``
+    """
+    if _WORKER_STATE['host'] is None:
+        # Only keeping the browser of the current card, and shutting it down when the worker
+        # exits (atexit handlers are not run by worker processes).
+        WEBDRIVER_POOL.set_max_idle(1)
+        Finalize(None, WEBDRIVER_POOL.close, exitpriority=10)
+    elif _WORKER_STATE['host'] != host:
+        WEBDRIVER_POOL.close()
+    _WORKER_STATE['host'] = host
+
+    session = Session()
+    session.cookies.update(cookies)
+    out = {}
+    for page in pages:
+        url = urljoin(base_url, page)
+        out[page] = {}
+        element_ids = [i for i in pages[page] if not i.startswith("/")]
+        xpaths = [i for i in pages[page] if i.startswith("/")]
+        for group, xpath in ((element_ids, False), (xpaths, True)):
+            if group:
+                values = scrape_with_selenium(host, group, url, session, timeout, xpath)
+                out[page].update(zip(group, values))
+    return out
@@ -0,0 +1,2 @@
+""" Initializes SnmpSimulator class. """
+from .simulator import SnmpSimulator
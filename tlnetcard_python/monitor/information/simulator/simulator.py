@@ -0,0 +1,345 @@
+"""
+tlnetcard_python.monitor.information.simulator.simulator
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+This module provides a ``SnmpSimulator`` object which stands in for the SNMP agent of one or more
+TLNETCARDs, so that the SNMP functions of TLNET Supervisor -> Monitor -> Information can be tested
+and benchmarked without a network.
+"""
+
+# Standard library.
+from asyncore import loop # pylint: disable=deprecated-module
+from bisect import bisect_right
+from heapq import heappop, heappush
+from itertools import count
+from random import Random
+from threading import Event, Lock, Thread
+from time import monotonic, time
+from typing import Any, Dict, List
+# Related third-party library.
+from pysnmp.carrier.asyncore.dgram import udp
+from pysnmp.carrier.asyncore.dispatch import AsyncoreDispatcher
+from pysnmp.entity import config, engine
+from pysnmp.entity.rfc3413 import cmdrsp, context
+from pysnmp.proto import rfc1902, rfc1905
+from pysnmp.smi import instrum
+from pysnmp.smi.error import TooBigError
+# Required internal classes/functions.
+from tlnetcard_python.monitor.information import oids
+
+# Values served for the scalar SNMP IDs used by this package (those of a Tripp Lite SU1500RTXLCD2U).
+SCALAR_VALUES = {
+    oids.UPS_IDENT_MODEL: 'SU1500RTXLCD2U',
+    oids.UPS_IDENT_UPS_FIRMWARE: 'FW2567R16',
+    oids.UPS_IDENT_AGENT_FIRMWARE: '01.12.05c',
+    oids.TRIPPLITE_UPS_SERIAL_NUMBER: '2628ELCPS795100166',
+    oids.TRIPPLITE_AGENT_SERIAL_NUMBER: '2634BLCAC897C00163',
+    oids.IF_PHYS_ADDRESS_2: b'\x00\x06\x67\x06\x08\xc0',
+    oids.UPS_BATTERY_STATUS: 2,
+    oids.UPS_SECONDS_ON_BATTERY: 0,
+    oids.UPS_MINUTES_REMAINING: 45,
+    oids.UPS_CHARGE_REMAINING: 100,
+    oids.UPS_BATTERY_VOLTAGE: 544,
+    oids.UPS_BATTERY_TEMPERATURE: 25,
+    oids.UPS_OUTPUT_SOURCE: 3,
+    oids.UPS_OUTPUT_FREQUENCY: 599,
+    oids.UPS_BYPASS_FREQUENCY: 600
+}
+# Values served for every line of the table columns used by this package.
+COLUMN_VALUES = {
+    oids.UPS_INPUT_FREQUENCY: 600,
+    oids.UPS_INPUT_VOLTAGE: 120,
+    oids.UPS_INPUT_CURRENT: 34,
+    oids.UPS_INPUT_TRUE_POWER: 409,
+    oids.UPS_OUTPUT_VOLTAGE: 120,
+    oids.UPS_OUTPUT_CURRENT: 36,
+    oids.UPS_OUTPUT_POWER: 409,
+    oids.UPS_OUTPUT_PERCENT_LOAD: 30,
+    oids.UPS_BYPASS_VOLTAGE: 120,
+    oids.UPS_BYPASS_CURRENT: 0,
+    oids.UPS_BYPASS_POWER: 0
+}
+# SNMP IDs holding the number of lines of each table.
+NUM_LINES_SNMP_IDS = [oids.UPS_INPUT_NUM_LINES, oids.UPS_OUTPUT_NUM_LINES,
+                      oids.UPS_BYPASS_NUM_LINES]
+# Scalars are requested by this package without their ".0" instance suffix, but walked with it.
+_SCALAR_OIDS = {i.replace("iso", "1", 1) for i in list(SCALAR_VALUES) + NUM_LINES_SNMP_IDS
+                if i != oids.IF_PHYS_ADDRESS_2}
+
+class SnmpSimulator:
+    """
+    A ``SnmpSimulator`` object. Runs an in-process SNMPv3 agent (in a background thread) serving
+    every UPS-MIB and Tripp Lite SNMP value read by the ``InOutParameters``, ``BatteryParameters``
+    and ``Identification`` objects. Any number of cards can be simulated, each listening on its own
+    UDP port, and every response can be delayed (``latency``) or dropped (``loss``) to mimic a real
+    network. This allows ``get_with_snmp()`` and friends to be tested and benchmarked on a single
+    machine.
+
+    Basic Usage:
+
+    >>> from tlnetcard_python.monitor.information import Fleet, SnmpSimulator
+    >>> simulator = SnmpSimulator("admin", "imadethisup", "imadethisuptoo", hosts=100,
+    >>>                           latency=0.02, loss=0.01)
+    >>> simulator.start()
+    >>> fleet = Fleet([{"host": "127.0.0.1", "port": i} for i in simulator.get_ports()],
+    >>>               snmp_user="admin", snmp_auth_key="imadethisup",
+    >>>               snmp_priv_key="imadethisuptoo")
+    >>> len([i for i in fleet.poll() if i[2] is None])
+    100
+    >>> fleet.close()
+    >>> simulator.stop()
+    """
+    # pylint: disable=too-many-arguments,too-many-instance-attributes,too-many-locals
+    def __init__(self, snmp_user: str, snmp_auth_key: str = "", snmp_priv_key: str = "",
+                 hosts: int = 1, port: int = 16100, latency: float = 0.0, loss: float = 0.0,
+                 lines: int = 1, max_var_binds: int = None, values: Dict[str, Any] = None,
+                 host: str = "127.0.0.1", seed: int = None) -> None:
+        """
+        Initializes the ``SnmpSimulator`` object. Returns ``None``.
+
+        :param snmp_user: The username of the SNMP user to accept.
+        :param snmp_auth_key: (optional) The Auth key of the SNMP user. If no Auth key is provided,
+        the SNMP user is accepted without authentication.
+        :param snmp_priv_key: (optional) The Priv key of the SNMP user. If no Priv key is provided,
+        the SNMP user is accepted without privacy.
+        :param hosts: (optional) The number of cards to simulate.
+        :param port: (optional) The UDP port of the first card. Every other card listens on the
+        following ports.
+        :param latency: (optional) The number of seconds every response is delayed by.
+        :param loss: (optional) The probability (between ``0`` and ``1``) of a response being
+        dropped.
+        :param lines: (optional) The number of lines in the input, output and bypass tables.
+        :param max_var_binds: (optional) The maximum number of SNMP IDs a GET request may contain
+        before a tooBig error is returned. If no maximum is provided, requests are not limited.
+        :param values: (optional) A dictionary mapping SNMP IDs to the values to serve instead of
+        the default ones (see ``set_value()``).
+        :param host: (optional) The IP address to listen on.
+        :param seed: (optional) The seed of the random number generator deciding which responses
+        are dropped.
+        :rtype: ``None``
+        """
+        self._credentials = (snmp_user, snmp_auth_key, snmp_priv_key)
+        self._addresses = [(host, port + i) for i in range(hosts)]
+        self._latency = latency
+        self._loss = loss
+        self._seed = seed
+        self._mib = _SimulatedMib(max_var_binds)
+        for i, j in SCALAR_VALUES.items():
+            self.set_value(i, j)
+        for i in NUM_LINES_SNMP_IDS:
+            self.set_value(i, lines)
+        for i, j in COLUMN_VALUES.items():
+            for k in range(1, lines + 1):
+                self.set_value(i + '.' + str(k), j)
+        for i, j in (values or {}).items():
+            self.set_value(i, j)
+        self._dispatcher = None
+        self._stopping = Event()
+        self._thread = None
+    def get_ports(self) -> List[int]:
+        """
+        Returns the UDP ports of the simulated cards.
+
+        :rtype: ``List[int]``
+        """
+        return [i[1] for i in self._addresses]
+    def set_value(self, snmp_id: str, value: Any) -> None:
+        """
+        Sets the value served for the provided SNMP ID (which can be done while the simulator is
+        running). Returns ``None``.
+
+        :param snmp_id: The SNMP ID, either in the "iso.3.6..." or the "1.3.6..." form. The
+        scalars of ``SCALAR_VALUES`` and ``NUM_LINES_SNMP_IDS`` are served both with and without
+        the ".0" instance suffix.
+        :param value: The value to serve, either as a pysnmp value or as an ``int`` (served as an
+        ``Integer32``), ``str`` or ``bytes`` (both served as an ``OctetString``).
+        :rtype: ``None``
+        """
+        if isinstance(value, int):
+            value = rfc1902.Integer32(value)
+        elif isinstance(value, (str, bytes)):
+            value = rfc1902.OctetString(value)
+        oid = snmp_id.replace("iso", "1", 1)
+        self._mib.set_value(oid, value)
+        if oid in _SCALAR_OIDS:
+            self._mib.set_value(oid + '.0', value)
+    def start(self) -> None:
+        """
+        Starts serving SNMP requests in a background thread. Returns ``None``.
+
+        :rtype: ``None``
+        """
+        snmp_user, snmp_auth_key, snmp_priv_key = self._credentials
+        snmp_engine = engine.SnmpEngine()
+        self._dispatcher = _DelayingDispatcher(self._latency, self._loss, Random(self._seed))
+        snmp_engine.registerTransportDispatcher(self._dispatcher)
+        # Every simulated card gets its own transport (and therefore its own UDP port).
+        for i, address in enumerate(self._addresses):
+            config.addTransport(snmp_engine, udp.domainName + (i + 1,),
+                                udp.UdpTransport().openServerMode(address))
+        if snmp_auth_key and snmp_priv_key:
+            config.addV3User(snmp_engine, snmp_user, config.usmHMACMD5AuthProtocol, snmp_auth_key,
+                             config.usmDESPrivProtocol, snmp_priv_key)
+            security_level = 'authPriv'
+        elif snmp_auth_key:
+            config.addV3User(snmp_engine, snmp_user, config.usmHMACMD5AuthProtocol, snmp_auth_key)
+            security_level = 'authNoPriv'
+        else:
+            config.addV3User(snmp_engine, snmp_user)
+            security_level = 'noAuthNoPriv'
+        config.addVacmUser(snmp_engine, 3, snmp_user, security_level, (1, 3, 6))
+
+        # Serving the simulated values from the default context.
+        snmp_context = context.SnmpContext(snmp_engine)
+        snmp_context.unregisterContextName(rfc1902.OctetString(''))
+        snmp_context.registerContextName(rfc1902.OctetString(''), self._mib)
+        cmdrsp.GetCommandResponder(snmp_engine, snmp_context)
+        cmdrsp.NextCommandResponder(snmp_engine, snmp_context)
+        cmdrsp.BulkCommandResponder(snmp_engine, snmp_context)
+
+        self._stopping.clear()
+        self._thread = Thread(target=self._run, daemon=True)
+        self._thread.start()
+    def stop(self) -> None:
+        """
+        Stops serving SNMP requests and closes every socket. Returns ``None``.
+
+        :rtype: ``None``
+        """
+        if self._thread is None:
+            return
+        self._stopping.set()
+        self._thread.join()
+        self._thread = None
+        self._dispatcher.closeDispatcher()
+    def _run(self) -> None:
+        """
+        Serves SNMP requests (and sends delayed responses) until ``stop()`` is called. Returns
+        ``None``.
+
+        :rtype: ``None``
+        """
+        while not self._stopping.is_set():
+            # Waiting for requests no longer than until the next delayed response is due.
+            loop(self._dispatcher.get_wait_time(), use_poll=True,
+                 map=self._dispatcher.getSocketMap(), count=1)
+            self._dispatcher.send_due_messages()
+            self._dispatcher.handleTimerTick(time())
+
+class _DelayingDispatcher(AsyncoreDispatcher):
+    """
+    An ``AsyncoreDispatcher`` which delays or drops outgoing messages.
+    """
+    # Longest time (in seconds) spent waiting for requests, so that stop() is noticed promptly.
+    MAX_WAIT_TIME = 0.05
+    def __init__(self, latency: float, loss: float, random: Random) -> None:
+        """
+        Initializes the ``_DelayingDispatcher`` object. Returns ``None``.
+
+        :param latency: The number of seconds every message is delayed by.
+        :param loss: The probability of a message being dropped.
+        :param random: The random number generator deciding which messages are dropped.
+        :rtype: ``None``
+        """
+        AsyncoreDispatcher.__init__(self)
+        self._latency = latency
+        self._loss = loss
+        self._random = random
+        # Heap of (due time, sequence number, message) tuples.
+        self._queue = []
+        self._sequence = count()
+    def get_wait_time(self) -> float:
+        """
+        Returns the number of seconds to wait for requests before the next message is due.
+
+        :rtype: ``float``
+        """
+        if not self._queue:
+            return self.MAX_WAIT_TIME
+        return min(max(self._queue[0][0] - monotonic(), 0.0), self.MAX_WAIT_TIME)
+    def send_due_messages(self) -> None:
+        """
+        Sends every delayed message which is due. Returns ``None``.
+
+        :rtype: ``None``
+        """
+        now = monotonic()
+        while self._queue and self._queue[0][0] <= now:
+            AsyncoreDispatcher.sendMessage(self, *heappop(self._queue)[2])
+    # pylint: disable=invalid-name
+    def sendMessage(self, outgoingMessage: bytes, transportDomain: tuple,
+                    transportAddress: tuple) -> None:
+        """
+        Drops the provided message (with a probability of ``loss``), or sends it after ``latency``
+        seconds. Returns ``None``.
+
+        :param outgoingMessage: The message to send.
+        :param transportDomain: The transport domain to send the message with.
+        :param transportAddress: The address to send the message to.
+        :rtype: ``None``
+        """
+        if self._loss and self._random.random() < self._loss:
+            return
+        message = (outgoingMessage, transportDomain, transportAddress)
+        if not self._latency:
+            AsyncoreDispatcher.sendMessage(self, *message)
+            return
+        heappush(self._queue, (monotonic() + self._latency, next(self._sequence), message))
+
+class _SimulatedMib(instrum.AbstractMibInstrumController):
+    """
+    A MIB instrumentation controller serving values from a dictionary.
+    """
+    def __init__(self, max_var_binds: int = None) -> None:
+        """
+        Initializes the ``_SimulatedMib`` object. Returns ``None``.
+
+        :param max_var_binds: The maximum number of SNMP IDs a GET request may contain.
+        :rtype: ``None``
+        """
+        self._lock = Lock()
+        self._max_var_binds = max_var_binds
+        self._values = {}
+        self._order = []
+    # pylint: disable=invalid-name,unused-argument
+    def readVars(self, varBinds: List[tuple], acInfo: tuple = (None, None)) -> List[tuple]:
+        """
+        Returns the values of the provided variable bindings (GET).
+
+        :param varBinds: The variable bindings of the request.
+        :param acInfo: (optional) The access control information of the request.
+        :rtype: ``List[tuple]``
+        """
+        if self._max_var_binds and len(varBinds) > self._max_var_binds:
+            raise TooBigError()
+        return [(i, self._values.get(i, rfc1905.noSuchObject)) for i, _ in varBinds]
+    def readNextVars(self, varBinds: List[tuple], acInfo: tuple = (None, None)) -> List[tuple]:
+        """
+        Returns the values following the provided variable bindings (GETNEXT and GETBULK).
+
+        :param varBinds: The variable bindings of the request.
+        :param acInfo: (optional) The access control information of the request.
+        :rtype: ``List[tuple]``
+        """
+        order = self._order
+        out = []
+        for i, _ in varBinds:
+            index = bisect_right(order, i)
+            if index < len(order):
+                out.append((order[index], self._values[order[index]]))
+            else:
+                out.append((i, rfc1905.endOfMibView))
+        return out
+    def set_value(self, oid: str, value: Any) -> None:
+        """
+        Sets the value served for the provided OID. Returns ``None``.
+
+        :param oid: The OID in the "1.3.6..." form.
+        :param value: The pysnmp value to serve.
+        :rtype: ``None``
+        """
+        name = rfc1902.ObjectName(oid)
+        with self._lock:
+            self._values[name] = value
+            # Replacing (rather than sorting in place) so that readers always see a sorted list.
+            self._order = sorted(self._values)
@@ -0,0 +1,2 @@
+""" Initializes Snapshot class. """
+from .snapshot import Snapshot
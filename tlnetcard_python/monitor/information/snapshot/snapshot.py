@@ -0,0 +1,134 @@
+"""
+tlnetcard_python.monitor.information.snapshot.snapshot
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+This module provides a ``Snapshot`` object which reads every measurement of TLNET Supervisor ->
+Monitor -> Information in a single SNMP exchange.
+"""
+
+# Standard library.
+from typing import Any, Dict, List
+# Required internal classes/functions.
+from tlnetcard_python.login import Login
+from tlnetcard_python.monitor.information.battery_parameters import BatteryParameters
+from tlnetcard_python.monitor.information.identification import Identification
+from tlnetcard_python.monitor.information.in_out_parameters import InOutParameters
+from tlnetcard_python.monitor.information.information import get_with_snmp
+
+class Snapshot:
+    """
+    A TLNET Supervisor ``Snapshot`` object. Reads the input, output, bypass, battery status and
+    battery measurements of a card (the values of the ``InOutParameters`` and ``BatteryParameters``
+    objects) with one batched SNMP exchange rather than one per function, and decodes them exactly
+    as those functions do. This makes it the best fit for dashboards which refresh every few
+    seconds.
+
+    Basic Usage:
+
+    >>> from tlnetcard_python import Login
+    >>> from tlnetcard_python.monitor.information import Snapshot
+    >>> # As always, a tlnetcard_python.Login object must first be created. Then the Login object
+    >>> # can be passed to the tlnetcard_python.monitor.information.Snapshot object.
+    >>> card = Login(user="admin", passwd="password", host="10.0.0.100")
+    >>> card_snapshot = Snapshot(card)
+    >>> card_snapshot.get_snapshot(snmp_user="admin", snmp_auth_key="imadethisup",
+    >>>                            snmp_priv_key="imadethisuptoo")["Battery Status"]
+    {'Battery Status': 'Normal', 'On Battery Time (s)': 0}
+    """
+    # Groups of values which can be read, mapped to their SNMP IDs and the function decoding them.
+    GROUPS = {
+        'Input': (InOutParameters.INPUT_SNMP_DICT, InOutParameters.decode_input_measurements),
+        'Output': (InOutParameters.OUTPUT_SNMP_DICT, InOutParameters.decode_output_measurements),
+        'Bypass': (InOutParameters.BYPASS_SNMP_DICT, InOutParameters.decode_bypass_measurements),
+        'Battery Status': (BatteryParameters.STATUS_SNMP_DICT,
+                           BatteryParameters.decode_battery_status),
+        'Battery Measurements': (BatteryParameters.MEASUREMENTS_SNMP_DICT,
+                                 BatteryParameters.decode_battery_measurements),
+        'Identification': (Identification.IDENTIFICATION_SNMP_DICT,
+                           Identification.decode_identification_info)
+    }
+    # Groups read by get_snapshot() when no groups are provided.
+    DEFAULT_GROUPS = ['Input', 'Output', 'Bypass', 'Battery Status', 'Battery Measurements']
+    def __init__(self, login_object: Login) -> None:
+        """
+        Initializes the ``Snapshot`` object. Returns ``None``.
+
+        :param login_object: A valid ``tlnetcard_python.Login`` object.
+        :rtype: ``None``
+        """
+        self._login_object = login_object
+    @classmethod
+    def decode_snapshot(cls, groups: List[str], values: List[Any]) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns the provided groups decoded from the SNMP values of ``get_snmp_ids(groups)`` (in
+        the same order) as a dictionary mapping each group name to its decoded values.
+
+        :param groups: The names of the groups to decode.
+        :param values: The SNMP values returned for ``get_snmp_ids(groups)``.
+        :rtype: ``Dict[str, Dict[str, Any]]``
+        """
+        value_dict = dict(zip(cls.get_snmp_ids(groups), values))
+        out = {}
+        for i in groups:
+            snmp_dict, decoder = cls.GROUPS[i]
+            out[i] = decoder([value_dict[j] for j in snmp_dict.values()])
+        return out
+    @classmethod
+    def get_snmp_ids(cls, groups: List[str]) -> List[str]:
+        """
+        Returns the union of the SNMP IDs of the provided groups, without duplicates. Raises a
+        ``ValueError`` if any of the groups is unknown.
+
+        :param groups: The names of the groups to read.
+        :rtype: ``List[str]``
+        """
+        snmp_ids = []
+        for i in groups:
+            if i not in cls.GROUPS:
+                raise ValueError("Unknown snapshot group: " + i)
+            snmp_ids += [j for j in cls.GROUPS[i][0].values() if j not in snmp_ids]
+        return snmp_ids
+    def get_snapshot(self, snmp_user: str = "", snmp_auth_key: str = "", snmp_priv_key: str = "",
+                     groups: List[str] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns the measurements of the provided groups as a dictionary mapping each group name to
+        the dictionary the equivalent ``InOutParameters`` or ``BatteryParameters`` function returns.
+
+        :param snmp_user: (optional) The SNMP user to connect with.
+        :param snmp_auth_key: (optional) The SNMP auth key to connect with.
+        :param snmp_priv_key: (optional) The SNMP priv key to connect with.
+        :param groups: (optional) The names of the groups to read (keys of ``GROUPS``). If no groups
+        are provided, ``DEFAULT_GROUPS`` are read.
+        :rtype: ``Dict[str, Dict[str, Any]]``
+        """
+        if groups is None:
+            groups = self.DEFAULT_GROUPS
+        values = get_with_snmp(self._login_object.get_host(), self.get_snmp_ids(groups),
+                               snmp_user, snmp_auth_key, snmp_priv_key,
+                               self._login_object.get_timeout(), typed=True)
+        return self.decode_snapshot(groups, values)
+    async def get_snapshot_async(self, snmp_user: str = "", snmp_auth_key: str = "",
+                                 snmp_priv_key: str = "", groups: List[str] = None
+                                 ) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns the measurements of the provided groups as a dictionary without blocking the event
+        loop. This is the asyncio counterpart of ``get_snapshot()``.
+
+        :param snmp_user: (optional) The SNMP user to connect with.
+        :param snmp_auth_key: (optional) The SNMP auth key to connect with.
+        :param snmp_priv_key: (optional) The SNMP priv key to connect with.
+        :param groups: (optional) The names of the groups to read (keys of ``GROUPS``). If no groups
+        are provided, ``DEFAULT_GROUPS`` are read.
+        :rtype: ``Dict[str, Dict[str, Any]]``
+        """
+        if groups is None:
+            groups = self.DEFAULT_GROUPS
+        # Imported here, as pysnmp's asyncio API cannot be imported on every Python version
+        # this package supports, and the synchronous functions of this class do not need it.
+        # pylint: disable=import-outside-toplevel
+        from tlnetcard_python.monitor.information.snmp_async import get_with_snmp_async
+        values = await get_with_snmp_async(self._login_object.get_host(),
+                                           self.get_snmp_ids(groups), snmp_user, snmp_auth_key,
+                                           snmp_priv_key,
+                                           self._login_object.get_timeout(), typed=True)
+        return self.decode_snapshot(groups, values)
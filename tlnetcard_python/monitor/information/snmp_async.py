@@ -0,0 +1,152 @@
+"""
+tlnetcard_python.monitor.information.snmp_async
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Provides the get_with_snmp_async() coroutine, the asyncio counterpart of get_with_snmp(). It is
+built on pysnmp's asyncio high-level API, so any number of requests (to any number of hosts) can be
+outstanding on one event loop at the same time.
+"""
+
+# Standard library.
+import asyncio
+from typing import Any, List, Tuple
+from warnings import warn
+from weakref import WeakKeyDictionary
+# Related third-party library.
+from pysnmp.hlapi.asyncio import getCmd, SnmpEngine, UsmUserData, UdpTransportTarget
+from pysnmp.hlapi.asyncio import ContextData
+# Required internal classes/functions.
+from tlnetcard_python.monitor.information.oids import OID_REGISTRY, get_native_value
+from tlnetcard_python.monitor.information.snmp_cache import USM_KEY_CACHE
+
+# Error status reported by an SNMP agent when its response would not fit into a single message.
+_SNMP_TOO_BIG = 1
+# SNMP engines and transport targets of every event loop. Entries disappear with their event loop.
+_LOOP_STATE = WeakKeyDictionary()
+
+# Initialize class methods.
+def close_snmp_engines_async(loop: asyncio.AbstractEventLoop = None) -> None:
+    """
+    Closes the SNMP engines (and their sockets) used by ``get_with_snmp_async()`` on the provided
+    event loop. Returns ``None``.
+
+    :param loop: (optional) The event loop whose SNMP engines should be closed. If no event loop is
+    provided, the current event loop is used.
+    :rtype: ``None``
+    """
+    if loop is None:
+        loop = asyncio.get_event_loop()
+    engines, _ = _LOOP_STATE.pop(loop, ({}, {}))
+    for snmp_engine in engines.values():
+        # Engines which never opened a transport (e.g. the host could not be resolved) have no
+        # dispatcher to close.
+        if snmp_engine.transportDispatcher is not None:
+            snmp_engine.transportDispatcher.closeDispatcher()
+# pylint: disable=too-many-arguments
+async def get_with_snmp_async(host: str, snmp_ids: List[str], snmp_user: str = "",
+                              snmp_auth_key: str = "", snmp_priv_key: str = "",
+                              timeout: float = 10.0, strict: bool = False,
+                              typed: bool = False, port: int = 161) -> List[Any]:
+    """
+    Gets the provided SNMP values from their SNMP IDs without blocking the event loop. All SNMP IDs
+    are requested in as few GET PDUs as possible. Returns ``List[str]``, or ``List[Any]`` if
+    ``typed`` is set to ``True``.
+
+    :param host: The IP address/DNS name of the SNMP device.
+    :param snmp_ids: A list of SNMP IDs to retrieve from the host.
+    :param snmp_user: (optional) The username for the SNMP user to connect as.
+    :param snmp_auth_key: (optional) The Auth key for the SNMP user to connect as.
+    :param snmp_priv_key: (optional) The Priv key for the SNMP user to connect as.
+    :param timeout: (optional) The number of seconds to wait for responses before quitting.
+    :param strict: (optional) Whether SNMP errors should raise a ``RuntimeError`` rather than being
+    warned about (and returned as empty values).
+    :param typed: (optional) Whether values should be returned as native Python values (see
+    ``get_native_value()``) rather than strings. Typed values are neither formatted as strings nor
+    looked up in MIBs. Values which could not be retrieved are ``None`` rather than ``""``.
+    :param port: (optional) The UDP port of the SNMP device.
+    :rtype: ``List[Any]``
+    """
+    snmp_engine, usm_user_data, transport_target = _get_loop_target(host, snmp_user,
+                                                                    snmp_auth_key, snmp_priv_key,
+                                                                    timeout, port)
+    error, var_binds = await _get_batch_async(snmp_engine, usm_user_data, transport_target,
+                                              snmp_ids, not typed)
+    if error and strict:
+        raise RuntimeError(error)
+    if error:
+        warn(error, RuntimeWarning)
+        # Creating an output list of the proper size.
+        return [None if typed else "" for i in snmp_ids]
+    if typed:
+        return [get_native_value(i[1]) for i in var_binds]
+    return [str(i).split("=")[-1] for i in var_binds]
+async def _get_batch_async(snmp_engine: SnmpEngine, usm_user_data: UsmUserData,
+                           transport_target: UdpTransportTarget,
+                           snmp_ids: List[str], lookup_mib: bool = True) -> Tuple[str, List[Any]]:
+    """
+    Requests all of the provided SNMP IDs in a single GET PDU, splitting them in half (recursively)
+    if the agent reports that the response would be too big. Returns a tuple containing an error
+    message (empty upon success) and the variable bindings in the same order as ``snmp_ids``.
+
+    :param snmp_engine: The ``SnmpEngine`` to send the request with.
+    :param usm_user_data: The ``UsmUserData`` to authenticate the request with.
+    :param transport_target: The ``UdpTransportTarget`` of the SNMP device.
+    :param snmp_ids: A list of SNMP IDs to retrieve from the host.
+    :param lookup_mib: (optional) Whether the variable bindings should be looked up in MIBs.
+    :rtype: ``Tuple[str, List[Any]]``
+    """
+    error_indication, error_status, error_index, var_binds = await getCmd(
+        snmp_engine, usm_user_data, transport_target, ContextData(),
+        *OID_REGISTRY.get_object_types(snmp_ids), lookupMib=lookup_mib
+    )
+    if error_indication:
+        return str(error_indication), []
+    if int(error_status) == _SNMP_TOO_BIG and len(snmp_ids) > 1:
+        # Requesting both halves at the same time.
+        half = len(snmp_ids) // 2
+        halves = await asyncio.gather(
+            _get_batch_async(snmp_engine, usm_user_data, transport_target, snmp_ids[:half],
+                             lookup_mib),
+            _get_batch_async(snmp_engine, usm_user_data, transport_target, snmp_ids[half:],
+                             lookup_mib)
+        )
+        for error, _ in halves:
+            if error:
+                return error, []
+        return "", halves[0][1] + halves[1][1]
+    if error_status:
+        return '%s at %s' % (error_status.prettyPrint(),
+                             error_index and var_binds[int(error_index) - 1][0] or '?'), []
+    return "", list(var_binds)
+# pylint: disable=too-many-arguments
+def _get_loop_target(host: str, snmp_user: str, snmp_auth_key: str, snmp_priv_key: str,
+                     timeout: float, port: int = 161
+                     ) -> Tuple[SnmpEngine, UsmUserData, UdpTransportTarget]:
+    """
+    Returns the SNMP engine, user and transport target to use for the provided host and credentials
+    on the current event loop. One engine (and one socket) is shared by every host polled with the
+    same credentials on the same event loop.
+
+    :param host: The IP address/DNS name of the SNMP device.
+    :param snmp_user: The username for the SNMP user to connect as.
+    :param snmp_auth_key: The Auth key for the SNMP user to connect as.
+    :param snmp_priv_key: The Priv key for the SNMP user to connect as.
+    :param timeout: The number of seconds to wait for responses before quitting.
+    :param port: (optional) The UDP port of the SNMP device.
+    :rtype: ``Tuple[SnmpEngine, UsmUserData, UdpTransportTarget]``
+    """
+    loop = asyncio.get_event_loop()
+    if loop not in _LOOP_STATE:
+        _LOOP_STATE[loop] = ({}, {})
+    engines, transport_targets = _LOOP_STATE[loop]
+
+    credentials = (snmp_user, snmp_auth_key, snmp_priv_key)
+    if credentials not in engines:
+        engines[credentials] = SnmpEngine()
+    # Resolving the host name only once rather than once per request.
+    if (host, port, timeout) not in transport_targets:
+        transport_targets[(host, port, timeout)] = UdpTransportTarget((host, port), timeout,
+                                                                      retries=1)
+
+    usm_user_data = USM_KEY_CACHE.get_usm_user_data(snmp_user, snmp_auth_key, snmp_priv_key)
+    return engines[credentials], usm_user_data, transport_targets[(host, port, timeout)]
@@ -0,0 +1,358 @@
+"""
+tlnetcard_python.monitor.information.snmp_cache
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Provides the ``SnmpEngineRegistry`` object, which keeps long-lived SNMP engines and transports so
+that SNMPv3 engine ID discovery, time synchronization and socket setup only happen once per card
+rather than once per request, and the ``UsmKeyCache`` object, which keeps SNMPv3 USM keys so that
+the password-to-key hashing only happens once per set of credentials.
+"""
+
+# Standard library.
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+from typing import Any, Callable, Hashable, Tuple
+# Related third-party library.
+from pysnmp.entity import config
+from pysnmp.hlapi import SnmpEngine, UsmUserData, UdpTransportTarget
+from pysnmp.hlapi import usmHMACMD5AuthProtocol, usmDESPrivProtocol
+from pysnmp.hlapi import usmKeyTypeMaster, usmKeyTypeLocalized
+from pysnmp.proto.rfc1902 import OctetString
+from pysnmp.proto.secmod.rfc3414.service import SnmpUSMSecurityModel
+
+class UsmKeyCache:
+    """
+    A bounded, least-recently-used cache of SNMPv3 USM keys. Turning a passphrase into a master key
+    costs roughly a million hash rounds, so master keys are cached by passphrase, and keys localized
+    to an authoritative engine ID are cached by user, passphrases and engine ID. Keys are derived
+    with the protocols ``UsmUserData`` uses by default (HMAC-MD5 and DES). This object is
+    thread-safe.
+
+    Basic Usage:
+
+    >>> from tlnetcard_python.monitor.information.snmp_cache import UsmKeyCache
+    >>> key_cache = UsmKeyCache(max_size=256)
+    >>> # The first call hashes both passphrases, every later call is a dictionary lookup.
+    >>> usm_user_data = key_cache.get_usm_user_data("admin", "imadethisup", "imadethisuptoo")
+    """
+    def __init__(self, max_size: int = 1024) -> None:
+        """
+        Initializes the ``UsmKeyCache`` object. Returns ``None``.
+
+        :param max_size: (optional) The maximum number of master keys and the maximum number of
+        localized keys which will be kept. Once full, the least recently used keys are evicted.
+        :rtype: ``None``
+        """
+        self._max_size = max_size
+        self._lock = Lock()
+        self._master_keys = OrderedDict()
+        self._localized_keys = OrderedDict()
+    def clear(self) -> None:
+        """
+        Removes every key from the cache. Returns ``None``.
+
+        :rtype: ``None``
+        """
+        with self._lock:
+            self._master_keys.clear()
+            self._localized_keys.clear()
+    def get_localized_keys(self, snmp_user: str, snmp_auth_key: str, snmp_priv_key: str,
+                           engine_id: bytes) -> Tuple[bytes, bytes]:
+        """
+        Returns the auth and priv keys localized to the provided authoritative engine ID as a tuple.
+        The priv key will be ``None`` if no priv passphrase was provided.
+
+        :param snmp_user: The username for the SNMP user.
+        :param snmp_auth_key: The Auth key (passphrase) for the SNMP user.
+        :param snmp_priv_key: The Priv key (passphrase) for the SNMP user.
+        :param engine_id: The authoritative engine ID of the SNMP device.
+        :rtype: ``Tuple[bytes, bytes]``
+        """
+        def localize() -> Tuple[bytes, bytes]:
+            master_auth, master_priv = self.get_master_keys(snmp_auth_key, snmp_priv_key)
+            auth_service = SnmpUSMSecurityModel.authServices[usmHMACMD5AuthProtocol]
+            local_auth = bytes(auth_service.localizeKey(master_auth,
+                                                                 OctetString(engine_id)))
+            local_priv = None
+            if master_priv is not None:
+                priv_service = SnmpUSMSecurityModel.privServices[usmDESPrivProtocol]
+                local_priv = bytes(priv_service.localizeKey(usmHMACMD5AuthProtocol, master_priv,
+                                                            OctetString(engine_id)))
+            return local_auth, local_priv
+        return self._lookup(self._localized_keys,
+                            (snmp_user, snmp_auth_key, snmp_priv_key, bytes(engine_id)), localize)
+    def get_master_keys(self, snmp_auth_key: str, snmp_priv_key: str) -> Tuple[bytes, bytes]:
+        """
+        Returns the (non-localized) master auth and priv keys for the provided passphrases as a
+        tuple. The priv key will be ``None`` if no priv passphrase was provided.
+
+        :param snmp_auth_key: The Auth key (passphrase) for the SNMP user.
+        :param snmp_priv_key: The Priv key (passphrase) for the SNMP user.
+        :rtype: ``Tuple[bytes, bytes]``
+        """
+        def hash_passphrases() -> Tuple[bytes, bytes]:
+            auth_service = SnmpUSMSecurityModel.authServices[usmHMACMD5AuthProtocol]
+            master_auth = bytes(auth_service.hashPassphrase(OctetString(snmp_auth_key)))
+            master_priv = None
+            if snmp_priv_key != "":
+                priv_service = SnmpUSMSecurityModel.privServices[usmDESPrivProtocol]
+                master_priv = bytes(priv_service.hashPassphrase(usmHMACMD5AuthProtocol,
+                                                                OctetString(snmp_priv_key)))
+            return master_auth, master_priv
+        return self._lookup(self._master_keys, (snmp_auth_key, snmp_priv_key), hash_passphrases)
+    def get_usm_user_data(self, snmp_user: str, snmp_auth_key: str = "",
+                          snmp_priv_key: str = "") -> UsmUserData:
+        """
+        Returns a ``UsmUserData`` object for the provided credentials which carries cached master
+        keys instead of passphrases, so that the SNMP engine only has to localize them.
+
+        :param snmp_user: The username for the SNMP user.
+        :param snmp_auth_key: (optional) The Auth key (passphrase) for the SNMP user.
+        :param snmp_priv_key: (optional) The Priv key (passphrase) for the SNMP user.
+        :rtype: ``UsmUserData``
+        """
+        if snmp_auth_key == "":
+            # Nothing to hash (a priv key without an auth key is rejected by UsmUserData).
+            if snmp_priv_key != "":
+                return UsmUserData(snmp_user, privKey=snmp_priv_key)
+            return UsmUserData(snmp_user)
+        master_auth, master_priv = self.get_master_keys(snmp_auth_key, snmp_priv_key)
+        if master_priv is None:
+            return UsmUserData(snmp_user, authKey=master_auth, authKeyType=usmKeyTypeMaster)
+        return UsmUserData(snmp_user, authKey=master_auth, privKey=master_priv,
+                           authKeyType=usmKeyTypeMaster, privKeyType=usmKeyTypeMaster)
+    # pylint: disable=too-many-arguments
+    def install_localized_keys(self, snmp_engine: SnmpEngine, snmp_user: str, snmp_auth_key: str,
+                               snmp_priv_key: str, engine_id: bytes) -> None:
+        """
+        Adds the provided user to the provided SNMP engine using keys localized to the provided
+        authoritative engine ID, so that the engine does not have to localize them itself. Does
+        nothing if no auth passphrase was provided. Returns ``None``.
+
+        :param snmp_engine: The ``SnmpEngine`` which will talk to the SNMP device.
+        :param snmp_user: The username for the SNMP user.
+        :param snmp_auth_key: The Auth key (passphrase) for the SNMP user.
+        :param snmp_priv_key: The Priv key (passphrase) for the SNMP user.
+        :param engine_id: The authoritative engine ID of the SNMP device.
+        :rtype: ``None``
+        """
+        if snmp_auth_key == "":
+            return
+        local_auth, local_priv = self.get_localized_keys(snmp_user, snmp_auth_key, snmp_priv_key,
+                                                         engine_id)
+        if local_priv is None:
+            config.addV3User(snmp_engine, snmp_user, usmHMACMD5AuthProtocol, local_auth,
+                             securityEngineId=OctetString(engine_id),
+                             authKeyType=usmKeyTypeLocalized)
+        else:
+            config.addV3User(snmp_engine, snmp_user, usmHMACMD5AuthProtocol, local_auth,
+                             usmDESPrivProtocol, local_priv,
+                             securityEngineId=OctetString(engine_id),
+                             authKeyType=usmKeyTypeLocalized, privKeyType=usmKeyTypeLocalized)
+    def _lookup(self, cache: OrderedDict, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """
+        Returns the value stored under ``key`` in ``cache``, calling ``factory`` to create (and
+        store) it on a miss. The least recently used entry is evicted once ``cache`` is full.
+
+        :param cache: The ``OrderedDict`` to look the key up in.
+        :param key: The key to look up.
+        :param factory: A function which returns the value for ``key``.
+        :rtype: ``Any``
+        """
+        with self._lock:
+            if key in cache:
+                cache.move_to_end(key)
+                return cache[key]
+        # Deriving the keys outside of the lock so that other lookups are not held up.
+        value = factory()
+        with self._lock:
+            cache[key] = value
+            cache.move_to_end(key)
+            while len(cache) > self._max_size:
+                cache.popitem(last=False)
+        return value
+
+# Process-wide USM key cache shared by every SnmpEngineRegistry.
+USM_KEY_CACHE = UsmKeyCache()
+
+# pylint: disable=too-many-instance-attributes
+class SnmpTarget:
+    """
+    A single entry of a ``SnmpEngineRegistry``. Holds the ``SnmpEngine``, ``UsmUserData`` and
+    ``UdpTransportTarget`` used to talk to one card with one set of SNMP credentials. The ``lock``
+    attribute must be held while the engine is in use, as SNMP engines are not thread-safe.
+    """
+    # pylint: disable=too-many-arguments
+    def __init__(self, host: str, port: int, snmp_user: str, snmp_auth_key: str,
+                 snmp_priv_key: str, engine_id: bytes = None,
+                 key_cache: UsmKeyCache = USM_KEY_CACHE) -> None:
+        """
+        Initializes the ``SnmpTarget`` object. Returns ``None``.
+
+        :param host: The IP address/DNS name of the SNMP device.
+        :param port: The UDP port of the SNMP device.
+        :param snmp_user: The username for the SNMP user to connect as.
+        :param snmp_auth_key: The Auth key for the SNMP user to connect as.
+        :param snmp_priv_key: The Priv key for the SNMP user to connect as.
+        :param engine_id: (optional) The authoritative engine ID of the SNMP device, if it is
+        already known. When provided, keys localized to it are installed in the engine up front.
+        :param key_cache: (optional) The ``UsmKeyCache`` from which USM keys will be taken.
+        :rtype: ``None``
+        """
+        self.engine = SnmpEngine()
+        self.engine_id = engine_id
+        self.lock = Lock()
+        self.last_used = monotonic()
+        self._address = (host, port)
+        self._transport_target = None
+        self._timeout = None
+
+        self.usm_user_data = key_cache.get_usm_user_data(snmp_user, snmp_auth_key, snmp_priv_key)
+        if engine_id is not None:
+            key_cache.install_localized_keys(self.engine, snmp_user, snmp_auth_key, snmp_priv_key,
+                                             engine_id)
+        # Remembering the authoritative engine ID of the card once it has been discovered.
+        self.engine.observer.registerObserver(self._store_engine_id, 'rfc3414.processIncomingMsg')
+    def close(self) -> None:
+        """
+        Closes the transport dispatcher (and therefore the socket) of the engine. Returns ``None``.
+
+        :rtype: ``None``
+        """
+        if self.engine.transportDispatcher is not None:
+            self.engine.transportDispatcher.closeDispatcher()
+            self.engine.unregisterTransportDispatcher()
+    def get_transport_target(self, timeout: float) -> UdpTransportTarget:
+        """
+        Returns the ``UdpTransportTarget`` for the card, creating a new one only if the timeout has
+        changed since the last call.
+
+        :param timeout: The number of seconds to wait for responses before quitting.
+        :rtype: ``UdpTransportTarget``
+        """
+        if self._transport_target is None or self._timeout != timeout:
+            self._transport_target = UdpTransportTarget(self._address, timeout=timeout,
+                                                        retries=1)
+            self._timeout = timeout
+        return self._transport_target
+    # pylint: disable=unused-argument
+    def _store_engine_id(self, snmp_engine: SnmpEngine, execpoint: str, variables: dict,
+                         cb_ctx: Any) -> None:
+        """
+        Observer callback which stores the authoritative engine ID of every incoming SNMPv3
+        message. Returns ``None``.
+
+        :rtype: ``None``
+        """
+        self.engine_id = bytes(variables['securityEngineId'])
+
+class SnmpEngineRegistry:
+    """
+    A registry of ``SnmpTarget`` objects keyed by host, port and SNMP credentials. Entries which
+    have not been used for ``idle_timeout`` seconds are closed and evicted the next time the
+    registry is accessed. The engine IDs discovered by evicted entries are kept (for at most
+    ``max_engine_ids`` cards, least recently used first out) until their host is closed.
+
+    Basic Usage:
+
+    >>> from tlnetcard_python.monitor.information.snmp_cache import SnmpEngineRegistry
+    >>> registry = SnmpEngineRegistry(idle_timeout=60.0)
+    >>> target = registry.get("10.0.0.100", "admin", "imadethisup", "imadethisuptoo")
+    >>> with target.lock:
+    >>>     # Use target.engine, target.usm_user_data and target.get_transport_target(10.0) here.
+    >>>     pass
+    >>> registry.close()
+    """
+    def __init__(self, idle_timeout: float = 300.0, max_engine_ids: int = 1024) -> None:
+        """
+        Initializes the ``SnmpEngineRegistry`` object. Returns ``None``.
+
+        :param idle_timeout: (optional) The number of seconds an entry may go unused before it is
+        closed and evicted.
+        :param max_engine_ids: (optional) The maximum number of engine IDs of evicted entries which
+        will be kept. Once full, the least recently used engine IDs are forgotten.
+        :rtype: ``None``
+        """
+        self._idle_timeout = idle_timeout
+        self._max_engine_ids = max_engine_ids
+        self._lock = Lock()
+        self._targets = {}
+        # Engine IDs of evicted entries, so that new entries can start out with localized keys.
+        self._engine_ids = OrderedDict()
+    # pylint: disable=too-many-arguments
+    def get(self, host: str, snmp_user: str = "", snmp_auth_key: str = "",
+            snmp_priv_key: str = "", port: int = 161) -> SnmpTarget:
+        """
+        Returns the ``SnmpTarget`` for the provided host and credentials, creating it if it does not
+        exist yet. Idle entries are evicted before returning.
+
+        :param host: The IP address/DNS name of the SNMP device.
+        :param snmp_user: (optional) The username for the SNMP user to connect as.
+        :param snmp_auth_key: (optional) The Auth key for the SNMP user to connect as.
+        :param snmp_priv_key: (optional) The Priv key for the SNMP user to connect as.
+        :param port: (optional) The UDP port of the SNMP device.
+        :rtype: ``SnmpTarget``
+        """
+        key = (host, port, snmp_user, snmp_auth_key, snmp_priv_key)
+        with self._lock:
+            self._evict_idle()
+            if key not in self._targets:
+                engine_id = self._engine_ids.get((host, port))
+                if engine_id is not None:
+                    self._engine_ids.move_to_end((host, port))
+                self._targets[key] = SnmpTarget(host, port, snmp_user, snmp_auth_key,
+                                                 snmp_priv_key, engine_id)
+            target = self._targets[key]
+            target.last_used = monotonic()
+        return target
+    def close(self, host: str = None) -> None:
+        """
+        Closes and evicts every entry for the provided host, and forgets its engine IDs. If no host
+        is provided, every entry in the registry is closed and evicted. Returns ``None``.
+
+        :param host: (optional) The IP address/DNS name of the SNMP device.
+        :rtype: ``None``
+        """
+        with self._lock:
+            for key in list(self._targets):
+                if host is None or key[0] == host:
+                    target = self._targets.pop(key)
+                    with target.lock:
+                        target.close()
+            for key in list(self._engine_ids):
+                if host is None or key[0] == host:
+                    del self._engine_ids[key]
+    def _evict_idle(self) -> None:
+        """
+        Closes and evicts every entry which has been idle for longer than ``idle_timeout`` seconds.
+        Entries which are currently in use are skipped. The registry lock must be held by the
+        caller. Returns ``None``.
+
+        :rtype: ``None``
+        """
+        now = monotonic()
+        for key in list(self._targets):
+            target = self._targets[key]
+            if now - target.last_used > self._idle_timeout and target.lock.acquire(False):
+                try:
+                    target.close()
+                    del self._targets[key]
+                finally:
+                    target.lock.release()
+                self._remember_engine_id(key, target)
+    def _remember_engine_id(self, key: Tuple[str, int, str, str, str], target: SnmpTarget) -> None:
+        """
+        Stores the engine ID discovered by an evicted entry under its host and port, forgetting the
+        least recently used engine ID if more than ``max_engine_ids`` are held. The registry lock
+        must be held by the caller. Returns ``None``.
+
+        :param key: The registry key of the closed entry.
+        :param target: The closed entry.
+        :rtype: ``None``
+        """
+        if target.engine_id is not None:
+            self._engine_ids[key[:2]] = target.engine_id
+            self._engine_ids.move_to_end(key[:2])
+            if len(self._engine_ids) > self._max_engine_ids:
+                self._engine_ids.popitem(last=False)
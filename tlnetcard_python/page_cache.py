@@ -0,0 +1,118 @@
+"""
+tlnetcard_python.page_cache
+~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Provides the ``PageCache`` object, which keeps the webpages fetched from a TLNET Supervisor for a
+short time so that every value scraped from the same webpage costs a single fetch, and the
+``CachedPage`` object it holds for each webpage.
+"""
+
+# Standard library.
+from threading import Lock
+from time import monotonic
+
+# pylint: disable=too-few-public-methods
+class CachedPage:
+    """
+    A webpage held by a ``PageCache``. Holds the HTML of the webpage, the text of the scripts and
+    data it loads (``None`` for those which could not be fetched), and the values a browser rendered
+    for it, keyed by element ID (or Xpath).
+    """
+    def __init__(self, html: str) -> None:
+        """
+        Initializes the ``CachedPage`` object. Returns ``None``.
+
+        :param html: The HTML of the webpage.
+        :rtype: ``None``
+        """
+        self.html = html
+        self.resources = {}
+        self.rendered = {}
+        self.created = monotonic()
+
+class PageCache:
+    """
+    A cache of webpages keyed by URL. Webpages are held for ``ttl`` seconds, after which they are
+    fetched again. Every ``Login`` object holds one (see ``Login.get_page_cache()``), which is
+    shared by every object scraping webpages of that card. This object is thread-safe.
+
+    Basic Usage:
+
+    >>> from tlnetcard_python import Login
+    >>> from tlnetcard_python.monitor.information import BatteryParameters
+    >>> card = Login(user="admin", passwd="password", host="10.0.0.100", page_cache_ttl=30.0)
+    >>> card_batt_parameters = BatteryParameters(card)
+    >>> # Both values are read from a single fetch of info_battery.asp.
+    >>> card_batt_parameters.get_last_replacement_date()
+    '05/01/2020'
+    >>> card_batt_parameters.get_next_replacement_date()
+    '05/01/2023'
+    >>> # Forgetting every webpage, so that the next call fetches info_battery.asp again.
+    >>> card.get_page_cache().clear()
+    """
+    def __init__(self, ttl: float = 5.0) -> None:
+        """
+        Initializes the ``PageCache`` object. Returns ``None``.
+
+        :param ttl: (optional) The number of seconds a webpage is held before it is fetched again.
+        A ``ttl`` of ``0`` disables the cache.
+        :rtype: ``None``
+        """
+        self._ttl = ttl
+        self._lock = Lock()
+        self._pages = {}
+    def clear(self, url: str = None) -> None:
+        """
+        Forgets the webpage at the provided URL. If no URL is provided, every webpage is forgotten.
+        Returns ``None``.
+
+        :param url: (optional) The URL of the webpage.
+        :rtype: ``None``
+        """
+        with self._lock:
+            if url is None:
+                self._pages.clear()
+            else:
+                self._pages.pop(url, None)
+    def get(self, url: str) -> CachedPage:
+        """
+        Returns the ``CachedPage`` for the provided URL, or ``None`` if the webpage is not held (or
+        was held for longer than ``ttl`` seconds).
+
+        :param url: The URL of the webpage.
+        :rtype: ``CachedPage``
+        """
+        with self._lock:
+            page = self._pages.get(url)
+            if page is not None and monotonic() - page.created >= self._ttl:
+                del self._pages[url]
+                page = None
+        return page
+    def get_ttl(self) -> float:
+        """
+        Returns the number of seconds a webpage is held before it is fetched again.
+
+        :rtype: ``float``
+        """
+        return self._ttl
+    def set(self, url: str, page: CachedPage) -> None:
+        """
+        Holds the provided ``CachedPage`` for the provided URL (unless the cache is disabled).
+        Returns ``None``.
+
+        :param url: The URL of the webpage.
+        :param page: The ``CachedPage`` of the webpage.
+        :rtype: ``None``
+        """
+        if self._ttl <= 0:
+            return
+        with self._lock:
+            self._pages[url] = page
+    def set_ttl(self, ttl: float) -> None:
+        """
+        Sets the number of seconds a webpage is held before it is fetched again. Returns ``None``.
+
+        :param ttl: The number of seconds. A ``ttl`` of ``0`` disables the cache.
+        :rtype: ``None``
+        """
+        self._ttl = ttl
@@ -0,0 +1,171 @@
+"""
+tlnetcard_python.session_store
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Provides the ``SessionStore`` object, which keeps the cookies of TLNET Supervisor login sessions in
+a file so that a new ``Login`` object (for example, in the next run of a short-lived script) can
+reuse a session instead of logging in again.
+"""
+
+# Standard library.
+import json
+import os
+from threading import Lock
+from time import time
+from typing import Dict
+
+class SessionStore:
+    """
+    An on-disk store of login session cookies keyed by TLNET Supervisor and user. Each entry holds
+    the cookies of a session and the time it was last known to be valid; entries older than
+    ``max_age`` seconds are ignored. Provide one to ``Login`` to have it try the stored session
+    (with a single request) before logging in again. The file is only readable by its owner, as
+    the cookies it holds are as good as a password until they expire. This object is thread-safe.
+
+    Basic Usage:
+
+    >>> from tlnetcard_python import Login
+    >>> from tlnetcard_python.session_store import SessionStore
+    >>> store = SessionStore("/var/lib/ups-inventory/sessions.json")
+    >>> # The first run logs in, and every later run (within max_age) reuses the session.
+    >>> card = Login(user="admin", passwd="password", host="10.0.0.100", session_store=store)
+    """
+    def __init__(self, path: str = "", max_age: float = 600.0) -> None:
+        """
+        Initializes the ``SessionStore`` object. Returns ``None``.
+
+        :param path: (optional) The path of the file holding the sessions. When left empty,
+        ``~/.tlnetcard_python_sessions.json`` is used.
+        :param max_age: (optional) The number of seconds after which a stored session is no longer
+        tried.
+        :rtype: ``None``
+        """
+        if path == "":
+            path = os.path.join(os.path.expanduser("~"), ".tlnetcard_python_sessions.json")
+        self._path = path
+        self._max_age = max_age
+        self._lock = Lock()
+    def clear(self) -> None:
+        """
+        Forgets every stored session. Returns ``None``.
+
+        :rtype: ``None``
+        """
+        with self._lock:
+            self._write({})
+    def delete(self, url: str, user: str) -> None:
+        """
+        Forgets the stored session of the provided user on the provided TLNET Supervisor. Returns
+        ``None``.
+
+        :param url: The base URL of the TLNET Supervisor.
+        :param user: The TLNET Supervisor username.
+        :rtype: ``None``
+        """
+        with self._lock:
+            sessions = self._read()
+            if sessions.pop(self._key(url, user), None) is not None:
+                self._write(sessions)
+    def get(self, url: str, user: str) -> Dict[str, str]:
+        """
+        Returns the cookies of the stored session of the provided user on the provided TLNET
+        Supervisor, or ``None`` if there is none (or it is older than ``max_age`` seconds).
+
+        :param url: The base URL of the TLNET Supervisor.
+        :param user: The TLNET Supervisor username.
+        :rtype: ``Dict[str, str]``
+        """
+        with self._lock:
+            entry = self._read().get(self._key(url, user))
+        if not self._is_valid(entry) or time() - entry['saved'] >= self._max_age:
+            return None
+        return entry['cookies']
+    def get_max_age(self) -> float:
+        """
+        Returns the number of seconds after which a stored session is no longer tried.
+
+        :rtype: ``float``
+        """
+        return self._max_age
+    def get_path(self) -> str:
+        """
+        Returns the path of the file holding the sessions.
+
+        :rtype: ``str``
+        """
+        return self._path
+    def set(self, url: str, user: str, cookies: Dict[str, str]) -> None:
+        """
+        Stores the cookies of the session of the provided user on the provided TLNET Supervisor,
+        and resets its age. Expired sessions of other users are dropped. Returns ``None``.
+
+        :param url: The base URL of the TLNET Supervisor.
+        :param user: The TLNET Supervisor username.
+        :param cookies: The cookies of the session, mapped from their names to their values.
+        :rtype: ``None``
+        """
+        now = time()
+        with self._lock:
+            sessions = {i: j for i, j in self._read().items()
+                        if self._is_valid(j) and now - j['saved'] < self._max_age}
+            sessions[self._key(url, user)] = {'cookies': dict(cookies), 'saved': now}
+            self._write(sessions)
+    def set_max_age(self, max_age: float) -> None:
+        """
+        Sets the number of seconds after which a stored session is no longer tried. Returns
+        ``None``.
+
+        :param max_age: The number of seconds.
+        :rtype: ``None``
+        """
+        self._max_age = max_age
+    def _read(self) -> Dict[str, Dict]:
+        """
+        Reads every stored session from the file. A missing or unreadable file holds no sessions.
+        The store lock must be held by the caller. Returns ``Dict[str, Dict]``.
+
+        :rtype: ``Dict[str, Dict]``
+        """
+        try:
+            with open(self._path, "r", encoding="utf-8") as file:
+                sessions = json.load(file)
+        except (OSError, ValueError):
+            return {}
+        return sessions if isinstance(sessions, dict) else {}
+    def _write(self, sessions: Dict[str, Dict]) -> None:
+        """
+        Replaces the file with the provided sessions. The file is written next to its final path
+        and then moved into place, so other processes never read a partly written file. The store
+        lock must be held by the caller. Returns ``None``.
+
+        :param sessions: The sessions, keyed by ``_key()``.
+        :rtype: ``None``
+        """
+        temp_path = self._path + "." + str(os.getpid()) + ".tmp"
+        descriptor = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(descriptor, "w", encoding="utf-8") as file:
+            json.dump(sessions, file)
+        os.replace(temp_path, self._path)
+    @staticmethod
+    def _is_valid(entry: Dict) -> bool:
+        """
+        Checks whether the provided entry of the file is well-formed. Entries written by hand or by
+        an older version are ignored rather than breaking every ``Login`` object using the store.
+        Returns ``bool``.
+
+        :param entry: The entry.
+        :rtype: ``bool``
+        """
+        return (isinstance(entry, dict) and isinstance(entry.get('cookies'), dict) and
+                isinstance(entry.get('saved'), (int, float)))
+    @staticmethod
+    def _key(url: str, user: str) -> str:
+        """
+        Generates the key of the session of the provided user on the provided TLNET Supervisor.
+        Returns ``str``.
+
+        :param url: The base URL of the TLNET Supervisor.
+        :param user: The TLNET Supervisor username.
+        :rtype: ``str``
+        """
+        return user + "@" + url
@@ -50,12 +50,8 @@ class Console:
             "CON_SSH": "0"
         }
 
-        # Uploading console configuration and requesting system config renewal.
-        self._login_object.get_session().post(self._post_url, data=console_data,
-                                              timeout=self._login_object.get_timeout(),
-                                              verify=self._login_object.get_reject_invalid_certs()
-                                              ).raise_for_status()
-        self._login_object.request_system_config_renewal()
+        # Uploading console configuration and updating the cached system config.
+        self._login_object.submit(self._post_url, console_data)
     def disable_telnet(self) -> None:
         """
         Disables Telnet. Returns ``None``.
@@ -67,12 +63,8 @@ class Console:
             "CON_TELNET": "0"
         }
 
-        # Uploading console configuration and requesting system config renewal.
-        self._login_object.get_session().post(self._post_url, data=console_data,
-                                              timeout=self._login_object.get_timeout(),
-                                              verify=self._login_object.get_reject_invalid_certs()
-                                              ).raise_for_status()
-        self._login_object.request_system_config_renewal()
+        # Uploading console configuration and updating the cached system config.
+        self._login_object.submit(self._post_url, console_data)
     def enable_ssh(self) -> None:
         """
         Enables SSH. Returns ``None``.
@@ -84,12 +76,8 @@ class Console:
             "CON_SSH": "1"
         }
 
-        # Uploading console configuration and requesting system config renewal.
-        self._login_object.get_session().post(self._post_url, data=console_data,
-                                              timeout=self._login_object.get_timeout(),
-                                              verify=self._login_object.get_reject_invalid_certs()
-                                              ).raise_for_status()
-        self._login_object.request_system_config_renewal()
+        # Uploading console configuration and updating the cached system config.
+        self._login_object.submit(self._post_url, console_data)
     def enable_telnet(self) -> None:
         """
         Enables Telnet. Returns ``None``.
@@ -101,12 +89,8 @@ class Console:
             "CON_TELNET": "1"
         }
 
-        # Uploading console configuration and requesting system config renewal.
-        self._login_object.get_session().post(self._post_url, data=console_data,
-                                              timeout=self._login_object.get_timeout(),
-                                              verify=self._login_object.get_reject_invalid_certs()
-                                              ).raise_for_status()
-        self._login_object.request_system_config_renewal()
+        # Uploading console configuration and updating the cached system config.
+        self._login_object.submit(self._post_url, console_data)
     def get_ssh_port(self) -> int:
         """
         Returns the port in use for SSH as an integer.
@@ -146,12 +130,8 @@ class Console:
             "CON_PORT_SSH": str(port)
         }
 
-        # Uploading console configuration and requesting system config renewal.
-        self._login_object.get_session().post(self._post_url, data=console_data,
-                                              timeout=self._login_object.get_timeout(),
-                                              verify=self._login_object.get_reject_invalid_certs()
-                                              ).raise_for_status()
-        self._login_object.request_system_config_renewal()
+        # Uploading console configuration and updating the cached system config.
+        self._login_object.submit(self._post_url, console_data, {"SSH Port": str(port)})
     def set_telnet_port(self, port=23) -> None:
         """
         Sets the port for use by Telnet. Returns ``None``.
@@ -165,12 +145,8 @@ class Console:
             "CON_PORT_TELNET": str(port)
         }
 
-        # Uploading console configuration and requesting system config renewal.
-        self._login_object.get_session().post(self._post_url, data=console_data,
-                                              timeout=self._login_object.get_timeout(),
-                                              verify=self._login_object.get_reject_invalid_certs()
-                                              ).raise_for_status()
-        self._login_object.request_system_config_renewal()
+        # Uploading console configuration and updating the cached system config.
+        self._login_object.submit(self._post_url, console_data, {"Telnet Port": str(port)})
     def upload_auth_public_key(self, key: str) -> bool:
         """
         Uploads the provided authentication public key. Returns ``True`` upon successful completion,
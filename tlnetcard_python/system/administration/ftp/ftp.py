@@ -47,12 +47,8 @@ class Ftp:
             "FTP_FTP": "0",
         }
 
-        # Uploading FTP configuration and requesting system config renewal.
-        self._login_object.get_session().post(self._post_url, data=ftp_data,
-                                              timeout=self._login_object.get_timeout(),
-                                              verify=self._login_object.get_reject_invalid_certs()
-                                              ).raise_for_status()
-        self._login_object.request_system_config_renewal()
+        # Uploading FTP configuration and updating the cached system config.
+        self._login_object.submit(self._post_url, ftp_data)
     def enable_ftp(self) -> None:
         """
         Enables FTP. Returns ``None``.
@@ -64,12 +60,8 @@ class Ftp:
             "FTP_FTP": "1",
         }
 
-        # Uploading FTP configuration and requesting system config renewal.
-        self._login_object.get_session().post(self._post_url, data=ftp_data,
-                                              timeout=self._login_object.get_timeout(),
-                                              verify=self._login_object.get_reject_invalid_certs()
-                                              ).raise_for_status()
-        self._login_object.request_system_config_renewal()
+        # Uploading FTP configuration and updating the cached system config.
+        self._login_object.submit(self._post_url, ftp_data)
     def get_ftp_port(self) -> int:
         """
         Returns the port in use for FTP as an integer.
@@ -96,9 +88,5 @@ class Ftp:
             "FTP_PORT_FTP": str(port),
         }
 
-        # Uploading FTP configuration and requesting system config renewal.
-        self._login_object.get_session().post(self._post_url, data=ftp_data,
-                                              timeout=self._login_object.get_timeout(),
-                                              verify=self._login_object.get_reject_invalid_certs()
-                                              ).raise_for_status()
-        self._login_object.request_system_config_renewal()
+        # Uploading FTP configuration and updating the cached system config.
+        self._login_object.submit(self._post_url, ftp_data, {"FTP Port": str(port)})
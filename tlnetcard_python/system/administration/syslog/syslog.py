@@ -7,7 +7,7 @@ This module provides a ``Syslog`` object to provide the functionality of TLNET S
 """
 
 # Standard library.
-from typing import List
+from typing import Dict, List
 # Required internal classes/functions.
 from tlnetcard_python.login import Login
 
@@ -71,12 +71,8 @@ class Syslog:
         for j in range(i + 2, 4):
             syslog_data["SLG_SERVER" + str(j + 1)] = ""
 
-        # Uploading syslog configuration and requesting system config renewal.
-        self._login_object.get_session().post(self._post_url, data=syslog_data,
-                                              timeout=self._login_object.get_timeout(),
-                                              verify=self._login_object.get_reject_invalid_certs()
-                                              ).raise_for_status()
-        self._login_object.request_system_config_renewal()
+        # Uploading syslog configuration and updating the cached system config.
+        self._login_object.submit(self._post_url, syslog_data, self._servers_config(syslog_data))
         return True
     def clear_servers(self) -> None:
         """
@@ -89,12 +85,8 @@ class Syslog:
         for i in range(0, 4):
             syslog_data["SLG_SERVER" + str(i + 1)] = ""
 
-        # Uploading syslog configuration and requesting system config renewal.
-        self._login_object.get_session().post(self._post_url, data=syslog_data,
-                                              timeout=self._login_object.get_timeout(),
-                                              verify=self._login_object.get_reject_invalid_certs()
-                                              ).raise_for_status()
-        self._login_object.request_system_config_renewal()
+        # Uploading syslog configuration and updating the cached system config.
+        self._login_object.submit(self._post_url, syslog_data, self._servers_config(syslog_data))
     def disable_syslog(self) -> None:
         """
         Disables syslog. Returns ``None``.
@@ -106,12 +98,8 @@ class Syslog:
             'SLG_SLG': 0
         }
 
-        # Uploading syslog configuration and requesting system config renewal.
-        self._login_object.get_session().post(self._post_url, data=syslog_data,
-                                              timeout=self._login_object.get_timeout(),
-                                              verify=self._login_object.get_reject_invalid_certs()
-                                              ).raise_for_status()
-        self._login_object.request_system_config_renewal()
+        # Uploading syslog configuration and updating the cached system config.
+        self._login_object.submit(self._post_url, syslog_data)
     def enable_syslog(self) -> None:
         """
         Enables syslog. Returns ``None``.
@@ -123,12 +111,8 @@ class Syslog:
             'SLG_SLG': 1
         }
 
-        # Uploading syslog configuration and requesting system config renewal.
-        self._login_object.get_session().post(self._post_url, data=syslog_data,
-                                              timeout=self._login_object.get_timeout(),
-                                              verify=self._login_object.get_reject_invalid_certs()
-                                              ).raise_for_status()
-        self._login_object.request_system_config_renewal()
+        # Uploading syslog configuration and updating the cached system config.
+        self._login_object.submit(self._post_url, syslog_data)
     def get_servers(self) -> List[str]:
         """
         Returns syslog servers in a list.
@@ -139,9 +123,10 @@ class Syslog:
         system_config = self._login_object.get_system_config()
         items = ["SysLog Server", "SysLog Server2", "SysLog Server3", "SysLog Server4"]
 
+        # Skipping unused server slots, which the configuration holds as empty values.
         servers = []
         for i in items:
-            if i in system_config:
+            if system_config.get(i, "") != "":
                 servers.append(system_config[i])
         return servers
     def remove_server(self, server: str) -> bool:
@@ -170,10 +155,21 @@ class Syslog:
         for j in range(i + 1, 4):
             syslog_data["SLG_SERVER" + str(j + 1)] = ""
 
-        # Uploading syslog configuration and requesting system config renewal.
-        self._login_object.get_session().post(self._post_url, data=syslog_data,
-                                              timeout=self._login_object.get_timeout(),
-                                              verify=self._login_object.get_reject_invalid_certs()
-                                              ).raise_for_status()
-        self._login_object.request_system_config_renewal()
+        # Uploading syslog configuration and updating the cached system config.
+        self._login_object.submit(self._post_url, syslog_data, self._servers_config(syslog_data))
         return True
+    @staticmethod
+    def _servers_config(syslog_data: Dict[str, str]) -> Dict[str, str]:
+        """
+        Translates the server fields of a syslog payload to the names the system configuration
+        uses for them (see ``get_servers()``). Returns ``Dict[str, str]``.
+
+        :param syslog_data: The syslog payload.
+        :rtype: ``Dict[str, str]``
+        """
+        out = {}
+        for i in range(1, 5):
+            if "SLG_SERVER" + str(i) in syslog_data:
+                name = "SysLog Server" + (str(i) if i > 1 else "")
+                out[name] = syslog_data["SLG_SERVER" + str(i)]
+        return out
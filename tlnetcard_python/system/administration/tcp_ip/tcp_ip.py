@@ -49,12 +49,8 @@ class TcpIp:
             "SYS_AUTONEG": "0"
         }
 
-        # Uploading TCP/IP configuration and requesting system config renewal.
-        self._login_object.get_session().post(self._post_url, data=ip_data,
-                                              timeout=self._login_object.get_timeout(),
-                                              verify=self._login_object.get_reject_invalid_certs()
-                                              ).raise_for_status()
-        self._login_object.request_system_config_renewal()
+        # Uploading TCP/IP configuration and updating the cached system config.
+        self._login_object.submit(self._post_url, ip_data)
     def disable_ipv4_dhcp(self) -> None:
         """
         Disables DHCP for IPv4. Returns ``None``.
@@ -66,12 +62,8 @@ class TcpIp:
             "SYS_DHCP": "0"
         }
 
-        # Uploading TCP/IP configuration and requesting system config renewal.
-        self._login_object.get_session().post(self._post_url, data=ip_data,
-                                              timeout=self._login_object.get_timeout(),
-                                              verify=self._login_object.get_reject_invalid_certs()
-                                              ).raise_for_status()
-        self._login_object.request_system_config_renewal()
+        # Uploading TCP/IP configuration and updating the cached system config.
+        self._login_object.submit(self._post_url, ip_data, {"Bootp": "0"})
     def disable_ipv6_dhcp(self) -> None:
         """
         Disables DHCP for IPv6. Returns ``None``.
@@ -82,12 +74,8 @@ class TcpIp:
             "SYS_V6DHCP": "0"
         }
 
-        # Uploading TCP/IP configuration and requesting system config renewal.
-        self._login_object.get_session().post(self._post_url, data=ip_data,
-                                              timeout=self._login_object.get_timeout(),
-                                              verify=self._login_object.get_reject_invalid_certs()
-                                              ).raise_for_status()
-        self._login_object.request_system_config_renewal()
+        # Uploading TCP/IP configuration and updating the cached system config.
+        self._login_object.submit(self._post_url, ip_data, {"V6 DHCP": "0"})
     def enable_autonetogiation(self) -> None:
         """
         Enables link speed negotiation. Returns ``None``.
@@ -99,12 +87,8 @@ class TcpIp:
             "SYS_AUTONEG": "1"
         }
 
-        # Uploading TCP/IP configuration and requesting system config renewal.
-        self._login_object.get_session().post(self._post_url, data=ip_data,
-                                              timeout=self._login_object.get_timeout(),
-                                              verify=self._login_object.get_reject_invalid_certs()
-                                              ).raise_for_status()
-        self._login_object.request_system_config_renewal()
+        # Uploading TCP/IP configuration and updating the cached system config.
+        self._login_object.submit(self._post_url, ip_data)
     def enable_ipv4_dhcp(self) -> None:
         """
         Enables DHCP for IPv4. Returns ``None``.
@@ -116,12 +100,8 @@ class TcpIp:
             "SYS_DHCP": "1"
         }
 
-        # Uploading TCP/IP configuration and requesting system config renewal.
-        self._login_object.get_session().post(self._post_url, data=ip_data,
-                                              timeout=self._login_object.get_timeout(),
-                                              verify=self._login_object.get_reject_invalid_certs()
-                                              ).raise_for_status()
-        self._login_object.request_system_config_renewal()
+        # Uploading TCP/IP configuration and updating the cached system config.
+        self._login_object.submit(self._post_url, ip_data, {"Bootp": "1"})
     def enable_ipv6_dhcp(self) -> None:
         """
         Enables DHCP for IPv6. Returns ``None``.
@@ -132,12 +112,8 @@ class TcpIp:
             "SYS_V6DHCP": "1"
         }
 
-        # Uploading TCP/IP configuration and requesting system config renewal.
-        self._login_object.get_session().post(self._post_url, data=ip_data,
-                                              timeout=self._login_object.get_timeout(),
-                                              verify=self._login_object.get_reject_invalid_certs()
-                                              ).raise_for_status()
-        self._login_object.request_system_config_renewal()
+        # Uploading TCP/IP configuration and updating the cached system config.
+        self._login_object.submit(self._post_url, ip_data, {"V6 DHCP": "1"})
     def get_ipv4_info(self) -> Dict[str, str]:
         """
         Returns info on how IPv4 is configured as a dictionary.
@@ -158,10 +134,10 @@ class TcpIp:
         # GETing system config.
         system_config = self._login_object.get_system_config()
 
-        # Parsing list for required values.
-        for line in system_config:
-            if line in pretty:
-                out[pretty[line]] = str(system_config[line])
+        # Looking up the required values.
+        for key in pretty:
+            if key in system_config:
+                out[pretty[key]] = system_config[key]
         return out
     def get_ipv6_info(self) -> Dict[str, Any]:
         """
@@ -181,10 +157,10 @@ class TcpIp:
         # GETing system config.
         system_config = self._login_object.get_system_config()
 
-        # Parsing list for required values.
-        for line in system_config:
-            if line in pretty:
-                out[pretty[line]] = str(system_config[line])
+        # Looking up the required values.
+        for key in pretty:
+            if key in system_config:
+                out[pretty[key]] = system_config[key]
         out["Prefix Length"] = int(out["IP Address"].split("/")[1])
         out["IP Address"] = out["IP Address"].split("/")[0]
         return out
@@ -205,10 +181,10 @@ class TcpIp:
         # GETing system config.
         system_config = self._login_object.get_system_config()
 
-        # Parsing list for required values.
-        for line in system_config:
-            if line in pretty:
-                out[pretty[line]] = str(system_config[line])
+        # Looking up the required values.
+        for key in pretty:
+            if key in system_config:
+                out[pretty[key]] = system_config[key]
         return out
     # pylint: disable=too-many-arguments
     def set_ipv4_info(self, ip_addr: str, mask: str = "255.255.255.0", gateway: str = "",
@@ -233,12 +209,10 @@ class TcpIp:
             "SYS_DOMAIN": domain
         }
 
-        # Uploading TCP/IP configuration and requesting system config renewal.
-        self._login_object.get_session().post(self._post_url, data=ip_data,
-                                              timeout=self._login_object.get_timeout(),
-                                              verify=self._login_object.get_reject_invalid_certs()
-                                              ).raise_for_status()
-        self._login_object.request_system_config_renewal()
+        # Uploading TCP/IP configuration and updating the cached system config.
+        self._login_object.submit(self._post_url, ip_data, {"Bootp": "0", "IP": ip_addr,
+                                                            "Mask": mask, "Gateway": gateway,
+                                                            "DNS IP": dns_ip, "Domain": domain})
     def set_ipv6_info(self, ip_addr: str, prefix_len: int = 64,
                       gateway: str = "::", dns_ip: str = "::") -> None:
         """
@@ -259,12 +233,10 @@ class TcpIp:
             "SYS_V6DNS": dns_ip,
         }
 
-        # Uploading TCP/IP configuration and requesting system config renewal.
-        self._login_object.get_session().post(self._post_url, data=ip_data,
-                                              timeout=self._login_object.get_timeout(),
-                                              verify=self._login_object.get_reject_invalid_certs()
-                                              ).raise_for_status()
-        self._login_object.request_system_config_renewal()
+        # Uploading TCP/IP configuration and updating the cached system config.
+        self._login_object.submit(self._post_url, ip_data,
+                                  {"V6 DHCP": "0", "V6 IP": ip_addr + "/" + str(prefix_len),
+                                   "V6 Gateway": gateway, "V6 DNS": dns_ip})
     def set_system_info(self, name: str = "TLNET", contact: str = "", location: str = "") -> None:
         """
         Sets info on the system and its location. Returns ``None``.
@@ -281,12 +253,9 @@ class TcpIp:
             "SYS_LOC": location,
         }
 
-        # Uploading TCP/IP configuration and requesting system config renewal.
-        self._login_object.get_session().post(self._post_url, data=ip_data,
-                                              timeout=self._login_object.get_timeout(),
-                                              verify=self._login_object.get_reject_invalid_certs()
-                                              ).raise_for_status()
-        self._login_object.request_system_config_renewal()
+        # Uploading TCP/IP configuration and updating the cached system config.
+        self._login_object.submit(self._post_url, ip_data, {"Name": name, "Contact": contact,
+                                                            "Location": location})
     def use_10m_link_speed(self) -> None:
         """
         Sets the link speed to 10M. Returns ``None``.
@@ -298,12 +267,8 @@ class TcpIp:
             "SYS_SPEED": "0"
         }
 
-        # Uploading TCP/IP configuration and requesting system config renewal.
-        self._login_object.get_session().post(self._post_url, data=ip_data,
-                                              timeout=self._login_object.get_timeout(),
-                                              verify=self._login_object.get_reject_invalid_certs()
-                                              ).raise_for_status()
-        self._login_object.request_system_config_renewal()
+        # Uploading TCP/IP configuration and updating the cached system config.
+        self._login_object.submit(self._post_url, ip_data)
     def use_100m_link_speed(self) -> None:
         """
         Sets the link speed to 100M. Returns ``None``.
@@ -315,12 +280,8 @@ class TcpIp:
             "SYS_SPEED": "1"
         }
 
-        # Uploading TCP/IP configuration and requesting system config renewal.
-        self._login_object.get_session().post(self._post_url, data=ip_data,
-                                              timeout=self._login_object.get_timeout(),
-                                              verify=self._login_object.get_reject_invalid_certs()
-                                              ).raise_for_status()
-        self._login_object.request_system_config_renewal()
+        # Uploading TCP/IP configuration and updating the cached system config.
+        self._login_object.submit(self._post_url, ip_data)
     def use_full_duplex(self) -> None:
         """
         Sets the duplex for the link to full. Returns ``None``.
@@ -332,12 +293,8 @@ class TcpIp:
             "SYS_DUPLEX": "1"
         }
 
-        # Uploading TCP/IP configuration and requesting system config renewal.
-        self._login_object.get_session().post(self._post_url, data=ip_data,
-                                              timeout=self._login_object.get_timeout(),
-                                              verify=self._login_object.get_reject_invalid_certs()
-                                              ).raise_for_status()
-        self._login_object.request_system_config_renewal()
+        # Uploading TCP/IP configuration and updating the cached system config.
+        self._login_object.submit(self._post_url, ip_data)
     def use_half_duplex(self) -> None:
         """
         Sets the duplex for the link to half. Returns ``None``.
@@ -349,9 +306,5 @@ class TcpIp:
             "SYS_DUPLEX": "0"
         }
 
-        # Uploading TCP/IP configuration and requesting system config renewal.
-        self._login_object.get_session().post(self._post_url, data=ip_data,
-                                              timeout=self._login_object.get_timeout(),
-                                              verify=self._login_object.get_reject_invalid_certs()
-                                              ).raise_for_status()
-        self._login_object.request_system_config_renewal()
+        # Uploading TCP/IP configuration and updating the cached system config.
+        self._login_object.submit(self._post_url, ip_data)
@@ -50,12 +50,8 @@ class TimeServer:
             "NTP_DLS_EN": "0"
         }
 
-        # Uploading time server configuration and requesting system config renewal.
-        self._login_object.get_session().post(self._post_url, data=time_server_data,
-                                              timeout=self._login_object.get_timeout(),
-                                              verify=self._login_object.get_reject_invalid_certs()
-                                              ).raise_for_status()
-        self._login_object.request_system_config_renewal()
+        # Uploading time server configuration and updating the cached system config.
+        self._login_object.submit(self._post_url, time_server_data)
     def disable_sntp(self) -> None:
         """
         Disables SNTP. Returns ``None``.
@@ -67,12 +63,8 @@ class TimeServer:
             "NTP_MANU": "1"
         }
 
-        # Uploading time server configuration and requesting system config renewal.
-        self._login_object.get_session().post(self._post_url, data=time_server_data,
-                                              timeout=self._login_object.get_timeout(),
-                                              verify=self._login_object.get_reject_invalid_certs()
-                                              ).raise_for_status()
-        self._login_object.request_system_config_renewal()
+        # Uploading time server configuration and updating the cached system config.
+        self._login_object.submit(self._post_url, time_server_data)
     def enable_daylight_savings(self, start_date: str = "04/01", end_date: str = "11/01") -> None:
         """
         Enables daylight savings from the start date to the end date for SNTP. Returns ``None``.
@@ -89,12 +81,8 @@ class TimeServer:
             "NTP_DLS_EDATE": end_date
         }
 
-        # Uploading time server configuration and requesting system config renewal.
-        self._login_object.get_session().post(self._post_url, data=time_server_data,
-                                              timeout=self._login_object.get_timeout(),
-                                              verify=self._login_object.get_reject_invalid_certs()
-                                              ).raise_for_status()
-        self._login_object.request_system_config_renewal()
+        # Uploading time server configuration and updating the cached system config.
+        self._login_object.submit(self._post_url, time_server_data)
     def enable_sntp(self) -> None:
         """
         Enables SNTP. Returns ``None``.
@@ -106,12 +94,8 @@ class TimeServer:
             "NTP_MANU": "0"
         }
 
-        # Uploading time server configuration and requesting system config renewal.
-        self._login_object.get_session().post(self._post_url, data=time_server_data,
-                                              timeout=self._login_object.get_timeout(),
-                                              verify=self._login_object.get_reject_invalid_certs()
-                                              ).raise_for_status()
-        self._login_object.request_system_config_renewal()
+        # Uploading time server configuration and updating the cached system config.
+        self._login_object.submit(self._post_url, time_server_data)
     def get_primary_server(self) -> str:
         """
         Returns the primary time server for SNTP as a string.
@@ -154,12 +138,8 @@ class TimeServer:
             "NTP_SYSTIME": time
         }
 
-        # Uploading time server configuration and requesting system config renewal.
-        self._login_object.get_session().post(self._post_url, data=time_server_data,
-                                              timeout=self._login_object.get_timeout(),
-                                              verify=self._login_object.get_reject_invalid_certs()
-                                              ).raise_for_status()
-        self._login_object.request_system_config_renewal()
+        # Uploading time server configuration and updating the cached system config.
+        self._login_object.submit(self._post_url, time_server_data)
     def set_primary_server(self, server: str) -> None:
         """
         Sets the primary time server for SNTP. Returns ``None``.
@@ -173,12 +153,8 @@ class TimeServer:
             "NTP_IP1": server
         }
 
-        # Uploading time server configuration and requesting system config renewal.
-        self._login_object.get_session().post(self._post_url, data=time_server_data,
-                                              timeout=self._login_object.get_timeout(),
-                                              verify=self._login_object.get_reject_invalid_certs()
-                                              ).raise_for_status()
-        self._login_object.request_system_config_renewal()
+        # Uploading time server configuration and updating the cached system config.
+        self._login_object.submit(self._post_url, time_server_data, {"Server1": server})
     def set_secondary_server(self, server: str) -> None:
         """
         Sets the secondary time server for SNTP. Returns ``None``
@@ -192,12 +168,8 @@ class TimeServer:
             "NTP_IP2": server
         }
 
-        # Uploading time server configuration and requesting system config renewal.
-        self._login_object.get_session().post(self._post_url, data=time_server_data,
-                                              timeout=self._login_object.get_timeout(),
-                                              verify=self._login_object.get_reject_invalid_certs()
-                                              ).raise_for_status()
-        self._login_object.request_system_config_renewal()
+        # Uploading time server configuration and updating the cached system config.
+        self._login_object.submit(self._post_url, time_server_data, {"Server2": server})
     def set_time_zone(self, offset: str = "GMT") -> bool:
         """
         Sets the time zone for SNTP. Returns ``False`` if an invalid offset values is provided.
@@ -224,12 +196,8 @@ class TimeServer:
             "NTP_ZONE": str(offset)
         }
 
-        # Uploading time server configuration and requesting system config renewal.
-        self._login_object.get_session().post(self._post_url, data=time_server_data,
-                                              timeout=self._login_object.get_timeout(),
-                                              verify=self._login_object.get_reject_invalid_certs()
-                                              ).raise_for_status()
-        self._login_object.request_system_config_renewal()
+        # Uploading time server configuration and updating the cached system config.
+        self._login_object.submit(self._post_url, time_server_data)
         return True
     def use_local_time(self) -> None:
         """
@@ -243,9 +211,5 @@ class TimeServer:
             "NTP_USE_PCTIME": "1"
         }
 
-        # Uploading time server configuration and requesting system config renewal.
-        self._login_object.get_session().post(self._post_url, data=time_server_data,
-                                              timeout=self._login_object.get_timeout(),
-                                              verify=self._login_object.get_reject_invalid_certs()
-                                              ).raise_for_status()
-        self._login_object.request_system_config_renewal()
+        # Uploading time server configuration and updating the cached system config.
+        self._login_object.submit(self._post_url, time_server_data)
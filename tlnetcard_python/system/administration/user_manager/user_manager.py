@@ -8,14 +8,15 @@ System -> Administration -> User Manager.
 
 # Standard library.
 from os import remove
-from time import sleep
 from typing import Any, Dict
 # Related third-party library.
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions
+from selenium.webdriver.support.ui import WebDriverWait
 # Required internal classes/functions.
 from tlnetcard_python.login import Login
 from tlnetcard_python.system.administration.batch_configuration import BatchConfiguration
+from tlnetcard_python.webdriver_pool import WEBDRIVER_POOL
 
 class UserManager:
     """
@@ -59,12 +60,8 @@ class UserManager:
             "radius": "0"
         }
 
-        # Uploading console configuration and requesting system config renewal.
-        self._login_object.get_session().post(self._post_url, data=user_data,
-                                              timeout=self._login_object.get_timeout(),
-                                              verify=self._login_object.get_reject_invalid_certs()
-                                              ).raise_for_status()
-        self._login_object.request_system_config_renewal()
+        # Uploading console configuration and updating the cached system config.
+        self._login_object.submit(self._post_url, user_data)
     def enable_radius(self) -> None:
         """
         Enables RADIUS authentication. Returns ``None``.
@@ -76,12 +73,8 @@ class UserManager:
             "radius": "1"
         }
 
-        # Uploading console configuration and requesting system config renewal.
-        self._login_object.get_session().post(self._post_url, data=user_data,
-                                              timeout=self._login_object.get_timeout(),
-                                              verify=self._login_object.get_reject_invalid_certs()
-                                              ).raise_for_status()
-        self._login_object.request_system_config_renewal()
+        # Uploading console configuration and updating the cached system config.
+        self._login_object.submit(self._post_url, user_data)
     def get_permissions(self, user: str = "Administrator") -> Dict[str, bool]:
         """
         Returns the permissions for the provided user as a dictionary.
@@ -108,10 +101,9 @@ class UserManager:
         # GETing system config.
         system_config = self._login_object.get_system_config()
 
-        # Parsing list for permissions code.
-        if user in system_config:
-            permission_code = system_config[user]
-        else:
+        # Looking up the permissions code (held as an integer by the parsed config).
+        permission_code = system_config.get_value(pretty[user])
+        if not isinstance(permission_code, int):
             return {}
 
         # Converting permissions code to binary string.
@@ -171,11 +163,12 @@ class UserManager:
         # GETing system config.
         system_config = self._login_object.get_system_config()
 
-        # Parsing list for required values.
+        # Looking up the required values.
         for i in pretty:
             if i in system_config:
                 out[pretty[i]] = system_config[i]
-        out[user + ' Limit'] = bool(out[user + ' Limit'])
+        if 'WAN Access' in out:
+            out['WAN Access'] = bool(system_config.get_value(user + ' Limit'))
         return out
     # pylint: disable=too-many-arguments,too-many-locals
     def set_permissions(self, user: str = "Administrator", login_user: bool = False,
@@ -229,17 +222,17 @@ class UserManager:
         if user not in pretty:
             return False
 
-        if not selenium:
-            # Generating binary permissions string.
-            permission_code_bin = ""
-            for i in permissions:
-                permission_code_bin += str(int(permissions[i]))
+        # Generating binary permissions string.
+        permission_code_bin = ""
+        for i in permissions:
+            permission_code_bin += str(int(permissions[i]))
 
-            # Reversing string.
-            permission_code_bin = permission_code_bin[::-1]
-            # Converting binary string to integer.
-            permission_code = int(permission_code_bin, 2)
+        # Reversing string.
+        permission_code_bin = permission_code_bin[::-1]
+        # Converting binary string to integer.
+        permission_code = int(permission_code_bin, 2)
 
+        if not selenium:
             # GETing system configuration and writing lines to list.
             self._batch_object.download_system_configuration("system_config_temp.ini")
             with open("system_config_temp.ini", "r") as sys_config_file:
@@ -263,39 +256,43 @@ class UserManager:
 
             # Cleaning up.
             remove("system_config_temp.ini")
+
+            # Requesting system config renewal (the whole file was replaced).
+            self._login_object.request_system_config_renewal()
         else:
-            # Configuring Selenium to run headless (i.e. without a GUI).
-            browser_options = Options()
-            browser_options.add_argument("--headless")
-            browser = webdriver.Chrome(options=browser_options)
-            # Getting webpage.
-            browser.get(self._get_url)
-            # Adding cookies from requests session.
-            requests_cookies = self._login_object.get_session().cookies.get_dict()
-            for cookie in requests_cookies:
-                browser.add_cookie({'name': cookie,
-                                    'domain': self._login_object.get_host(),
-                                    'value': requests_cookies[cookie]})
-            # Getting webpage now that cookies are installed.
-            browser.get(self._get_url)
-            # A very brief sleeping period to let elements load.
-            sleep(0.5)
-
-            # Clicking boxes.
-            for i in permissions:
-                if (permissions[i] and
-                        not browser.find_element_by_id(str(i + pretty[user][1])).is_selected()):
-                    browser.find_element_by_id(str(i + pretty[user][1])).click()
-                elif (not permissions[i] and
-                      browser.find_element_by_id(str(i + pretty[user][1])).is_selected()):
-                    browser.find_element_by_id(str(i + pretty[user][1])).click()
-
-            # Clicking submit and closing browser.
-            browser.find_element_by_id("@adm_console#11").click()
-            browser.close()
-
-        # Requesting system config renewal.
-        self._login_object.request_system_config_renewal()
+            # Taking a long-lived headless browser (with the session's cookies installed) from the
+            # pool.
+            with WEBDRIVER_POOL.browser(self._login_object.get_host(),
+                                        self._login_object.get_session(),
+                                        self._get_url) as browser:
+                # Getting webpage.
+                browser.get(self._get_url)
+                # Waiting for the last checkbox to load (returning as soon as it has).
+                WebDriverWait(browser, self._login_object.get_timeout()).until(
+                    expected_conditions.presence_of_element_located(
+                        (By.ID, str(len(permissions) - 1 + pretty[user][1]))
+                    )
+                )
+
+                # Clicking boxes.
+                for i in permissions:
+                    if (permissions[i] and
+                            not browser.find_element_by_id(str(i + pretty[user][1])).is_selected()):
+                        browser.find_element_by_id(str(i + pretty[user][1])).click()
+                    elif (not permissions[i] and
+                          browser.find_element_by_id(str(i + pretty[user][1])).is_selected()):
+                        browser.find_element_by_id(str(i + pretty[user][1])).click()
+
+                # Clicking submit, and waiting for the submission to finish before the browser is
+                # given back to the pool (rather than closed).
+                submit = browser.find_element_by_id("@adm_console#11")
+                submit.click()
+                WebDriverWait(browser, self._login_object.get_timeout()).until(
+                    expected_conditions.staleness_of(submit)
+                )
+
+            # Updating system config (with the key get_permissions() reads).
+            self._login_object.update_system_config({pretty[user][0]: str(permission_code)})
         return True
     def set_server_info(self, server: str, secret: str, port: int = 1812) -> None:
         """
@@ -314,12 +311,10 @@ class UserManager:
             "USR_RADPRT": str(port)
         }
 
-        # Uploading console configuration and requesting system config renewal.
-        self._login_object.get_session().post(self._post_url, data=user_data,
-                                              timeout=self._login_object.get_timeout(),
-                                              verify=self._login_object.get_reject_invalid_certs()
-                                              ).raise_for_status()
-        self._login_object.request_system_config_renewal()
+        # Uploading console configuration and updating the cached system config.
+        self._login_object.submit(self._post_url, user_data, {"RADIUS Server": server,
+                                                              "RADIUS Secret": secret,
+                                                              "RADIUS Port": str(port)})
     def set_user(self, username: str, passwd: str, wan_access: bool = False,
                  user: str = "Administrator") -> bool:
         """
@@ -349,10 +344,11 @@ class UserManager:
             "limit" + num: str(int(wan_access))
         }
 
-        # Uploading console configuration and requesting system config renewal.
-        self._login_object.get_session().post(self._post_url, data=user_data,
-                                              timeout=self._login_object.get_timeout(),
-                                              verify=self._login_object.get_reject_invalid_certs()
-                                              ).raise_for_status()
-        self._login_object.request_system_config_renewal()
+        # The configuration names the read only user "Read Only" (see get_user()).
+        name = "Read Only" if user == "Read Only User" else user
+        changes = {name + " Account": username, name + " Password": passwd,
+                   name + " Limit": str(int(wan_access))}
+
+        # Uploading console configuration and updating the cached system config.
+        self._login_object.submit(self._post_url, user_data, changes)
         return True
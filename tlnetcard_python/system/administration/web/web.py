@@ -50,12 +50,8 @@ class Web:
             "WEB_HTTP": "0"
         }
 
-        # Uploading web configuration and requesting system config renewal.
-        self._login_object.get_session().post(self._post_url, data=web_data,
-                                              timeout=self._login_object.get_timeout(),
-                                              verify=self._login_object.get_reject_invalid_certs()
-                                              ).raise_for_status()
-        self._login_object.request_system_config_renewal()
+        # Uploading web configuration and updating the cached system config.
+        self._login_object.submit(self._post_url, web_data)
     def disable_https(self) -> None:
         """
         Disables HTTPS access. Returns ``None``.
@@ -67,12 +63,8 @@ class Web:
             "WEB_HTTPS": "0"
         }
 
-        # Uploading web configuration and requesting system config renewal.
-        self._login_object.get_session().post(self._post_url, data=web_data,
-                                              timeout=self._login_object.get_timeout(),
-                                              verify=self._login_object.get_reject_invalid_certs()
-                                              ).raise_for_status()
-        self._login_object.request_system_config_renewal()
+        # Uploading web configuration and updating the cached system config.
+        self._login_object.submit(self._post_url, web_data)
     def enable_http(self) -> None:
         """
         Enables HTTP access. Returns ``None``.
@@ -84,12 +76,8 @@ class Web:
             "WEB_HTTP": "1"
         }
 
-        # Uploading web configuration and requesting system config renewal.
-        self._login_object.get_session().post(self._post_url, data=web_data,
-                                              timeout=self._login_object.get_timeout(),
-                                              verify=self._login_object.get_reject_invalid_certs()
-                                              ).raise_for_status()
-        self._login_object.request_system_config_renewal()
+        # Uploading web configuration and updating the cached system config.
+        self._login_object.submit(self._post_url, web_data)
     def enable_https(self) -> None:
         """
         Enables HTTPS access. Returns ``None``.
@@ -101,12 +89,8 @@ class Web:
             "WEB_HTTPS": "1"
         }
 
-        # Uploading web configuration and requesting system config renewal.
-        self._login_object.get_session().post(self._post_url, data=web_data,
-                                              timeout=self._login_object.get_timeout(),
-                                              verify=self._login_object.get_reject_invalid_certs()
-                                              ).raise_for_status()
-        self._login_object.request_system_config_renewal()
+        # Uploading web configuration and updating the cached system config.
+        self._login_object.submit(self._post_url, web_data)
     def get_http_port(self) -> int:
         """
         Returns the port in use for HTTP as an integer.
@@ -159,12 +143,8 @@ class Web:
             "WEB_PORT_HTTP": str(port)
         }
 
-        # Uploading web configuration and requesting system config renewal.
-        self._login_object.get_session().post(self._post_url, data=web_data,
-                                              timeout=self._login_object.get_timeout(),
-                                              verify=self._login_object.get_reject_invalid_certs()
-                                              ).raise_for_status()
-        self._login_object.request_system_config_renewal()
+        # Uploading web configuration and updating the cached system config.
+        self._login_object.submit(self._post_url, web_data, {"HTTP Port": str(port)})
     def set_https_port(self, port: int = 443) -> None:
         """
         Sets the port for use by HTTPS. Returns ``None``.
@@ -178,12 +158,8 @@ class Web:
             "WEB_PORT_HTTPS": str(port)
         }
 
-        # Uploading web configuration and requesting system config renewal.
-        self._login_object.get_session().post(self._post_url, data=web_data,
-                                              timeout=self._login_object.get_timeout(),
-                                              verify=self._login_object.get_reject_invalid_certs()
-                                              ).raise_for_status()
-        self._login_object.request_system_config_renewal()
+        # Uploading web configuration and updating the cached system config.
+        self._login_object.submit(self._post_url, web_data, {"HTTPS Port": str(port)})
     def set_web_refresh(self, seconds: int = 10) -> None:
         """
         Sets the web refresh time to the provided number of seconds. Returns ``None``.
@@ -196,12 +172,8 @@ class Web:
             "WEB_REFRESH": str(seconds)
         }
 
-        # Uploading web configuration and requesting system config renewal.
-        self._login_object.get_session().post(self._post_url, data=web_data,
-                                              timeout=self._login_object.get_timeout(),
-                                              verify=self._login_object.get_reject_invalid_certs()
-                                              ).raise_for_status()
-        self._login_object.request_system_config_renewal()
+        # Uploading web configuration and updating the cached system config.
+        self._login_object.submit(self._post_url, web_data, {"Web Refresh": str(seconds)})
     def upload_ssl_cert(self, path: str) -> bool:
         """
         Uploads the provided SSL certificate. Returns ``False`` if the provided key does not exist.
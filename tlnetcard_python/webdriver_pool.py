@@ -0,0 +1,292 @@
+"""
+tlnetcard_python.webdriver_pool
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Provides the ``WebDriverPool`` object, which keeps long-lived headless Chrome WebDrivers so that the
+functions which still need a browser do not pay for a cold start of Chrome on every call, and the
+module-wide ``WEBDRIVER_POOL`` object shared by every such function.
+"""
+
+# Standard library.
+import atexit
+from contextlib import contextmanager
+from threading import Lock, Timer
+from time import monotonic
+from typing import Dict, Hashable, Iterator, List
+from urllib.parse import urljoin
+# Related third-party library.
+from requests import Session
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.remote.webdriver import WebDriver
+
+# pylint: disable=too-few-public-methods
+class _PooledDriver:
+    """
+    A single entry of a ``WebDriverPool``. Holds a WebDriver, the key it was created for and the
+    number of times it has been used.
+    """
+    def __init__(self, driver: WebDriver, key: Hashable) -> None:
+        """
+        Initializes the ``_PooledDriver`` object. Returns ``None``.
+
+        :param driver: The WebDriver.
+        :param key: The key (host and cookies) the WebDriver was created for.
+        :rtype: ``None``
+        """
+        self.driver = driver
+        self.key = key
+        self.uses = 0
+        self.last_used = monotonic()
+
+class WebDriverPool:
+    """
+    A pool of long-lived headless Chrome WebDrivers keyed by host and cookie jar, so that a
+    WebDriver is only ever reused for the same card and login session. Every WebDriver is
+    health-checked before it is handed out, replaced after ``max_uses`` uses, and shut down once it
+    has been idle for ``idle_timeout`` seconds (or when the interpreter exits). This object is
+    thread-safe, and a WebDriver is only ever used by one caller at a time.
+
+    Basic Usage:
+
+    >>> from tlnetcard_python import Login
+    >>> from tlnetcard_python.webdriver_pool import WEBDRIVER_POOL
+    >>> card = Login(user="admin", passwd="password", host="10.0.0.100")
+    >>> url = card.get_base_url() + "/en/ups/info_battery.asp"
+    >>> with WEBDRIVER_POOL.browser(card.get_host(), card.get_session(), url) as browser:
+    >>>     browser.get(url)
+    >>>     print(browser.find_element_by_id("UPS_BATTLAST").text)
+    05/01/2020
+    """
+    def __init__(self, max_uses: int = 50, idle_timeout: float = 300.0, max_idle: int = 4) -> None:
+        """
+        Initializes the ``WebDriverPool`` object. Returns ``None``.
+
+        :param max_uses: (optional) The number of times a WebDriver is used before it is replaced.
+        :param idle_timeout: (optional) The number of seconds a WebDriver may go unused before it is
+        shut down.
+        :param max_idle: (optional) The maximum number of idle WebDrivers kept in the pool. The
+        least recently used WebDriver is shut down once there are more.
+        :rtype: ``None``
+        """
+        self._max_uses = max_uses
+        self._idle_timeout = idle_timeout
+        self._max_idle = max_idle
+        self._lock = Lock()
+        self._idle = []
+        self._in_use = {}
+        self._timer = None
+    def acquire(self, host: str, session: Session = None, url: str = None) -> WebDriver:
+        """
+        Takes a WebDriver for the provided host and cookie jar out of the pool, starting a new one
+        if there is no healthy idle WebDriver. New WebDrivers get the cookies of the session
+        installed before their first navigation, and WebDrivers taken from the pool still have
+        them, so the caller only ever has to load its webpage once. Every WebDriver taken must be
+        given back with ``release()``. Returns ``WebDriver``.
+
+        :param host: The IP address/DNS name of the web server.
+        :param session: (optional) A ``requests.Session`` object from which cookies will be
+        transferred.
+        :param url: (optional) A URL of the web server, which the cookies are set for.
+        :rtype: ``WebDriver``
+        """
+        cookies = {} if session is None else session.cookies.get_dict()
+        key = (host, tuple(sorted(cookies.items())))
+        while True:
+            entry = self._take_idle(key)
+            if entry is None:
+                break
+            if self._is_healthy(entry.driver):
+                with self._lock:
+                    self._in_use[id(entry.driver)] = entry
+                return entry.driver
+            self._quit([entry])
+
+        # Starting a new WebDriver outside of the lock, as Chrome takes seconds to start.
+        browser_options = Options()
+        browser_options.add_argument("--headless")
+        driver = webdriver.Chrome(options=browser_options)
+        try:
+            if cookies:
+                self._install_cookies(driver, host, cookies, url)
+        except Exception:
+            driver.quit()
+            raise
+        with self._lock:
+            self._in_use[id(driver)] = _PooledDriver(driver, key)
+        return driver
+    @contextmanager
+    def browser(self, host: str, session: Session = None, url: str = None) -> Iterator[WebDriver]:
+        """
+        Context manager which takes a WebDriver out of the pool (see ``acquire()``) and gives it
+        back when the block exits. A WebDriver is shut down rather than given back if the block
+        raises an exception. Returns ``Iterator[WebDriver]``.
+
+        :param host: The IP address/DNS name of the web server.
+        :param session: (optional) A ``requests.Session`` object from which cookies will be
+        transferred.
+        :param url: (optional) A URL of the web server, which the cookies are set for.
+        :rtype: ``Iterator[WebDriver]``
+        """
+        driver = self.acquire(host, session, url)
+        try:
+            yield driver
+        except BaseException:
+            self.release(driver, healthy=False)
+            raise
+        self.release(driver)
+    def close(self, host: str = None) -> None:
+        """
+        Shuts down every idle WebDriver for the provided host. If no host is provided, every idle
+        WebDriver is shut down. WebDrivers in use are shut down when they are given back. Returns
+        ``None``.
+
+        :param host: (optional) The IP address/DNS name of the web server.
+        :rtype: ``None``
+        """
+        with self._lock:
+            closing = [i for i in self._idle if host is None or i.key[0] == host]
+            self._idle = [i for i in self._idle if i not in closing]
+            # Making sure WebDrivers currently in use are not kept either.
+            for entry in self._in_use.values():
+                if host is None or entry.key[0] == host:
+                    entry.uses = self._max_uses
+        self._quit(closing)
+    def release(self, driver: WebDriver, healthy: bool = True) -> None:
+        """
+        Gives a WebDriver taken with ``acquire()`` back to the pool. The WebDriver is shut down
+        instead if it is unhealthy or has reached ``max_uses`` uses. Returns ``None``.
+
+        :param driver: The WebDriver.
+        :param healthy: (optional) Whether the WebDriver can be reused. Set this to ``False`` if
+        using it raised an exception.
+        :rtype: ``None``
+        """
+        closing = []
+        with self._lock:
+            entry = self._in_use.pop(id(driver), None)
+            if entry is None:
+                closing.append(_PooledDriver(driver, None))
+            else:
+                entry.uses += 1
+                entry.last_used = monotonic()
+                if not healthy or entry.uses >= self._max_uses:
+                    closing.append(entry)
+                else:
+                    self._idle.append(entry)
+                    # Shutting down the least recently used WebDrivers if too many are idle.
+                    while len(self._idle) > self._max_idle:
+                        closing.append(self._idle.pop(0))
+                    self._schedule_reaper()
+        self._quit(closing)
+    def set_max_idle(self, max_idle: int) -> None:
+        """
+        Sets the maximum number of idle WebDrivers kept in the pool. Extra idle WebDrivers are shut
+        down the next time a WebDriver is given back. Returns ``None``.
+
+        :param max_idle: The maximum number of idle WebDrivers.
+        :rtype: ``None``
+        """
+        self._max_idle = max_idle
+    def _reap(self) -> None:
+        """
+        Shuts down every WebDriver which has been idle for longer than ``idle_timeout`` seconds,
+        and schedules the next check if any WebDrivers are left. Returns ``None``.
+
+        :rtype: ``None``
+        """
+        now = monotonic()
+        with self._lock:
+            self._timer = None
+            closing = [i for i in self._idle if now - i.last_used > self._idle_timeout]
+            self._idle = [i for i in self._idle if i not in closing]
+            if self._idle:
+                self._schedule_reaper()
+        self._quit(closing)
+    def _schedule_reaper(self) -> None:
+        """
+        Starts the timer which shuts down idle WebDrivers, unless it is already running. The pool
+        lock must be held by the caller. Returns ``None``.
+
+        :rtype: ``None``
+        """
+        if self._timer is None:
+            self._timer = Timer(self._idle_timeout, self._reap)
+            self._timer.daemon = True
+            self._timer.start()
+    def _take_idle(self, key: Hashable) -> _PooledDriver:
+        """
+        Removes the most recently used idle WebDriver for the provided key from the pool. Returns
+        ``_PooledDriver``, or ``None`` if there is no such WebDriver.
+
+        :param key: The key (host and cookies) to look for.
+        :rtype: ``_PooledDriver``
+        """
+        with self._lock:
+            for i in range(len(self._idle) - 1, -1, -1):
+                if self._idle[i].key == key:
+                    return self._idle.pop(i)
+        return None
+    @staticmethod
+    def _install_cookies(driver: WebDriver, host: str, cookies: Dict[str, str], url: str) -> None:
+        """
+        Installs the provided cookies in a new WebDriver without loading a webpage of the web
+        server, using the DevTools protocol. If the WebDriver does not support it, a tiny static
+        resource (``/favicon.ico``) is loaded instead, as WebDriver can only add cookies for the
+        domain currently loaded. Returns ``None``.
+
+        :param driver: The WebDriver.
+        :param host: The IP address/DNS name of the web server.
+        :param cookies: The cookies, mapped from their names to their values.
+        :param url: A URL of the web server. When ``None``, the root of the host (over HTTPS, as
+        used by ``Login`` by default) is used.
+        :rtype: ``None``
+        """
+        if url is None:
+            url = "https://" + host + "/"
+        try:
+            for cookie in cookies:
+                driver.execute_cdp_cmd('Network.setCookie', {'name': cookie,
+                                                             'value': cookies[cookie],
+                                                             'url': urljoin(url, '/')})
+            return
+        except (AttributeError, WebDriverException):
+            pass
+        driver.get(urljoin(url, '/favicon.ico'))
+        for cookie in cookies:
+            driver.add_cookie({'name': cookie,
+                               'domain': host,
+                               'value': cookies[cookie]})
+    @staticmethod
+    def _is_healthy(driver: WebDriver) -> bool:
+        """
+        Checks whether the provided WebDriver (and its browser) still responds. Returns ``bool``.
+
+        :param driver: The WebDriver.
+        :rtype: ``bool``
+        """
+        try:
+            # Any command which needs the browser will do; the window handle is the cheapest.
+            return driver.current_window_handle is not None
+        except WebDriverException:
+            return False
+    @staticmethod
+    def _quit(entries: List[_PooledDriver]) -> None:
+        """
+        Shuts down the WebDrivers of the provided entries, ignoring WebDrivers which are already
+        gone. Returns ``None``.
+
+        :param entries: The entries to shut down.
+        :rtype: ``None``
+        """
+        for entry in entries:
+            try:
+                entry.driver.quit()
+            except WebDriverException:
+                pass
+
+# Process-wide WebDriver pool shared by scrape_with_selenium() and UserManager.
+WEBDRIVER_POOL = WebDriverPool()
+# Making sure no Chrome processes are left behind once the interpreter exits.
+atexit.register(WEBDRIVER_POOL.close)